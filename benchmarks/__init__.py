@@ -0,0 +1,5 @@
+"""
+Benchmarks of object construction, serialization and deduplication.
+
+Run them from the top source directory with ``python -m benchmarks``; see ``python -m benchmarks --help`` for selecting benchmarks and sizes.
+"""
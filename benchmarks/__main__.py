@@ -0,0 +1,39 @@
+import argparse
+
+from .common import HEADER, format_result, import_benchmarks, run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Report operations per second and peak traced memory of case_mapping workloads.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="Run only the benchmarks whose names contain one of these strings.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(float(size)) for size in value.split(",")],
+        help="Comma-separated workload sizes, e.g. 1e4,1e5,1e6.  Defaults to each benchmark's own sizes.",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the second, traced run measuring peak memory.",
+    )
+    args = parser.parse_args()
+
+    import_benchmarks()
+    print(HEADER)
+    run(
+        args.names,
+        args.sizes,
+        memory=not args.no_memory,
+        report=lambda result: print(format_result(result), flush=True),
+    )
+
+
+if __name__ == "__main__":
+    main()
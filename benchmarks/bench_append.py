@@ -0,0 +1,59 @@
+from typing import Any, Callable
+
+from case_mapping import uco
+
+from .common import benchmark
+
+
+def _observables(n: int) -> list[uco.observable.ObservableObject]:
+    return [uco.observable.ObservableObject() for _ in range(n)]
+
+
+@benchmark("append Bundle.append_to_uco_object, one at a time")
+def append_one_at_a_time(n: int) -> Callable[[], Any]:
+    observables = _observables(n)
+
+    def operation() -> Any:
+        bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+        for observable in observables:
+            bundle.append_to_uco_object(observable)
+        return bundle
+
+    return operation
+
+
+@benchmark("append Bundle.extend_uco_objects")
+def extend(n: int) -> Callable[[], Any]:
+    observables = _observables(n)
+
+    def operation() -> Any:
+        bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+        bundle.extend_uco_objects(iter(observables))
+        return bundle
+
+    return operation
+
+
+@benchmark("append Action.append_results, one at a time")
+def append_results(n: int) -> Callable[[], Any]:
+    observables = _observables(n)
+
+    def operation() -> Any:
+        action = uco.action.Action()
+        for observable in observables:
+            action.append_results(observable)
+        return action
+
+    return operation
+
+
+@benchmark("append Action.extend_results")
+def extend_results(n: int) -> Callable[[], Any]:
+    observables = _observables(n)
+
+    def operation() -> Any:
+        action = uco.action.Action()
+        action.extend_results(observables)
+        return action
+
+    return operation
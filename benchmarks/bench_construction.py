@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List
+
+from case_mapping import base, case, uco
+
+from .common import Workload, benchmark, registry
+
+_start_time = datetime(2023, 1, 1, 1, 1, 1, 1, timezone.utc)
+
+
+def _times(n: int) -> List[datetime]:
+    return [_start_time + timedelta(seconds=index) for index in range(n)]
+
+
+@benchmark("construct FileFacet")
+def file_facets(n: int) -> Callable[[], Any]:
+    names = ["IMG_%07d.jpg" % index for index in range(n)]
+    times = _times(n)
+
+    def operation() -> Any:
+        return [
+            uco.observable.FileFacet(
+                file_name=names[index],
+                file_path="/sdcard/DCIM/" + names[index],
+                file_extension="jpg",
+                file_size_bytes=index,
+                file_modified_time=times[index],
+                file_is_directory=False,
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+@benchmark("construct FileFacet, repeated values")
+def file_facets_repeated(n: int) -> Callable[[], Any]:
+    """
+    FileFacets whose sizes and times are drawn from a thousand values each, as in a file system with many small files, copied at the same times.
+    """
+    names = ["IMG_%07d.jpg" % index for index in range(n)]
+    times = _times(1000)
+
+    def operation() -> Any:
+        return [
+            uco.observable.FileFacet(
+                file_name=names[index],
+                file_extension="jpg",
+                file_size_bytes=index % 1000,
+                file_modified_time=times[index % 1000],
+                file_is_directory=False,
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+@benchmark("construct FileFacet.from_columns")
+def file_facet_columns(n: int) -> Callable[[], Any]:
+    names = ["IMG_%07d.jpg" % index for index in range(n)]
+    paths = ["/sdcard/DCIM/" + name for name in names]
+    sizes = list(range(n))
+    times = _times(n)
+
+    def operation() -> Any:
+        return uco.observable.FileFacet.from_columns(
+            file_name=names,
+            file_path=paths,
+            file_extension="jpg",
+            file_size_bytes=sizes,
+            file_modified_time=times,
+            file_is_directory=False,
+        )
+
+    return operation
+
+
+@benchmark("construct ObservableObject+FileFacet")
+def file_objects(n: int) -> Callable[[], Any]:
+    names = ["IMG_%07d.jpg" % index for index in range(n)]
+
+    def operation() -> Any:
+        objects = list()
+        for index in range(n):
+            file_object = uco.observable.ObservableObject()
+            file_object.append_facets(
+                uco.observable.FileFacet(file_name=names[index], file_size_bytes=index)
+            )
+            objects.append(file_object)
+        return objects
+
+    return operation
+
+
+@benchmark("construct SMSMessageFacet")
+def sms_facets(n: int) -> Callable[[], Any]:
+    phone_1 = uco.observable.ObservableObject()
+    phone_2 = uco.observable.ObservableObject()
+    application = uco.observable.ObservableObject()
+    times = _times(n)
+
+    def operation() -> Any:
+        return [
+            uco.observable.SMSMessageFacet(
+                msg_to=[phone_2],
+                msg_from=phone_1,
+                message_text="Message %d" % index,
+                sent_time=times[index],
+                application=application,
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+@benchmark("construct CallFacet")
+def call_facets(n: int) -> Callable[[], Any]:
+    phone_1 = uco.observable.ObservableObject()
+    phone_2 = uco.observable.ObservableObject()
+    times = _times(n)
+
+    def operation() -> Any:
+        return [
+            uco.observable.CallFacet(
+                call_type="incoming",
+                call_duration=index % 3600,
+                start_time=times[index],
+                call_from=phone_1,
+                call_to=[phone_2],
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+@benchmark("construct LatLongCoordinatesFacet")
+def coordinates_facets(n: int) -> Callable[[], Any]:
+    def operation() -> Any:
+        return [
+            uco.location.LatLongCoordinatesFacet(
+                latitude=56.0 + index / n, longitude=-71.0 - index / n
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+@benchmark("construct InvestigativeAction")
+def investigative_actions(n: int) -> Callable[[], Any]:
+    performer = uco.identity.Identity()
+    device = uco.observable.ObservableObject()
+    times = _times(n)
+
+    def operation() -> Any:
+        return [
+            case.investigation.InvestigativeAction(
+                name="acquisition",
+                start_time=times[index],
+                end_time=times[index],
+                performer=performer,
+                objects=[device],
+            )
+            for index in range(n)
+        ]
+
+    return operation
+
+
+def _trusted(workload: Workload) -> Workload:
+    def trusted_workload(n: int) -> Callable[[], Any]:
+        operation = workload(n)
+
+        def trusted_operation() -> Any:
+            with base.trusted_mode():
+                return operation()
+
+        return trusted_operation
+
+    return trusted_workload
+
+
+# Each construction benchmark again, in trusted mode.
+for _benchmark in [
+    registered for name, registered in registry.items() if name.startswith("construct ")
+]:
+    benchmark(_benchmark.name + " (trusted)", _benchmark.sizes)(
+        _trusted(_benchmark.workload)
+    )
@@ -0,0 +1,56 @@
+from typing import Any, Callable, Dict, List
+
+from case_mapping import mix_utils
+
+from .common import benchmark
+
+
+def _generate_application(name: str) -> Dict[str, Any]:
+    return {"@type": "uco-observable:ApplicationFacet", "uco-core:name": name}
+
+
+def _values(n: int) -> List[str]:
+    """
+    n distinct values followed by n/10 repeated ones.
+    """
+    distinct = ["application-%d" % index for index in range(n)]
+    return distinct + distinct[::10]
+
+
+# check_value scans its list on each call, so is quadratic in the number of distinct values.
+@benchmark("dedup check_value", sizes=(1_000, 10_000), max_size=30_000)
+def check_value(n: int) -> Callable[[], Any]:
+    values = _values(n)
+
+    def operation() -> Any:
+        list_values: List[str] = list()
+        list_objects: List[Dict[str, Any]] = list()
+        for value in values:
+            mix_utils.check_value(
+                value,
+                value=value,
+                list_values=list_values,
+                list_objects=list_objects,
+                observable_generating_f=_generate_application,
+            )
+        return list_objects
+
+    return operation
+
+
+@benchmark("dedup DedupRegistry", sizes=(10_000, 100_000, 1_000_000))
+def dedup_registry(n: int) -> Callable[[], Any]:
+    values = _values(n)
+
+    def operation() -> Any:
+        registry = mix_utils.DedupRegistry()
+        for value in values:
+            registry.check_value(
+                value,
+                value=value,
+                kind="application",
+                observable_generating_f=_generate_application,
+            )
+        return registry
+
+    return operation
@@ -0,0 +1,35 @@
+import contextlib
+import os
+from typing import Any, Callable
+
+from case_mapping import diagnostics, uco
+
+from .common import benchmark
+
+
+def _bad_rows(n: int) -> None:
+    """
+    Append n rows that are not CASE objects to an Action's results.
+    """
+    action = uco.action.Action()
+    for index in range(n):
+        action.append_results({"row": index, "name": "IMG_%07d.jpg" % index})
+
+
+@benchmark("diagnostics printed")
+def printed(n: int) -> Callable[[], Any]:
+    def operation() -> Any:
+        with open(os.devnull, "w") as fp, contextlib.redirect_stderr(fp):
+            with diagnostics.collecting(echo=True):
+                _bad_rows(n)
+
+    return operation
+
+
+@benchmark("diagnostics collected")
+def collected(n: int) -> Callable[[], Any]:
+    def operation() -> Any:
+        with diagnostics.collecting():
+            _bad_rows(n)
+
+    return operation
@@ -0,0 +1,27 @@
+import pathlib
+import tempfile
+from typing import Any, Callable
+
+from case_mapping import integrity
+
+from .common import action_bundle, benchmark
+
+
+@benchmark("integrity check_references(bundle)")
+def check_bundle(n: int) -> Callable[[], Any]:
+    bundle = action_bundle(n)
+    return lambda: integrity.check_references(bundle)
+
+
+@benchmark("integrity check_references(path)")
+def check_path(n: int) -> Callable[[], Any]:
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld"
+    action_bundle(n).write(path, indent=None)
+
+    def operation() -> Any:
+        # Referring to the directory keeps it from being deleted until the benchmark is done.
+        assert directory
+        return integrity.check_references(path)
+
+    return operation
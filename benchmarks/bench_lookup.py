@@ -0,0 +1,48 @@
+import pathlib
+import random
+import tempfile
+from typing import Any, Callable
+
+from case_mapping.offsets import IndexedBundleReader, write_offset_index
+
+from .common import benchmark, file_bundle
+
+
+def _bundle_file(n: int) -> tuple[tempfile.TemporaryDirectory, pathlib.Path, list[str]]:
+    """
+    :return: A temporary directory holding a Bundle file of n ObservableObjects with FileFacets, the file's path, and the identifiers of the objects, shuffled.
+    """
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld"
+    bundle = file_bundle(n)
+    with path.open("w") as fp:
+        bundle.dump(fp)
+    identifiers = [member.get_id() for member in bundle["uco-core:object"]]
+    random.Random(0).shuffle(identifiers)
+    return directory, path, identifiers
+
+
+@benchmark("lookup write_offset_index")
+def offset_index(n: int) -> Callable[[], Any]:
+    directory, path, _ = _bundle_file(n)
+
+    def operation() -> Any:
+        assert directory
+        return write_offset_index(path)
+
+    return operation
+
+
+@benchmark("lookup IndexedBundleReader[@id]")
+def indexed_lookup(n: int) -> Callable[[], Any]:
+    directory, path, identifiers = _bundle_file(n)
+    write_offset_index(path)
+
+    reader = IndexedBundleReader(path)
+
+    def operation() -> Any:
+        assert directory
+        for identifier in identifiers:
+            reader[identifier]
+
+    return operation
@@ -0,0 +1,22 @@
+from typing import Any, Callable
+
+from case_mapping import uco
+from case_mapping.prune import prune
+
+from .common import action_bundle, benchmark
+
+
+@benchmark("prune(bundle, dry_run=True), nothing to prune")
+def nothing_to_prune(n: int) -> Callable[[], Any]:
+    bundle = action_bundle(n)
+    return lambda: prune(bundle, dry_run=True)
+
+
+@benchmark("prune(bundle, dry_run=True), a tenth unreferenced")
+def tenth_unreferenced(n: int) -> Callable[[], Any]:
+    """
+    Pruning a Bundle to which observables were appended in advance, one in ten of which no action uses.  The size of each removed object is measured by serializing it.
+    """
+    bundle = action_bundle(n - n // 10)
+    bundle.extend_uco_objects(uco.observable.ObservableObject() for _ in range(n // 10))
+    return lambda: prune(bundle, dry_run=True)
@@ -0,0 +1,75 @@
+from typing import Any, Callable
+
+from case_mapping import uco
+
+from .common import benchmark
+
+
+def _archive_bundle(n: int) -> tuple[uco.core.Bundle, list[str]]:
+    """
+    A Bundle of about n objects: archives, each with ten files Contained_Within it, and the @id of the archives.
+    """
+    objects: list[Any] = list()
+    archives = list()
+    for _ in range(n // 22):
+        archive = uco.observable.ObservableObject()
+        archives.append(archive.get_id())
+        objects.append(archive)
+        for _ in range(10):
+            extracted = uco.observable.ObservableObject()
+            relationship = uco.observable.ObservableRelationship(
+                source=extracted,
+                target=archive,
+                kind_of_relationship="Contained_Within",
+                directional=True,
+            )
+            objects.extend((extracted, relationship))
+    bundle = uco.core.Bundle(core_objects=objects[:1])
+    bundle.extend_uco_objects(objects[1:])
+    return bundle, archives
+
+
+@benchmark("relationship_index() sources of a hundred archives")
+def hundred_archives(n: int) -> Callable[[], Any]:
+    """
+    The time should not grow with the size of the Bundle.
+    """
+    bundle, archives = _archive_bundle(n)
+    index = bundle.relationship_index()
+    roots = archives[:100]
+    return lambda: [index.sources(archive, "Contained_Within") for archive in roots]
+
+
+@benchmark(
+    "relationship scan, sources of a hundred archives",
+    sizes=(10_000, 100_000),
+    max_size=100_000,
+)
+def hundred_archives_scan(n: int) -> Callable[[], Any]:
+    """
+    The same query, answered by scanning every relationship of the Bundle, as before the index.
+    """
+    bundle, archives = _archive_bundle(n)
+    roots = set(archives[:100])
+
+    def operation() -> Any:
+        sources: dict[str, list[str]] = {archive: [] for archive in roots}
+        for member in bundle["uco-core:object"]:
+            if member["@type"] == "uco-observable:ObservableRelationship":
+                target = member["uco-core:target"]["@id"]
+                if target in roots:
+                    sources[target].append(member["uco-core:source"]["@id"])
+        return sources
+
+    return operation
+
+
+@benchmark("relationship_index() of a new Bundle")
+def build_index(n: int) -> Callable[[], Any]:
+    bundle, _ = _archive_bundle(n)
+
+    def operation() -> Any:
+        bundle._relationship_index = None
+        return bundle.relationship_index()
+
+    return operation
@@ -0,0 +1,131 @@
+import gzip
+import io
+import json
+import pathlib
+import shutil
+import tempfile
+from typing import Any, Callable
+
+from case_mapping import base, loader
+from case_mapping.ntriples import NTriplesWriter
+from case_mapping.writer import BundleWriter
+
+from .common import benchmark, file_bundle
+
+
+@benchmark("serialize str(bundle)")
+def bundle_str(n: int) -> Callable[[], Any]:
+    bundle = file_bundle(n)
+    return lambda: str(bundle)
+
+
+for _serializer in base.serializers:
+
+    def _register(serializer: str) -> None:
+        @benchmark("serialize bundle.dumps(%s, compact)" % serializer)
+        def bundle_dumps(n: int) -> Callable[[], Any]:
+            bundle = file_bundle(n)
+            return lambda: bundle.dumps(indent=None, serializer=serializer)
+
+    _register(_serializer)
+
+
+@benchmark("serialize BundleWriter")
+def bundle_writer(n: int) -> Callable[[], Any]:
+    bundle = file_bundle(n)
+    members = bundle.pop("uco-core:object")
+
+    def operation() -> Any:
+        with BundleWriter(io.StringIO(), bundle) as writer:
+            for member in members:
+                writer.append_to_uco_object(member)
+
+    return operation
+
+
+@benchmark("serialize NTriplesWriter")
+def ntriples_writer(n: int) -> Callable[[], Any]:
+    bundle = file_bundle(n)
+
+    def operation() -> Any:
+        with NTriplesWriter(io.StringIO(), bundle):
+            pass
+
+    return operation
+
+
+@benchmark("deserialize json.loads")
+def json_loads(n: int) -> Callable[[], Any]:
+    document = file_bundle(n).dumps(indent=None)
+    return lambda: json.loads(document)
+
+
+@benchmark("deserialize loader.loads")
+def loader_loads(n: int) -> Callable[[], Any]:
+    document = file_bundle(n).dumps(indent=None)
+    return lambda: loader.loads(document)
+
+
+@benchmark("deserialize iter_bundle_objects")
+def loader_iter_bundle_objects(n: int) -> Callable[[], Any]:
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld"
+    with path.open("w") as fp:
+        file_bundle(n).dump(fp, indent=None)
+
+    def operation() -> Any:
+        # Referring to the directory keeps it from being deleted until the benchmark is done.
+        assert directory
+        return sum(1 for _ in loader.iter_bundle_objects(path))
+
+    return operation
+
+
+def _write_benchmark(suffix: str) -> None:
+    @benchmark("write bundle.write(bundle.jsonld%s)" % suffix)
+    def bundle_write(n: int) -> Callable[[], Any]:
+        bundle = file_bundle(n)
+        directory = tempfile.TemporaryDirectory()
+        path = pathlib.Path(directory.name) / ("bundle.jsonld" + suffix)
+
+        def operation() -> Any:
+            assert directory
+            bundle.write(path, indent=None)
+
+        return operation
+
+
+for _suffix in ("", ".gz", ".xz"):
+    _write_benchmark(_suffix)
+
+
+@benchmark("write str(bundle), then gzip")
+def bundle_str_then_gzip(n: int) -> Callable[[], Any]:
+    """
+    Writing the uncompressed Bundle, then compressing the file, as was done before Bundle.write().
+    """
+    bundle = file_bundle(n)
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld"
+
+    def operation() -> Any:
+        assert directory
+        with path.open("w") as fp:
+            bundle.dump(fp, indent=None)
+        with path.open("rb") as source, gzip.open(str(path) + ".gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+
+    return operation
+
+
+@benchmark("deserialize iter_bundle_objects, gzip")
+def loader_iter_gzip_bundle_objects(n: int) -> Callable[[], Any]:
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld.gz"
+    file_bundle(n).write(path, indent=None)
+
+    def operation() -> Any:
+        assert directory
+        return sum(1 for _ in loader.iter_bundle_objects(path))
+
+    return operation
@@ -0,0 +1,37 @@
+import os
+from typing import Any, Callable
+
+from case_mapping import uco
+from case_mapping.spill import SpillStore
+
+from .common import benchmark
+
+
+def _build_and_dump(n: int, spill: bool) -> None:
+    """
+    Build a Bundle of n ObservableObjects with FileFacets, one at a time, and write it out.
+    """
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    with SpillStore() as store:
+        if spill:
+            bundle.spill_to(store, max_objects=10_000)
+        for index in range(n):
+            file_object = uco.observable.ObservableObject()
+            file_object.append_facets(
+                uco.observable.FileFacet(
+                    file_name="IMG_%07d.jpg" % index, file_size_bytes=index
+                )
+            )
+            bundle.append_to_uco_object(file_object)
+        with open(os.devnull, "w") as fp:
+            bundle.dump(fp, serializer="json")
+
+
+@benchmark("spill Bundle in memory", sizes=(10_000, 100_000))
+def in_memory(n: int) -> Callable[[], Any]:
+    return lambda: _build_and_dump(n, spill=False)
+
+
+@benchmark("spill Bundle to SpillStore", sizes=(10_000, 100_000))
+def spilled(n: int) -> Callable[[], Any]:
+    return lambda: _build_and_dump(n, spill=True)
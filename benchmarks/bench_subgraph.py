@@ -0,0 +1,15 @@
+from typing import Any, Callable
+
+from .common import action_bundle, benchmark
+
+
+@benchmark(
+    "subgraph of a hundred InvestigativeActions", sizes=(10_000, 100_000, 1_000_000)
+)
+def hundred_actions(n: int) -> Callable[[], Any]:
+    """
+    The time should not grow with the size of the Bundle.
+    """
+    bundle = action_bundle(n)
+    roots = [member.get_id() for member in bundle["uco-core:object"][1:301:3]]
+    return lambda: bundle.subgraph(roots)
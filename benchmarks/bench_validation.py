@@ -0,0 +1,38 @@
+import pathlib
+import tempfile
+from typing import Any, Callable
+
+from case_mapping import validation
+
+from .common import action_bundle, benchmark
+
+
+@benchmark("validation validate(bundle)")
+def validate_bundle(n: int) -> Callable[[], Any]:
+    bundle = action_bundle(n)
+    return lambda: validation.validate(bundle)
+
+
+@benchmark("validation validate(path)")
+def validate_path(n: int) -> Callable[[], Any]:
+    directory = tempfile.TemporaryDirectory()
+    path = pathlib.Path(directory.name) / "bundle.jsonld"
+    action_bundle(n).write(path, indent=None)
+
+    def operation() -> Any:
+        # Referring to the directory keeps it from being deleted until the benchmark is done.
+        assert directory
+        return validation.validate(path)
+
+    return operation
+
+
+@benchmark("validation rdflib parse, for comparison", max_size=100_000)
+def rdflib_parse(n: int) -> Callable[[], Any]:
+    """
+    Parsing the Bundle into an rdflib graph, the first step of a SHACL validation with case_validate.
+    """
+    import rdflib
+
+    document = action_bundle(n).dumps(indent=None)
+    return lambda: rdflib.Graph().parse(data=document, format="json-ld")
@@ -0,0 +1,170 @@
+import gc
+import importlib
+import pkgutil
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from case_mapping import uco
+
+# A workload is a function of the size n that does its setup, and returns a function doing n operations.
+Workload = Callable[[int], Callable[[], Any]]
+
+DEFAULT_SIZES = (10_000, 100_000)
+
+
+@dataclass
+class Benchmark:
+    name: str
+    workload: Workload
+    sizes: Sequence[int]
+    max_size: Optional[int] = None
+
+
+@dataclass
+class Result:
+    name: str
+    size: int
+    seconds: float
+    peak_bytes: Optional[int]
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds else float("inf")
+
+
+registry: Dict[str, Benchmark] = dict()
+
+
+def file_bundle(n: int) -> uco.core.Bundle:
+    """
+    A Bundle of n ObservableObjects, each with a FileFacet.
+    """
+    objects = list()
+    for facet in uco.observable.FileFacet.from_columns(
+        file_name=["IMG_%07d.jpg" % index for index in range(n)],
+        file_size_bytes=list(range(n)),
+        file_is_directory=False,
+    ):
+        file_object = uco.observable.ObservableObject()
+        file_object.append_facets(facet)
+        objects.append(file_object)
+    return uco.core.Bundle(core_objects=objects)
+
+
+def action_bundle(n: int) -> uco.core.Bundle:
+    """
+    A Bundle of about n objects: Actions, each with a performer, and an object and a result with a FileFacet.
+    """
+    performer = uco.identity.Identity()
+    objects: list[Any] = [performer]
+    for index in range(n // 3):
+        device = uco.observable.ObservableObject()
+        extracted = uco.observable.ObservableObject(
+            facets=[uco.observable.FileFacet(file_name="IMG_%07d.jpg" % index)]
+        )
+        action = uco.action.Action(
+            performer=performer, objects=[device], results=[extracted]
+        )
+        objects.extend((action, device, extracted))
+    bundle = uco.core.Bundle(core_objects=objects[:1])
+    bundle.extend_uco_objects(objects[1:])
+    return bundle
+
+
+def benchmark(
+    name: str,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    max_size: Optional[int] = None,
+) -> Callable[[Workload], Workload]:
+    """
+    Register a workload under a name.
+
+    :param sizes: The sizes run by default.
+    :param max_size: The largest size the workload is run at, for workloads too slow to run at every requested size.
+    """
+
+    def decorator(workload: Workload) -> Workload:
+        registry[name] = Benchmark(name, workload, sizes, max_size)
+        return workload
+
+    return decorator
+
+
+def import_benchmarks() -> None:
+    """
+    Import the ``bench_*`` modules of this package, registering their workloads.
+    """
+    package = importlib.import_module(__package__)
+    for module in pkgutil.iter_modules(package.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module("." + module.name, __package__)
+
+
+def measure(benchmark: Benchmark, size: int, memory: bool = True) -> Result:
+    """
+    Time one run of a workload, then, if memory is True, trace a second run for its peak memory.  The setup of each run is neither timed nor traced.
+    """
+    operation = benchmark.workload(size)
+    gc.collect()
+    start = time.perf_counter()
+    # Keep the result until timing stops, so its deallocation is not timed.
+    result = operation()
+    seconds = time.perf_counter() - start
+    del result, operation
+
+    peak_bytes = None
+    if memory:
+        operation = benchmark.workload(size)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            operation()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        del operation
+    return Result(benchmark.name, size, seconds, peak_bytes)
+
+
+def run(
+    names: Optional[Sequence[str]] = None,
+    sizes: Optional[Sequence[int]] = None,
+    memory: bool = True,
+    report: Callable[[Result], None] = lambda result: None,
+) -> List[Result]:
+    """
+    Run the registered benchmarks whose names contain any of the given names, at their default sizes or at the given ones.
+    """
+    results = list()
+    for benchmark in registry.values():
+        if names and not any(name in benchmark.name for name in names):
+            continue
+        for size in sizes or benchmark.sizes:
+            if benchmark.max_size is not None and size > benchmark.max_size:
+                continue
+            result = measure(benchmark, size, memory)
+            report(result)
+            results.append(result)
+    return results
+
+
+def format_result(result: Result) -> str:
+    peak = "-" if result.peak_bytes is None else "%.1f" % (result.peak_bytes / 2**20)
+    return "%-48s %9d %9.3f %12.0f %10s" % (
+        result.name,
+        result.size,
+        result.seconds,
+        result.ops_per_second,
+        peak,
+    )
+
+
+HEADER = "%-48s %9s %9s %12s %10s" % (
+    "benchmark",
+    "n",
+    "seconds",
+    "ops/sec",
+    "peak MiB",
+)
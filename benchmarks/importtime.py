@@ -0,0 +1,64 @@
+"""
+Report the time taken to import case_mapping, as measured by ``python -X importtime``, for statements a short-lived script would start with.
+
+Run with ``python -m benchmarks.importtime [--runs N]``.  Each statement runs in a fresh interpreter; the median, over the runs, of the total cumulative time of the modules it imports is reported.  Modules imported by the interpreter's own startup, such as site, are excluded.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import case_mapping",
+    "import case_mapping; case_mapping.__version__",
+    "from case_mapping import uco; uco.core.Bundle",
+    "from case_mapping.directory import directory; directory['uco-core:Bundle']",
+    "from case_mapping import *; uco.observable, case.investigation",
+    "from case_mapping.directory import directory; len(directory)",
+)
+
+
+def import_microseconds(statement: str) -> int:
+    """
+    :return: The sum of the cumulative import times of the top-level imports made by running statement, in microseconds.
+    """
+    baseline = {name for name, _ in _top_level_imports("pass")}
+    return sum(
+        microseconds
+        for name, microseconds in _top_level_imports(statement)
+        if name not in baseline
+    )
+
+
+def _top_level_imports(statement: str) -> list[tuple[str, int]]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imports = list()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level imports are the ones not indented under another module.
+        if not name.startswith("  "):
+            imports.append((name.strip(), int(cumulative)))
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.importtime")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    for statement in STATEMENTS:
+        median = statistics.median(
+            import_microseconds(statement) for _ in range(args.runs)
+        )
+        print("%8.1f ms  %s" % (median / 1000, statement), flush=True)
+
+
+if __name__ == "__main__":
+    main()
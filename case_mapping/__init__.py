@@ -1,5 +1,32 @@
-import importlib.metadata
+import importlib
+from typing import Any, Collection, List
 
-from . import case, uco
+__all__ = ["case", "uco"]
 
-__version__ = importlib.metadata.version("case-mapping")
+_submodules = ("case", "drafting", "uco")
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the ``case``, ``drafting`` and ``uco`` subpackages, and look up the package version, on first access (PEP 562), so that importing case_mapping does not import every ontology module.
+    """
+    if name == "__version__":
+        import importlib.metadata
+
+        version = importlib.metadata.version("case-mapping")
+        globals()["__version__"] = version
+        return version
+    return _import_submodule(__name__, _submodules, name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_submodules) | {"__version__"})
+
+
+def _import_submodule(package: str, submodules: Collection[str], name: str) -> Any:
+    """
+    The module-level ``__getattr__`` of a package whose submodules are imported lazily.  Importing a submodule binds it as an attribute of its package, so this is called at most once per submodule.
+    """
+    if name in submodules:
+        return importlib.import_module("." + name, package)
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
@@ -1,9 +1,124 @@
+import contextlib
 import json
+import uuid
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, List, Optional, Sequence, Union
+from typing import IO, Any, Callable, Iterator, List, Optional, Sequence, Union
 
 from cdo_local_uuid import local_uuid
 
+from . import diagnostics
+from .compact import CompactThing, expand
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import ujson  # type: ignore
+except ImportError:
+    ujson = None
+
+# A serializer turns a JSON value into a string, indented by the given number of spaces, or compact if the indent is None.
+Serializer = Callable[[Any, Optional[int]], str]
+
+
+def _json_serializer(value: Any, indent: Optional[int]) -> str:
+    return json.dumps(value, indent=indent, default=expand)
+
+
+def _orjson_serializer(value: Any, indent: Optional[int]) -> str:
+    # orjson only supports two-space indentation.
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(value, default=expand, option=option).decode("utf-8")
+
+
+def _ujson_serializer(value: Any, indent: Optional[int]) -> str:
+    return ujson.dumps(
+        value,
+        indent=indent or 0,
+        default=expand,
+        ensure_ascii=False,
+        escape_forward_slashes=False,
+    )
+
+
+serializers: dict[str, Serializer] = {"json": _json_serializer}
+if ujson is not None:
+    serializers["ujson"] = _ujson_serializer
+if orjson is not None:
+    serializers["orjson"] = _orjson_serializer
+
+_default_serializer = "json"
+
+
+def register_serializer(name: str, serializer: Serializer) -> None:
+    """
+    Make a serializer available to UcoThing.dumps() and set_serializer() under a name.
+    """
+    serializers[name] = serializer
+
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+    """
+    :param name: A registered serializer name, or None for the serializer selected with set_serializer().
+    """
+    name = _default_serializer if name is None else name
+    if name not in serializers:
+        raise ValueError(
+            "Unknown serializer '%s'.  Registered serializers: %s."
+            % (name, ", ".join(serializers))
+        )
+    return serializers[name]
+
+
+def set_serializer(name: str) -> None:
+    """
+    Select the serializer used when printing UcoThings.  The standard library's json module is used until this is called.
+
+    :param name: A registered serializer name, or "fastest" for the fastest installed encoder (orjson, then ujson, then json).
+    """
+    global _default_serializer
+    if name == "fastest":
+        name = next(
+            candidate
+            for candidate in ("orjson", "ujson", "json")
+            if candidate in serializers
+        )
+    get_serializer(name)
+    _default_serializer = name
+
+
+_trusted = False
+
+
+def set_trusted(trusted: bool = True) -> None:
+    """
+    Select whether constructor arguments are trusted, for the whole process.  In trusted mode, the ``_*_vars`` methods and from_columns() encode the values they are given without checking their types, so input that is already known to be valid is processed faster.  Invalid input is then encoded as it is, or raises an arbitrary error, instead of raising a TypeError.  None values, and None items of lists, are skipped in either mode.
+    """
+    global _trusted
+    _trusted = trusted
+
+
+@contextlib.contextmanager
+def trusted_mode(trusted: bool = True) -> Iterator[None]:
+    """
+    Select trusted mode, as with set_trusted(), within a ``with`` block.
+
+    >>> from case_mapping import uco
+    >>> with trusted_mode():
+    ...     facet = uco.observable.FileFacet(file_name="a.jpg", file_size_bytes=35002)
+    >>> facet["uco-observable:sizeInBytes"]
+    {'@type': 'xsd:integer', '@value': '35002'}
+    """
+    previous = _trusted
+    set_trusted(trusted)
+    try:
+        yield
+    finally:
+        set_trusted(previous)
+
 
 def unpack_args_array(func):
     """
@@ -20,7 +135,145 @@ def unpack_args_array(func):
     return wrapper
 
 
+def _datetime_value(var: datetime) -> str:
+    # A naive datetime is taken to be in UTC.
+    if var.utcoffset() is None:
+        return var.isoformat() + "+00:00"
+    return var.isoformat()
+
+
+class _Literal(dict):
+    """
+    A typed literal shared by every property holding an equal value, which therefore cannot be modified.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(
+            "Typed literals are shared between objects, and cannot be modified.  Assign a new literal dictionary instead."
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+
+    def __reduce__(self) -> Any:
+        return (type(self), (dict(self),))
+
+
+_TRUE = _Literal({"@type": "xsd:boolean", "@value": True})
+_FALSE = _Literal({"@type": "xsd:boolean", "@value": False})
+
+# Literals of the integers 0 to _SMALL_INTS - 1, e.g. counts and sizes, by datatype, made as they are first used.
+_SMALL_INTS = 1024
+_int_literals: dict[str, dict[int, _Literal]] = {
+    "xsd:integer": dict(),
+    "xsd:nonNegativeInteger": dict(),
+}
+
+# Interned dateTime literals.  The cache is emptied when full, which keeps it cheap to maintain when timestamps rarely repeat.
+_datetime_literals: dict[tuple[datetime, Any, int], _Literal] = dict()
+_DATETIME_LITERALS_MAX = 1 << 14
+
+
+def _bool_literal(var: Any) -> dict[str, Any]:
+    if var is True:
+        return _TRUE
+    if var is False:
+        return _FALSE
+    return {"@type": "xsd:boolean", "@value": var}
+
+
+def _int_literal(datatype: str, var: Any) -> dict[str, Any]:
+    # Other types, e.g. bool, could be equal to a small int but have another lexical form.
+    if type(var) is not int or not 0 <= var < _SMALL_INTS:
+        return {"@type": datatype, "@value": str(var)}
+    literals = _int_literals[datatype]
+    literal = literals.get(var)
+    if literal is None:
+        literal = literals[var] = _Literal({"@type": datatype, "@value": str(var)})
+    return literal
+
+
+def _datetime_literal(var: datetime) -> dict[str, Any]:
+    if type(var) is not datetime:
+        return {"@type": "xsd:dateTime", "@value": _datetime_value(var)}
+    # Equal instants in different time zones have different lexical forms, as do equal times either side of a fold in one time zone.
+    key = (var, var.tzinfo, var.fold)
+    literal = _datetime_literals.get(key)
+    if literal is None:
+        if len(_datetime_literals) >= _DATETIME_LITERALS_MAX:
+            _datetime_literals.clear()
+        literal = _datetime_literals[key] = _Literal(
+            {"@type": "xsd:dateTime", "@value": _datetime_value(var)}
+        )
+    return literal
+
+
+def _references(things: Sequence[Any]) -> Optional[list[dict[str, str]]]:
+    """
+    :return: References to the things, skipping None, or None if there are only None, which leaves the property unset, as when types are checked.
+    """
+    references = [{"@id": thing.get_id()} for thing in things if thing is not None]
+    if references or not things:
+        return references
+    return None
+
+
+# Namespace of the name-based UUIDs minted by UcoThing.assign_content_id().
+CONTENT_ID_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL, "https://github.com/casework/CASE-Mapping-Python"
+)
+
+# Properties identifying an instance of a class, for classes registered with set_identifying_properties().
+_identifying_properties: dict[type, tuple[str, ...]] = dict()
+
+
+def set_identifying_properties(cls: type, *keys: str) -> None:
+    """
+    Configure which properties UcoThing.content_id() hashes for instances of a class and its subclasses.  Calling this with no keys restores the default of hashing every property.
+
+    :param cls: A UcoThing subclass, e.g. ``uco.observable.ApplicationFacet``.
+    :param keys: JSON-LD property names, e.g. ``"uco-core:name"``.
+    """
+    if keys:
+        _identifying_properties[cls] = keys
+    else:
+        _identifying_properties.pop(cls, None)
+
+
+def _content_value(value: Any) -> Any:
+    """
+    The part of a JSON value that identifies it: nested nodes are identified by their content rather than by their ``@id``, while references keep their ``@id``.
+    """
+    if isinstance(value, CompactThing):
+        value = value.expand()
+    if isinstance(value, dict):
+        return {
+            key: _content_value(item)
+            for key, item in value.items()
+            if key != "@id" or len(value) == 1
+        }
+    if isinstance(value, (list, tuple)):
+        return [_content_value(item) for item in value]
+    return value
+
+
+# Python types accepted by each kind of _*_vars method, when checking a whole column at once.
+_column_types: dict[str, tuple[type, ...]] = {
+    "str": (str,),
+    "float": (float, int),
+    "int": (int,),
+    "bool": (bool,),
+    "datetime": (datetime,),
+    "nonegative_int": (int,),
+}
+
+
 class UcoThing(dict):
+    # Constructor parameters accepted by from_columns(), mapped to the property each one sets and the kind of _*_vars method that encodes it.  Entries are listed in the order the constructor sets the properties.
+    _columns: dict[str, tuple[str, str]] = dict()
+
     def __init__(
         self,
         *args: Any,
@@ -52,11 +305,227 @@ class UcoThing(dict):
         self["@id"] = prefix_label + ":" + str(local_uuid())
 
     def __str__(self):
-        return json.dumps(self, indent=4)
+        return self.dumps()
+
+    def dumps(self, indent: Optional[int] = 4, serializer: Optional[str] = None) -> str:
+        """
+        :param indent: The number of spaces to indent by, or None for compact output on a single line.
+        :param serializer: The name of a registered serializer, or None for the one selected with set_serializer().
+        """
+        return get_serializer(serializer)(self, indent)
+
+    def dump(
+        self, fp: IO[str], indent: Optional[int] = 4, serializer: Optional[str] = None
+    ) -> None:
+        """
+        Write the JSON serialization to a text file handle, followed by a newline.  Parameters are as for dumps().
+        """
+        fp.write(self.dumps(indent=indent, serializer=serializer))
+        fp.write("\n")
 
     def get_id(self) -> str:
         return self["@id"]
 
+    def content_id(self, *keys: str) -> str:
+        """
+        A deterministic identifier: a name-based UUID (version 5) of the ``@type`` and the identifying properties, prefixed with the ``prefix_label``.  Equal entities built by separate processes thus get equal identifiers, as long as they use the same ``prefix_label``.
+
+        :param keys: The identifying properties.  If none are given, those configured with set_identifying_properties() for the class are used, or else every property.  Nested nodes, such as Facets, are identified by their content rather than by their ``@id``.
+
+        >>> from case_mapping import uco
+        >>> app_1 = uco.observable.ApplicationFacet(application_identifier="Safari")
+        >>> app_2 = uco.observable.ApplicationFacet(application_identifier="Safari")
+        >>> app_1.get_id() == app_2.get_id()
+        False
+        >>> app_1.content_id() == app_2.content_id()
+        True
+        """
+        if not keys:
+            keys = next(
+                (
+                    _identifying_properties[cls]
+                    for cls in type(self).__mro__
+                    if cls in _identifying_properties
+                ),
+                (),
+            )
+        if keys:
+            identifying = {key: self.get(key) for key in ("@type",) + keys}
+        else:
+            identifying = {key: value for key, value in self.items() if key != "@id"}
+        name = json.dumps(
+            _content_value(identifying),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return self.prefix_label + ":" + str(uuid.uuid5(CONTENT_ID_NAMESPACE, name))
+
+    def assign_content_id(self, *keys: str) -> str:
+        """
+        Replace the ``@id`` with content_id(), and return it.  This must be done before the object is referenced by, or appended to, other objects, as the references already made are not updated.
+        """
+        self["@id"] = self.content_id(*keys)
+        return self["@id"]
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        prefix_iri: str = "http://example.org/kb/",
+        prefix_label: str = "kb",
+        **columns: Any,
+    ) -> List["UcoThing"]:
+        """
+        Build one instance per row from columns of constructor arguments, type-checking and encoding each column once rather than each argument of each row.
+
+        A column is a list, tuple or NumPy array holding one value per row, with None where a row has no value.  Any other value is used for every row.  The instances are equal to those the constructor builds from the same arguments, apart from their ``@id``.  Classes that do not declare their columns in ``_columns`` are built by calling the constructor once per row, without the speed-up.
+
+        >>> from case_mapping import uco
+        >>> facets = uco.observable.FileFacet.from_columns(file_name=["a.jpg", "b.txt"], file_size_bytes=[35002, None])
+        >>> facets[0]["uco-observable:sizeInBytes"]
+        {'@type': 'xsd:integer', '@value': '35002'}
+        >>> "uco-observable:sizeInBytes" in facets[1]
+        False
+
+        :param prefix_iri: As for the constructor.
+        :param prefix_label: As for the constructor.
+        """
+        unknown = [name for name in columns if name not in cls._columns]
+        if cls._columns and unknown:
+            raise TypeError(
+                f"{cls.__name__}.from_columns() got unexpected columns: {', '.join(unknown)}"
+            )
+
+        length: Optional[int] = None
+        for name, column in columns.items():
+            if hasattr(column, "tolist"):  # NumPy arrays
+                column = columns[name] = column.tolist()
+            if isinstance(column, (list, tuple)):
+                if length is None:
+                    length = len(column)
+                elif len(column) != length:
+                    raise ValueError(
+                        "All columns passed to from_columns() must have the same length."
+                    )
+        if length is None:
+            raise ValueError("from_columns() requires at least one list column.")
+
+        if not cls._columns:
+            return [
+                cls(
+                    prefix_iri=prefix_iri,
+                    prefix_label=prefix_label,
+                    **{
+                        name: (
+                            column[index]
+                            if isinstance(column, (list, tuple))
+                            else column
+                        )
+                        for name, column in columns.items()
+                    },
+                )
+                for index in range(length)
+            ]
+
+        encoded_columns = list()
+        for name, (key, kind) in cls._columns.items():
+            if name not in columns:
+                continue
+            column = columns[name]
+            if not isinstance(column, (list, tuple)):
+                column = [column] * length
+            encoded_columns.append((key, cls.__encode_column(key, kind, column)))
+
+        prototype = cls(prefix_iri=prefix_iri, prefix_label=prefix_label)
+        template = [(key, value) for key, value in prototype.items() if key != "@id"]
+        things = list()
+        for row in zip(*(values for _, values in encoded_columns)):
+            thing = cls.__new__(cls)
+            thing.prefix_iri = prototype.prefix_iri
+            thing.prefix_label = prototype.prefix_label
+            thing["@id"] = prototype.prefix_label + ":" + str(local_uuid())
+            for key, value in template:
+                thing[key] = value
+            for (key, _), value in zip(encoded_columns, row):
+                if value is not None:
+                    thing[key] = value
+            things.append(thing)
+        return things
+
+    @classmethod
+    def __encode_column(cls, key: str, kind: str, column: Sequence[Any]) -> List[Any]:
+        if kind == "node_reference" and _trusted:
+            return [
+                (
+                    None
+                    if var is None
+                    else (
+                        _references(var)
+                        if isinstance(var, (list, tuple))
+                        else {"@id": var.get_id()}
+                    )
+                )
+                for var in column
+            ]
+        if kind == "node_reference":
+            encoded: List[Any] = list()
+            for var in column:
+                if isinstance(var, list) or isinstance(var, tuple):
+                    if all(isinstance(item, UcoThing) for item in var):
+                        encoded.append([{"@id": item.get_id()} for item in var])
+                    else:
+                        cls.__handle_list_type_errors(key, var, "UcoThing (no @id key)")
+                        encoded.append(None)
+                elif isinstance(var, UcoThing):
+                    encoded.append({"@id": var.get_id()})
+                else:
+                    cls.__handle_var_type_errors(key, var, "UcoThing (no @id key)")
+                    encoded.append(None)
+            return encoded
+
+        if not _trusted:
+            expected = _column_types[kind]
+            for value_type in set(map(type, column)):
+                if value_type is not type(None) and not issubclass(
+                    value_type, expected
+                ):
+                    var = next(var for var in column if type(var) is value_type)
+                    cls.__handle_var_type_errors(
+                        key,
+                        var,
+                        "non-negative integer" if kind == "nonegative_int" else kind,
+                    )
+            if kind == "nonegative_int":
+                for var in column:
+                    if var is not None and var < 0:
+                        cls.__handle_var_type_errors(key, var, "non-negative integer")
+
+        if kind == "str":
+            return list(column)
+        if kind == "float":
+            return [
+                (
+                    None
+                    if var is None
+                    else {"@type": "xsd:decimal", "@value": str(float(var))}
+                )
+                for var in column
+            ]
+        if kind == "int":
+            return [
+                None if var is None else _int_literal("xsd:integer", var)
+                for var in column
+            ]
+        if kind == "bool":
+            return [None if var is None else _bool_literal(var) for var in column]
+        if kind == "datetime":
+            return [None if var is None else _datetime_literal(var) for var in column]
+        return [
+            None if var is None else _int_literal("xsd:nonNegativeInteger", var)
+            for var in column
+        ]
+
     def _append_stuff(self, key, *args, refs=False, objects=False):
         if len(args) == 1 and not args[0]:  # True if no objects to append provided
             pass
@@ -67,13 +536,40 @@ class UcoThing(dict):
                 elif isinstance(self[key], dict):  # if single ref add it to list
                     self[key] = [self[key]]
             for item in args:
-                if isinstance(item, UcoThing):
+                if isinstance(item, (UcoThing, CompactThing)):
                     if refs:
                         self[key].append({"@id": item.get_id()})
                     elif objects:
                         self[key].append(item)
                 else:
-                    print(f"{item}: NOT A CASE OBJECT")
+                    diagnostics.report(
+                        diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                    )
+
+    def _extend_stuff(self, key, items, refs=False):
+        """
+        As _append_stuff(), taking any iterable of items, e.g. a generator, which is consumed in one pass, and extending the key's list once.
+        """
+        new_items = list()
+        for item in items:
+            if isinstance(item, (UcoThing, CompactThing)):
+                new_items.append({"@id": item.get_id()} if refs else item)
+            else:
+                diagnostics.report(
+                    diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                )
+        self._extend_list(key, new_items)
+
+    def _extend_list(self, key, items):
+        if not items:
+            return
+        current = dict.get(self, key)
+        if current is None:
+            self[key] = items
+        elif isinstance(current, dict):  # if single ref add it to list
+            self[key] = [current, *items]
+        else:
+            current.extend(items)
 
     def _append_refs(self, key, *args):
         self._append_stuff(key, *args, refs=True)
@@ -81,6 +577,9 @@ class UcoThing(dict):
     def _append_observable_objects(self, key, *args):
         self._append_stuff(key, *args, objects=True)
 
+    def _extend_observable_objects(self, key, items):
+        self._extend_stuff(key, items)
+
     def _append_strings(self, key, *args):
         if len(args) and self.get(key) is None:
             self[key] = list()
@@ -88,9 +587,16 @@ class UcoThing(dict):
             if isinstance(item, str):
                 self[key].append(item)
             else:
-                print(f"{item}: NOT A STRING")
+                diagnostics.report(
+                    diagnostics.NOT_A_STRING, type(self).__name__, key, item
+                )
 
     def _str_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = var
+            return
         for key, var in kwargs.items():
             if isinstance(var, str):
                 self[key] = var
@@ -98,6 +604,11 @@ class UcoThing(dict):
                 self.__handle_var_type_errors(key, var, "str")
 
     def _float_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = {"@type": "xsd:decimal", "@value": str(float(var))}
+            return
         for key, var in kwargs.items():
             if isinstance(var, float):
                 self[key] = {"@type": "xsd:decimal", "@value": str(var)}
@@ -107,40 +618,66 @@ class UcoThing(dict):
                 self.__handle_var_type_errors(key, var, "float")
 
     def _int_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = _int_literal("xsd:integer", var)
+            return
         for key, var in kwargs.items():
             if isinstance(var, int):
-                self[key] = {"@type": "xsd:integer", "@value": str(var)}
+                self[key] = _int_literal("xsd:integer", var)
             else:
                 self.__handle_var_type_errors(key, var, "int")
 
     def _bool_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = _bool_literal(var)
+            return
         for key, var in kwargs.items():
             if isinstance(var, bool):
-                self[key] = {"@type": "xsd:boolean", "@value": var}
+                self[key] = _bool_literal(var)
             else:
                 self.__handle_var_type_errors(key, var, "bool")
 
     def _datetime_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = _datetime_literal(var)
+            return
         for key, var in kwargs.items():
             if isinstance(var, datetime):
-                tz_info = var.strftime("%z")
-                iso_format = var.isoformat() if tz_info else var.isoformat() + "+00:00"
-                self[key] = {"@type": "xsd:dateTime", "@value": iso_format}
+                self[key] = _datetime_literal(var)
             else:
                 self.__handle_var_type_errors(key, var, "datetime")
 
     def _nonegative_int_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if var is not None:
+                    self[key] = _int_literal("xsd:nonNegativeInteger", var)
+            return
         for key, var in kwargs.items():
             if isinstance(var, int) and not var < 0:
-                self[key] = {"@type": "xsd:nonNegativeInteger", "@value": str(var)}
+                self[key] = _int_literal("xsd:nonNegativeInteger", var)
             else:
                 self.__handle_var_type_errors(key, var, "non-negative integer")
 
     def _node_reference_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if isinstance(var, (list, tuple)):
+                    references = _references(var)
+                    if references is not None:
+                        self[key] = references
+                elif var is not None:
+                    self[key] = {"@id": var.get_id()}
+            return
         for key, var in kwargs.items():
             if isinstance(var, list) or isinstance(var, tuple):
-                is_uco_thing = [isinstance(item, UcoThing) for item in var]
-                if all(is_uco_thing):
+                if all(isinstance(item, UcoThing) for item in var):
                     self[key] = [{"@id": item.get_id()} for item in var]
                 else:
                     self.__handle_list_type_errors(key, var, "UcoThing (no @id key)")
@@ -150,10 +687,19 @@ class UcoThing(dict):
                 self.__handle_var_type_errors(key, var, "UcoThing (no @id key)")
 
     def _str_list_vars(self, **kwargs):
+        if _trusted:
+            for key, var in kwargs.items():
+                if isinstance(var, str):
+                    self[key] = [var]
+                elif var is not None:
+                    items = [item for item in var if item is not None]
+                    # As when checked, a list of only None leaves the property unset.
+                    if items or not var:
+                        self[key] = items
+            return
         for key, var in kwargs.items():
             if isinstance(var, list) or isinstance(var, tuple):
-                is_string = [isinstance(item, str) for item in var]
-                if all(is_string):
+                if all(isinstance(item, str) for item in var):
                     self[key] = list(var)
                 else:
                     self.__handle_list_type_errors(key, var, "str")
@@ -162,25 +708,33 @@ class UcoThing(dict):
             else:
                 self.__handle_var_type_errors(key, var, "str")
 
-    @staticmethod
-    def __handle_list_type_errors(var_name, var_val, expected_type):
+    @classmethod
+    def __handle_list_type_errors(cls, var_name, var_val, expected_type):
         if len(var_val) == 1 and var_val[0] is None:
             pass
         else:
-            print(
-                f"One of the items provided for {var_name} is not of type {expected_type}: items provided: {var_val}"
+            diagnostics.report(
+                diagnostics.WRONG_ITEM_TYPE,
+                cls.__name__,
+                var_name,
+                var_val,
+                expected_type,
+            )
+            raise TypeError(
+                f"One of the items provided for {var_name} is not of type {expected_type}."
             )
-            raise TypeError
 
-    @staticmethod
-    def __handle_var_type_errors(var_name, var_val, expected_type):
+    @classmethod
+    def __handle_var_type_errors(cls, var_name, var_val, expected_type):
         if var_val is None:
             pass
         else:
-            print(
-                f"Value provided for {var_name} is not of type {expected_type}: value provided: {var_val}"
+            diagnostics.report(
+                diagnostics.WRONG_TYPE, cls.__name__, var_name, var_val, expected_type
+            )
+            raise TypeError(
+                f"Value provided for {var_name} is not of type {expected_type}."
             )
-            raise TypeError
 
 
 class UcoInherentCharacterizationThing(UcoThing):
@@ -250,6 +804,18 @@ class UcoObject(UcoThing):
         """
         self._append_stuff("uco-core:hasFacet", *args, objects=True)
 
+    def extend_facets(self, facets: Iterable[Any]) -> None:
+        """
+        As append_facets(), for any iterable of Facets, e.g. a generator, which is consumed once.  The Facets are checked in one pass and added to the list of Facets at once.
+
+        >>> from case_mapping import uco
+        >>> observable = uco.observable.ObservableObject()
+        >>> observable.extend_facets(uco.observable.FileFacet(file_name=name) for name in ("a", "b", "c"))
+        >>> len(observable["uco-core:hasFacet"])
+        3
+        """
+        self._extend_stuff("uco-core:hasFacet", facets)
+
     @unpack_args_array
     def append_core_objects(self, *args):
         """
@@ -290,7 +856,12 @@ class UcoObject(UcoThing):
                     new_entry["olo:item"] = {"@id": item.get_id()}
                     self["olo:slot"].append(new_entry)
                 else:
-                    print(f"{item}: NOT A CASE OBJECT")
+                    diagnostics.report(
+                        diagnostics.NOT_A_CASE_OBJECT,
+                        type(self).__name__,
+                        "olo:slot",
+                        item,
+                    )
 
             self["olo:length"] = str(current_index)
 
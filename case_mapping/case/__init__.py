@@ -1 +1,13 @@
-from . import investigation
+from typing import Any, List
+
+from .. import _import_submodule
+
+__all__ = ["investigation"]
+
+
+def __getattr__(name: str) -> Any:
+    return _import_submodule(__name__, __all__, name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
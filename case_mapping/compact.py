@@ -0,0 +1,208 @@
+from typing import Any, Dict, Hashable, List, Mapping, Tuple
+
+# Kinds of stored values.  Each kind records how a value was shortened when a
+# node was compacted, and how to expand it again.
+PLAIN = 0  # Any JSON value, stored as-is.
+CONSTANT = 1  # A value shared by all records of a schema, e.g. "@type".
+LITERAL = 2  # {"@type": datatype, "@value": value}, storing only value.
+REFERENCE = 3  # {"@id": iri}, storing only iri.
+REFERENCES = 4  # [{"@id": iri}, ...], storing a tuple of iris.
+NODE = 5  # A nested node with an "@id", stored as a CompactThing.
+NODES = 6  # A list of nested nodes, stored as a tuple of CompactThings.
+STRINGS = 7  # A list of strings, stored as a tuple.
+
+SchemaEntry = Tuple[str, int, Hashable]
+
+
+class CompactSchema:
+    """
+    The property layout shared by every CompactThing built from nodes with the same keys, in the same order, with the same kinds of values.
+    """
+
+    __slots__ = ("entries", "type")
+
+    def __init__(self, entries: Tuple[SchemaEntry, ...]) -> None:
+        self.entries = entries
+        self.type: Any = None
+        for key, kind, extra in entries:
+            if key == "@type" and kind == CONSTANT:
+                self.type = _thaw(extra)
+
+
+_schemas: Dict[Tuple[SchemaEntry, ...], CompactSchema] = dict()
+
+
+class CompactThing:
+    """
+    A memory-compact, read-only record of a JSON-LD node.
+
+    A UcoThing is a dictionary holding fully expanded JSON-LD keys, and a fresh ``{"@type": ..., "@value": ...}`` dictionary for every typed literal.  A CompactThing instead stores only the varying values, in a tuple, and points to a CompactSchema interned per node layout that holds the keys, the literal datatypes and the ``@type``.  The JSON-LD dictionary is rebuilt by expand() when the record is serialized.
+
+    Examples
+    ========
+
+    >>> from case_mapping import uco
+    >>> facet = uco.observable.FileFacet(file_name="IMG_0123.jpg", file_size_bytes=35002)
+    >>> record = compact(facet)
+    >>> assert record.expand() == facet
+    >>> assert record.get_id() == facet.get_id()
+    >>> assert compact(uco.observable.FileFacet(file_name="a", file_size_bytes=1)).schema is record.schema
+    """
+
+    __slots__ = ("schema", "values")
+
+    def __init__(self, schema: CompactSchema, values: Tuple[Any, ...]) -> None:
+        self.schema = schema
+        self.values = values
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, self.expand())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CompactThing):
+            return self.schema is other.schema and self.values == other.values
+        if isinstance(other, Mapping):
+            return self.expand() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = 0
+        for entry_key, kind, extra in self.schema.entries:
+            if kind == CONSTANT:
+                if entry_key == key:
+                    return _thaw(extra)
+                continue
+            if entry_key == key:
+                return _expand_value(kind, extra, self.values[position])
+            position += 1
+        return default
+
+    def get_id(self) -> str:
+        return self.get("@id")  # type: ignore
+
+    def expand(self) -> Dict[str, Any]:
+        """
+        Rebuild the JSON-LD dictionary of this node.
+        """
+        expanded: Dict[str, Any] = dict()
+        values = iter(self.values)
+        for key, kind, extra in self.schema.entries:
+            if kind == CONSTANT:
+                expanded[key] = _thaw(extra)
+            else:
+                expanded[key] = _expand_value(kind, extra, next(values))
+        return expanded
+
+
+def compact(node: Mapping[str, Any]) -> CompactThing:
+    """
+    Build a CompactThing from a JSON-LD node, such as any UcoThing.  Nested nodes that carry an ``@id`` (e.g. Facets under ``uco-core:hasFacet``) are compacted as well.
+
+    The node is not modified, and shares no mutable state with the returned record, so the node can be discarded afterwards.
+    """
+    entries: List[SchemaEntry] = list()
+    values: List[Any] = list()
+    for key, value in node.items():
+        if key == "@type":
+            entries.append((key, CONSTANT, _freeze(value)))
+            continue
+        kind, extra, stored = _compact_value(value)
+        entries.append((key, kind, extra))
+        values.append(stored)
+    signature = tuple(entries)
+    schema = _schemas.get(signature)
+    if schema is None:
+        schema = _schemas.setdefault(signature, CompactSchema(signature))
+    return CompactThing(schema, tuple(values))
+
+
+def expand(value: Any) -> Dict[str, Any]:
+    """
+    A ``default`` function for ``json.dumps``, expanding CompactThings met while encoding.
+    """
+    if isinstance(value, CompactThing):
+        return value.expand()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compact_value(value: Any) -> Tuple[int, Hashable, Any]:
+    if isinstance(value, CompactThing):
+        return NODE, None, value
+    if isinstance(value, str):
+        return PLAIN, None, value
+    if isinstance(value, Mapping):
+        if len(value) == 1 and "@id" in value:
+            return REFERENCE, None, value["@id"]
+        if len(value) == 2 and "@type" in value and "@value" in value:
+            if isinstance(value["@type"], str):
+                return LITERAL, value["@type"], value["@value"]
+        if "@id" in value:
+            return NODE, None, compact(value)
+    elif isinstance(value, list) and value:
+        if all(isinstance(item, str) for item in value):
+            return STRINGS, None, tuple(value)
+        if all(_is_reference(item) for item in value):
+            return REFERENCES, None, tuple(item["@id"] for item in value)
+        if all(
+            isinstance(item, CompactThing)
+            or (isinstance(item, Mapping) and "@id" in item)
+            for item in value
+        ):
+            return (
+                NODES,
+                None,
+                tuple(
+                    item if isinstance(item, CompactThing) else compact(item)
+                    for item in value
+                ),
+            )
+    return PLAIN, None, _freeze(value)
+
+
+def _expand_value(kind: int, extra: Any, stored: Any) -> Any:
+    if kind == LITERAL:
+        return {"@type": extra, "@value": stored}
+    if kind == REFERENCE:
+        return {"@id": stored}
+    if kind == REFERENCES:
+        return [{"@id": iri} for iri in stored]
+    if kind == NODE:
+        return stored.expand()
+    if kind == NODES:
+        return [item.expand() for item in stored]
+    if kind == STRINGS:
+        return list(stored)
+    return _thaw(stored)
+
+
+def _is_reference(item: Any) -> bool:
+    return isinstance(item, Mapping) and len(item) == 1 and "@id" in item
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Copy a JSON value into immutable, hashable containers.
+    """
+    if isinstance(value, Mapping):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class _FrozenDict(tuple):
+    """
+    A tuple of (key, value) pairs, distinguished from a JSON array.
+    """
+
+    pass
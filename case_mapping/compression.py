@@ -0,0 +1,138 @@
+import gzip
+import io
+import lzma
+import os
+from typing import IO, Optional, Union
+
+try:
+    from compression import zstd  # type: ignore
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+Path = Union[str, "os.PathLike[str]"]
+
+COMPRESSIONS = ("gzip", "xz", "zstd")
+
+# File name suffixes, by compression.
+SUFFIXES = {".gz": "gzip", ".xz": "xz", ".zst": "zstd"}
+
+# The magic numbers compressed files start with.
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+
+def detect_compression(data: bytes) -> Optional[str]:
+    """
+    :param data: The first bytes of a file, at least six.
+    :return: The compression the data is in, or None if it is not compressed in a known format.
+    """
+    return next((name for magic, name in _MAGIC if data.startswith(magic)), None)
+
+
+def compression_from_suffix(path: Path) -> Optional[str]:
+    """
+    :return: The compression named by the file name suffix of path, e.g. "gzip" for ``case.jsonld.gz``, or None.
+    """
+    return SUFFIXES.get(os.path.splitext(os.fspath(path))[1].lower())
+
+
+def open_bundle(
+    path: Path,
+    mode: str = "r",
+    *,
+    compression: Optional[str] = "infer",
+    level: Optional[int] = None,
+) -> IO[str]:
+    """
+    Open a Bundle file as a UTF-8 text file handle, compressing what is written to it, or decompressing what is read from it.  Writers such as ``Bundle.dump()`` and ``case_mapping.writer.BundleWriter`` then write compressed output as they serialize, without writing uncompressed JSON first.
+
+    zstd requires Python 3.14, or the zstandard package.
+
+    :param path: The Bundle file.
+    :param mode: "r" to read, "w" to write, or "a" or "x" as for open().
+    :param compression: One of COMPRESSIONS, None for no compression, or "infer".  When reading, "infer" detects the compression from the start of the file; otherwise it is inferred from the file name suffix.
+    :param level: The compression level, or None for the codec's default, except for gzip, which defaults to 6, as the gzip command does, rather than the slower 9.
+
+    >>> import os, tempfile
+    >>> from case_mapping import uco
+    >>> bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = os.path.join(tmpdir, "case.jsonld.gz")
+    ...     with open_bundle(path, "w") as fp:
+    ...         bundle.dump(fp)
+    ...     with open(path, "rb") as fp:
+    ...         magic = fp.read(2)
+    ...     with open_bundle(path) as fp:
+    ...         text = fp.read()
+    >>> magic, text == str(bundle) + "\\n"
+    (b'\\x1f\\x8b', True)
+    """
+    mode = mode.replace("t", "")
+    if mode not in ("r", "w", "a", "x"):
+        raise ValueError("Unsupported mode '%s'." % mode)
+    if compression == "infer":
+        if mode == "r":
+            with open(path, "rb") as fp:
+                compression = detect_compression(fp.read(6))
+        else:
+            compression = compression_from_suffix(path)
+    if compression is None:
+        return open(path, mode, encoding="utf-8")
+    if compression == "gzip":
+        return io.TextIOWrapper(
+            gzip.GzipFile(path, mode, compresslevel=6 if level is None else level),
+            encoding="utf-8",
+        )
+    if compression == "xz":
+        return io.TextIOWrapper(
+            lzma.LZMAFile(path, mode, preset=level), encoding="utf-8"
+        )
+    if compression == "zstd":
+        if zstd is not None:
+            return zstd.open(path, mode + "t", level=level, encoding="utf-8")
+        if zstandard is not None:
+            compressor = (
+                zstandard.ZstdCompressor(level=level)
+                if level is not None and mode != "r"
+                else None
+            )
+            return zstandard.open(path, mode + "t", cctx=compressor, encoding="utf-8")
+        raise ValueError(
+            "zstd compression requires Python 3.14, or the zstandard package."
+        )
+    raise ValueError(
+        "Unknown compression '%s'.  Supported compressions: %s."
+        % (compression, ", ".join(COMPRESSIONS))
+    )
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    :return: data, decompressed if it is compressed in one of COMPRESSIONS.
+    """
+    compression = detect_compression(data[:6])
+    if compression is None:
+        return data
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "xz":
+        return lzma.decompress(data)
+    if zstd is not None:
+        return zstd.decompress(data)
+    if zstandard is not None:
+        with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data)) as reader:
+            return reader.read()
+    raise ValueError("zstd compression requires Python 3.14, or the zstandard package.")
+
+
+def is_compressed(path: Path) -> bool:
+    with open(path, "rb") as fp:
+        return detect_compression(fp.read(6)) is not None
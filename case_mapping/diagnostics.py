@@ -0,0 +1,145 @@
+import contextlib
+import sys
+from collections import Counter
+from typing import Any, Iterator, Optional
+
+# Kinds of reported problems.
+NOT_A_CASE_OBJECT = "NOT A CASE OBJECT"  # An appended item is not a UcoThing.
+NOT_A_STRING = "NOT A STRING"  # An appended item is not a string.
+ALREADY_IN_BUNDLE = "ALREADY IN BUNDLE"  # An object's @id is already in the Bundle.
+WRONG_TYPE = "WRONG TYPE"  # A constructor argument has the wrong type.
+WRONG_ITEM_TYPE = "WRONG ITEM TYPE"  # An item of a list argument has the wrong type.
+
+# (kind, class name, property)
+Key = tuple[str, str, str]
+
+
+class Diagnostics:
+    def __init__(self, *, max_samples: int = 5, echo: bool = False) -> None:
+        """
+        Collects the problems met while building objects, such as items that are not CASE objects, or arguments of the wrong type, as counters, and a bounded sample of the offending values, per kind of problem, class and property.
+
+        Reporting a problem costs a counter increment; the offending values are only formatted, e.g. by summary(), when asked for.  Type errors are still raised.
+
+        :param max_samples: The number of offending values kept per kind, class and property.
+        :param echo: Also print a message for every problem, as this package did before diagnostics were collected, to standard error, so as not to mix with JSON-LD written to standard output.  The default collector does not; ``set_diagnostics(Diagnostics(echo=True))`` selects one that does.
+
+        >>> from case_mapping import uco
+        >>> with collecting() as diagnostics:
+        ...     action = uco.action.Action()
+        ...     action.append_results("not an object", 42)
+        >>> diagnostics.total(NOT_A_CASE_OBJECT)
+        2
+        >>> print(diagnostics.summary())
+        2 NOT A CASE OBJECT Action uco-action:result: 'not an object', 42
+        """
+        self.max_samples = max_samples
+        self.echo = echo
+        self.counts: Counter[Key] = Counter()
+        self.samples: dict[Key, list[Any]] = dict()
+
+    def report(
+        self,
+        kind: str,
+        owner: str,
+        key: str,
+        value: Any,
+        expected: Optional[str] = None,
+    ) -> None:
+        """
+        :param kind: One of the kinds of problems defined in this module.
+        :param owner: The name of the class reporting the problem.
+        :param key: The property concerned.
+        :param value: The offending value.
+        :param expected: The expected type, for type errors.
+        """
+        counter_key = (kind, owner, key)
+        self.counts[counter_key] += 1
+        samples = self.samples.setdefault(counter_key, [])
+        if len(samples) < self.max_samples:
+            samples.append(value)
+        if self.echo:
+            print(message(kind, key, value, expected), file=sys.stderr)
+
+    def total(self, kind: Optional[str] = None) -> int:
+        """
+        :return: The number of problems reported, of a kind or of any kind.
+        """
+        return sum(
+            count
+            for (counted_kind, _, _), count in self.counts.items()
+            if kind is None or counted_kind == kind
+        )
+
+    def summary(self) -> str:
+        """
+        :return: One line per kind, class and property with problems, most frequent first, giving the count and the sampled values.
+        """
+        return "\n".join(
+            "%d %s %s %s: %s"
+            % (
+                count,
+                kind,
+                owner,
+                key,
+                ", ".join(repr(value) for value in self.samples[(kind, owner, key)]),
+            )
+            for (kind, owner, key), count in self.counts.most_common()
+        )
+
+    def clear(self) -> None:
+        self.counts.clear()
+        self.samples.clear()
+
+
+def message(kind: str, key: str, value: Any, expected: Optional[str] = None) -> str:
+    """
+    :return: The message printed for a problem when diagnostics are echoed.
+    """
+    if kind == WRONG_TYPE:
+        return f"Value provided for {key} is not of type {expected}: value provided: {value}"
+    if kind == WRONG_ITEM_TYPE:
+        return f"One of the items provided for {key} is not of type {expected}: items provided: {value}"
+    return f"{value}: {kind}"
+
+
+# Problems are counted, and not printed, unless another collector is selected.
+_diagnostics = Diagnostics()
+
+
+def get_diagnostics() -> Diagnostics:
+    """
+    :return: The collector problems are currently reported to.
+    """
+    return _diagnostics
+
+
+def set_diagnostics(diagnostics: Diagnostics) -> None:
+    """
+    Select the collector problems are reported to, for the whole process.
+    """
+    global _diagnostics
+    _diagnostics = diagnostics
+
+
+@contextlib.contextmanager
+def collecting(max_samples: int = 5, echo: bool = False) -> Iterator[Diagnostics]:
+    """
+    Report problems to a new collector within a ``with`` block, which does not print them unless echo is True.
+    """
+    previous = _diagnostics
+    diagnostics = Diagnostics(max_samples=max_samples, echo=echo)
+    set_diagnostics(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        set_diagnostics(previous)
+
+
+def report(
+    kind: str, owner: str, key: str, value: Any, expected: Optional[str] = None
+) -> None:
+    """
+    Report a problem to the selected collector.  See Diagnostics.report().
+    """
+    _diagnostics.report(kind, owner, key, value, expected)
@@ -1,9 +1,67 @@
-from .base import Facet
-from .case import *
-from .uco import *
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping
 
-submodules = [v for k, v in globals().items() if k[:2] != "__" and k != "Facet"]
+if TYPE_CHECKING:
+    from .base import Facet
 
-directory: dict[str, type[Facet]] = dict()
-for submodule in submodules:
-    directory |= submodule.directory
+# The module defining the classes of each prefix.
+_prefix_modules = {
+    "case-investigation": ".case.investigation",
+    "uco-action": ".uco.action",
+    "uco-core": ".uco.core",
+    "uco-identity": ".uco.identity",
+    "uco-location": ".uco.location",
+    "uco-observable": ".uco.observable",
+    "uco-role": ".uco.role",
+    "uco-tool": ".uco.tool",
+    "uco-types": ".uco.types",
+}
+
+
+class Directory(Mapping[str, "type[Facet]"]):
+    """
+    A read-only mapping of a class's ``@type`` value to the class, for every class of the ``case`` and ``uco`` packages.
+
+    The module defining a class is imported when its type is first looked up, so looking up ``uco-core:Bundle`` does not import ``uco.observable``.  Iterating over the directory, or taking its length, imports every module.
+
+    >>> directory["uco-core:Bundle"].__name__
+    'Bundle'
+    >>> "uco-observable:FileFacet" in directory
+    True
+    >>> "uco-observable:NoSuchFacet" in directory
+    False
+    """
+
+    def __getitem__(self, key: str) -> "type[Facet]":
+        prefix, _, _ = key.partition(":")
+        module_name = _prefix_modules.get(prefix)
+        if module_name is None:
+            raise KeyError(key)
+        return _import(module_name).directory[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for module_name in _prefix_modules.values():
+            yield from _import(module_name).directory
+
+    def __len__(self) -> int:
+        return sum(
+            len(_import(module_name).directory)
+            for module_name in _prefix_modules.values()
+        )
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (type(self).__name__, dict(self))
+
+
+def _import(module_name: str) -> ModuleType:
+    return importlib.import_module(module_name, __package__)
+
+
+directory = Directory()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "submodules":
+        return [_import(module_name) for module_name in _prefix_modules.values()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
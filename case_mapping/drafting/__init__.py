@@ -1 +1,13 @@
-from . import entities
+from typing import Any, List
+
+from .. import _import_submodule
+
+__all__ = ["entities"]
+
+
+def __getattr__(name: str) -> Any:
+    return _import_submodule(__name__, __all__, name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,239 @@
+import argparse
+import os
+import sys
+from typing import Any, Iterator, Mapping, Optional, Union
+
+from .compact import NODE, NODES, PLAIN, REFERENCE, REFERENCES, CompactThing
+
+MEMBER_KEYS = ("uco-core:object", "@graph")
+
+# (@id of the node holding the reference, its @type, property, @id referenced)
+Reference = tuple[Optional[str], Any, str, str]
+
+
+class ReferenceReport:
+    def __init__(
+        self,
+        node_count: int,
+        references: list[Reference],
+        dangling: list[Reference],
+        orphans: list[tuple[str, Any]],
+    ) -> None:
+        """
+        The result of check_references().
+
+        :param node_count: The number of nodes with an ``@id``, including nested nodes such as Facets.
+        :param references: Every ``{"@id": ...}`` reference found.
+        :param dangling: The references to an ``@id`` no node has.
+        :param orphans: The (``@id``, ``@type``) of the members of the Bundle no other node references, and which reference no other node.
+        """
+        self.node_count = node_count
+        self.references = references
+        self.dangling = dangling
+        self.orphans = orphans
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if no reference is dangling.  Orphans are allowed.
+        """
+        return not self.dangling
+
+    def summary(self, max_lines: int = 20) -> str:
+        """
+        :return: The counts, followed by up to max_lines dangling references and max_lines orphans.
+        """
+        lines = [
+            "%d nodes, %d references, %d dangling, %d orphaned"
+            % (
+                self.node_count,
+                len(self.references),
+                len(self.dangling),
+                len(self.orphans),
+            )
+        ]
+        for source, source_type, key, target in self.dangling[:max_lines]:
+            lines.append(
+                "DANGLING %s %s %s -> %s"
+                % (_type_name(source_type), source, key, target)
+            )
+        for node_id, node_type in self.orphans[:max_lines]:
+            lines.append("ORPHANED %s %s" % (_type_name(node_type), node_id))
+        return "\n".join(lines)
+
+
+def check_references(
+    source: Union[Mapping[str, Any], str, "os.PathLike[str]"],
+) -> ReferenceReport:
+    """
+    Check that every ``{"@id": ...}`` reference in a Bundle, e.g. written by ``_node_reference_vars()`` or an ``append_*_refs`` method, is to a node in the Bundle, walking the Bundle once.  Nodes are the members of the Bundle, the nodes nested in them, such as Facets, and the Bundle itself.
+
+    This is much faster than a SHACL validation, which also finds dangling references, and so is suited to checking Bundles before they are validated.
+
+    :param source: A Bundle, including one spilled to a SpillStore, or the path of a Bundle file, whose members are then read one at a time, as by ``case_mapping.loader.iter_bundle_objects()``.
+
+    >>> from case_mapping import uco
+    >>> performer = uco.identity.Identity()
+    >>> action = uco.action.Action(performer=performer)
+    >>> unused = uco.observable.ObservableObject()
+    >>> bundle = uco.core.Bundle(core_objects=[action, unused])
+    >>> report = check_references(bundle)
+    >>> report.ok, report.dangling[0][2:] == ("uco-action:performer", performer.get_id())
+    (False, True)
+    >>> bundle.append_to_uco_object(performer)
+    >>> report = check_references(bundle)
+    >>> report.ok, report.orphans == [(unused.get_id(), "uco-observable:ObservableObject")]
+    (True, True)
+    """
+    defined: set[str] = set()
+    references: list[Reference] = list()
+    # The number of references found before each member, and the @id and @type of the member.
+    members: list[tuple[int, Optional[str], Any]] = list()
+    # The Bundle's own properties, other than its members.
+    bundle: dict[str, Any] = dict()
+    for key, value in _bundle_items(source):
+        if key in MEMBER_KEYS:
+            members.append((len(references), *_identify(value)))
+            _scan(value, defined, references)
+        elif key != "@context":
+            bundle[key] = value
+    members.append((len(references), None, None))
+    _scan(bundle, defined, references)
+
+    referenced = {target for _, _, _, target in references}
+    dangling = [reference for reference in references if reference[3] not in defined]
+
+    orphans = list()
+    for (start, member_id, member_type), (end, _, _) in zip(members, members[1:]):
+        if member_id is None or member_id in referenced:
+            continue
+        if not any(
+            target != member_id and target in defined
+            for _, _, _, target in references[start:end]
+        ):
+            orphans.append((member_id, member_type))
+    return ReferenceReport(len(defined), references, dangling, orphans)
+
+
+def iter_references(node: Any) -> Iterator[Reference]:
+    """
+    Yield the ``{"@id": ...}`` references held by a node, or by the nodes nested in it, such as Facets.
+    """
+    references: list[Reference] = list()
+    _scan(node, set(), references)
+    yield from references
+
+
+def _bundle_items(
+    source: Union[Mapping[str, Any], str, "os.PathLike[str]"],
+) -> Iterator[tuple[str, Any]]:
+    """
+    Yield (key, value) for each property of a Bundle, except for its members, for which (key, member) is yielded for each member.
+    """
+    if not isinstance(source, Mapping):
+        from .compression import open_bundle
+        from .loader import _Scanner
+
+        with open_bundle(source) as fp:
+            yield from _Scanner(fp, 1 << 16).properties()
+        return
+    for key, value in source.items():
+        if key not in MEMBER_KEYS:
+            yield key, value
+    for key in MEMBER_KEYS:
+        if hasattr(source, "iter_members"):
+            members = source.iter_members(key)
+        else:
+            members = source.get(key) or []
+        for member in members:
+            yield key, member
+
+
+def _identify(node: Any) -> tuple[Optional[str], Any]:
+    if isinstance(node, CompactThing):
+        return node.get_id(), node.schema.type
+    return node.get("@id"), node.get("@type")
+
+
+def _scan(node: Any, defined: set[str], references: list[Reference]) -> None:
+    """
+    Add the @id of node, and of the nodes nested in it, to defined, and append the references they hold to references.
+    """
+    node_id = node.get_id() if isinstance(node, CompactThing) else node.get("@id")
+    if node_id is not None:
+        defined.add(node_id)
+    if isinstance(node, CompactThing):
+        values = iter(node.values)
+        for key, kind, _ in node.schema.entries:
+            if key == "@type":
+                continue
+            stored = next(values)
+            if kind == REFERENCE:
+                references.append((node.get_id(), node.schema.type, key, stored))
+            elif kind == REFERENCES:
+                for target in stored:
+                    references.append((node.get_id(), node.schema.type, key, target))
+            elif kind == NODE:
+                _scan(stored, defined, references)
+            elif kind == NODES:
+                for item in stored:
+                    _scan(item, defined, references)
+            elif kind == PLAIN and isinstance(stored, tuple):
+                _scan_value(node.get(key), node, key, defined, references)
+        return
+    for key, value in node.items():
+        if key != "@id" and key != "@type" and isinstance(value, (dict, list)):
+            _scan_value(value, node, key, defined, references)
+
+
+def _scan_value(
+    value: Any, holder: Any, key: str, defined: set[str], references: list[Reference]
+) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _scan_value(item, holder, key, defined, references)
+    elif isinstance(value, CompactThing):
+        _scan(value, defined, references)
+    elif isinstance(value, dict):
+        if "@id" in value:
+            if len(value) == 1:
+                holder_id, holder_type = _identify(holder)
+                # Keys and types read from a file are new strings for every node.
+                if isinstance(holder_type, str):
+                    holder_type = sys.intern(holder_type)
+                references.append(
+                    (holder_id, holder_type, sys.intern(key), value["@id"])
+                )
+            else:
+                _scan(value, defined, references)
+        elif "@value" not in value:
+            # A blank node, e.g. an olo:slot entry, whose references are reported with the property holding them, e.g. olo:item.
+            for inner_key, item in value.items():
+                if inner_key != "@type":
+                    _scan_value(item, holder, inner_key, defined, references)
+
+
+def _type_name(node_type: Any) -> str:
+    if isinstance(node_type, list):
+        return ",".join(map(str, node_type))
+    return "" if node_type is None else str(node_type)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m case_mapping.integrity",
+        description="Report dangling and orphaned references in Bundle files.",
+    )
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("--max-lines", type=int, default=20)
+    args = parser.parse_args()
+    failed = False
+    for path in args.paths:
+        report = check_references(path)
+        print("%s: %s" % (path, report.summary(args.max_lines)))
+        failed = failed or not report.ok
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
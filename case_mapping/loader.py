@@ -0,0 +1,352 @@
+import contextlib
+import gc
+import json
+import os
+from typing import IO, Any, Iterable, Iterator, Mapping, Optional, Union
+
+from .base import UcoThing
+from .compression import decompress, open_bundle
+from .directory import directory as default_directory
+from .uco.core import Bundle
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+DEFAULT_PREFIX_IRI = "http://example.org/kb/"
+
+MEMBER_KEYS = ("uco-core:object", "@graph")
+
+_whitespace = " \t\n\r"
+
+
+class Rehydrator:
+    def __init__(
+        self,
+        context: Optional[Mapping[str, Any]] = None,
+        directory: Optional[Mapping[str, type]] = None,
+    ) -> None:
+        """
+        Turns parsed JSON-LD nodes back into instances of the classes of this package, looked up by ``@type`` in a directory.
+
+        Instances are created without calling their constructors, so the type-checking and encoding of each argument is skipped: the properties of a node are copied into the instance as they are.  Only nodes with an ``@id`` and a ``@type`` found in the directory are rehydrated, as the first of their types found if they have several; other dictionaries, such as typed literals, references, and nodes of unknown types, are kept as they are.  Nested nodes, such as Facets, are rehydrated as well.
+
+        The ``prefix_label`` of an instance is the prefix of its ``@id``, and its ``prefix_iri`` is the IRI the context maps that prefix to.
+
+        :param context: A JSON-LD context, e.g. a Bundle's ``@context``, mapping prefixes to IRIs.
+        :param directory: A mapping of ``@type`` values to classes.  Defaults to ``case_mapping.directory.directory``.
+        """
+        self.context: Mapping[str, Any] = context or dict()
+        self.directory = default_directory if directory is None else directory
+        self._classes: dict[str, Optional[type[UcoThing]]] = dict()
+
+    def rehydrate(self, value: Any) -> Any:
+        """
+        :return: value, with the nodes it holds rehydrated.  Lists and plain dictionaries are modified in place.
+        """
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                if isinstance(item, (dict, list)):
+                    value[index] = self.rehydrate(item)
+            return value
+        if not isinstance(value, dict) or "@value" in value:
+            return value
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = self.rehydrate(item)
+        types = value.get("@type")
+        if "@id" not in value or types is None:
+            return value
+        if isinstance(types, str):
+            cls = self._class(types)
+        else:
+            # The first type of a multi-typed node found in the directory, e.g. "drafting:SocialMediaActivityFacet" in ["drafting:SocialMediaActivityFacet", "uco-core:Facet"].
+            cls = next(
+                (
+                    self._class(type_)
+                    for type_ in types
+                    if isinstance(type_, str) and self._class(type_) is not None
+                ),
+                None,
+            )
+        if cls is None:
+            return value
+        thing = cls.__new__(cls)
+        thing.update(value)
+        prefix_label, colon, _ = value["@id"].partition(":")
+        if colon:
+            thing.prefix_label = prefix_label
+            thing.prefix_iri = self.context.get(prefix_label, DEFAULT_PREFIX_IRI)
+        else:
+            thing.prefix_label = "kb"
+            thing.prefix_iri = DEFAULT_PREFIX_IRI
+        if isinstance(thing, Bundle):
+            self._index_bundle(thing)
+        return thing
+
+    def _class(self, type_: str) -> Optional[type[UcoThing]]:
+        try:
+            return self._classes[type_]
+        except KeyError:
+            cls = self.directory.get(type_)
+            if not (isinstance(cls, type) and issubclass(cls, UcoThing)):
+                cls = None
+            self._classes[type_] = cls
+            return cls
+
+    @staticmethod
+    def _index_bundle(bundle: Bundle) -> None:
+        # Set the state Bundle.__init__ would have.
+        bundle.build = []  # type: ignore
+        bundle._objects_by_id = dict()
+        for key in ("uco-core:object", "@graph"):
+            for item in bundle.get(key) or []:
+                # Members of types not in the directory are left as dictionaries, and indexed too.
+                if isinstance(item, dict) and isinstance(item.get("@id"), str):
+                    bundle._objects_by_id.setdefault(item["@id"], item)
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector, which would otherwise traverse the growing document over and over as the parser allocates its containers.  Parsed JSON holds no reference cycles, so there is nothing for it to collect.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def loads(
+    data: Union[str, bytes], *, directory: Optional[Mapping[str, type]] = None
+) -> Any:
+    """
+    Parse a JSON-LD document, such as a Bundle written by this package, and rehydrate its nodes with a Rehydrator.  The document is parsed with orjson if it is installed.
+
+    A loaded Bundle can be amended with its append methods, e.g. ``append_to_uco_object``, and written out again.
+
+    :param data: The JSON text, or its UTF-8 encoding, which may be compressed with one of the compressions of ``case_mapping.compression``.
+    :param directory: As for Rehydrator.
+    :return: The rehydrated top-level value, e.g. a Bundle.
+
+    >>> from case_mapping import uco
+    >>> bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    >>> loaded = loads(bundle.dumps())
+    >>> type(loaded).__name__, type(loaded["uco-core:object"][0]).__name__
+    ('Bundle', 'Identity')
+    >>> loaded == bundle
+    True
+    """
+    if isinstance(data, bytes):
+        data = decompress(data)
+    with _gc_paused():
+        document = orjson.loads(data) if orjson is not None else json.loads(data)
+        context = document.get("@context") if isinstance(document, dict) else None
+        return Rehydrator(
+            context if isinstance(context, dict) else None, directory
+        ).rehydrate(document)
+
+
+def load(
+    source: Union[str, "os.PathLike[str]", IO[str], IO[bytes]],
+    *,
+    directory: Optional[Mapping[str, type]] = None,
+) -> Any:
+    """
+    As loads(), reading the document from a path or a file handle.  A compressed file is decompressed if it is read from a path or a binary file handle.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            return loads(fp.read(), directory=directory)
+    return loads(source.read(), directory=directory)
+
+
+class _Scanner:
+    """
+    Reads the top level of a JSON document from a text file handle piecewise, decoding one value at a time with json.JSONDecoder.raw_decode, and holding in memory only the value being decoded and what remains of the last read.
+
+    If track_bytes is True, the UTF-8 byte offsets of the start and end of the last decoded value are kept in ``span``.  The file handle must then not translate newlines, i.e. be opened with ``newline=""``.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int, track_bytes: bool = False) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.track_bytes = track_bytes
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+        self.span = (0, 0)
+        # A position in the buffer, and its byte offset in the document.
+        self._mark = 0
+        self._mark_offset = 0
+
+    def read(self, size: int) -> None:
+        if self.track_bytes:
+            self._byte_offset(self.position)
+            self._mark = 0
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+    def peek(self) -> str:
+        """
+        :return: The next character other than whitespace, which is not consumed, or "" at the end of the document.
+        """
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in _whitespace
+            ):
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position : self.position + 1]
+            self.read(self.chunk_size)
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(
+                "Expected one of %r at character %d of the read buffer, found %r."
+                % (characters, self.position, character)
+            )
+        self.position += 1
+        return character
+
+    def value(self) -> Any:
+        self.peek()
+        start = self._byte_offset(self.position) if self.track_bytes else 0
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next read.
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    if self.track_bytes:
+                        self.span = (start, self._byte_offset(end))
+                    return value
+            # Read at least as much as is buffered, so a value spanning many reads is decoded a number of times logarithmic, not linear, in its size.
+            self.read(max(self.chunk_size, len(self.buffer) - self.position))
+
+    def properties(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yield (key, value) for each property of the top-level JSON object, except for the member arrays, for which (key, member) is yielded for each member.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            if key in MEMBER_KEYS:
+                self.expect("[")
+                if self.peek() == "]":
+                    self.position += 1
+                else:
+                    while True:
+                        yield key, self.value()
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                yield key, self.value()
+            if self.expect(",}") == "}":
+                return
+
+    def _byte_offset(self, position: int) -> int:
+        segment = self.buffer[self._mark : position]
+        self._mark_offset += (
+            len(segment) if segment.isascii() else len(segment.encode("utf-8"))
+        )
+        self._mark = position
+        return self._mark_offset
+
+
+def iter_bundle_objects(
+    source: Union[str, "os.PathLike[str]", IO[str]],
+    *,
+    types: Optional[Iterable[Union[str, type]]] = None,
+    rehydrate: bool = False,
+    directory: Optional[Mapping[str, type]] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """
+    Iterate over the members of a Bundle's ``uco-core:object`` and ``@graph`` arrays, in the order they are written, reading the file incrementally so only one member at a time is held in memory.
+
+    Other properties of the Bundle are read and discarded, apart from its ``@context``, which is used when rehydrating members if it is written before them, as BundleWriter does.
+
+    :param source: A path, or a text file handle, of a JSON-LD document whose top level is a Bundle.  A file read from a path is decompressed if it is compressed, as by ``case_mapping.compression.open_bundle()``.
+    :param types: Only yield members with one of these ``@type`` values, or whose ``@type`` is that of a subclass of one of these classes in the directory.
+    :param rehydrate: Yield members rehydrated into instances of their classes, as load() does, rather than dictionaries.
+    :param directory: As for Rehydrator.
+    :param chunk_size: The number of characters read at a time.
+
+    >>> import io
+    >>> from case_mapping import uco
+    >>> bundle = uco.core.Bundle(core_objects=[uco.identity.Identity(), uco.observable.ObservableObject()])
+    >>> fp = io.StringIO(bundle.dumps())
+    >>> [member["@type"] for member in iter_bundle_objects(fp)]
+    ['uco-identity:Identity', 'uco-observable:ObservableObject']
+    >>> fp.seek(0)
+    0
+    >>> [type(member).__name__ for member in iter_bundle_objects(fp, types=[uco.observable.ObservableObject], rehydrate=True)]
+    ['ObservableObject']
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open_bundle(source) as fp:
+            yield from iter_bundle_objects(
+                fp,
+                types=types,
+                rehydrate=rehydrate,
+                directory=directory,
+                chunk_size=chunk_size,
+            )
+        return
+
+    lookup = default_directory if directory is None else directory
+    type_names = set()
+    classes: list[type] = list()
+    for type_ in types or ():
+        if isinstance(type_, str):
+            type_names.add(type_)
+        else:
+            classes.append(type_)
+    matches: dict[str, bool] = dict()
+
+    def is_selected(node: Any) -> bool:
+        if types is None:
+            return True
+        node_types = node.get("@type") if isinstance(node, dict) else None
+        if isinstance(node_types, str):
+            node_types = [node_types]
+        for node_type in node_types or ():
+            if node_type not in matches:
+                cls = lookup.get(node_type) if classes else None
+                matches[node_type] = node_type in type_names or (
+                    isinstance(cls, type) and issubclass(cls, tuple(classes))
+                )
+            if matches[node_type]:
+                return True
+        return False
+
+    context: Optional[dict[str, Any]] = None
+    rehydrator: Optional[Rehydrator] = None
+    for key, value in _Scanner(source, chunk_size).properties():
+        if key in MEMBER_KEYS:
+            if is_selected(value):
+                if rehydrate:
+                    if rehydrator is None:
+                        rehydrator = Rehydrator(context, directory)
+                    value = rehydrator.rehydrate(value)
+                yield value
+        elif key == "@context" and isinstance(value, dict):
+            context = value
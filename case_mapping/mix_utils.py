@@ -1,4 +1,5 @@
-from typing import Any, Callable
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
 
 
 def check_value(
@@ -6,7 +7,7 @@ def check_value(
     value: str,
     list_values: list[str],
     list_objects: list[dict[str, Any]],
-    observable_generating_f: Callable[..., dict[str, Any]]
+    observable_generating_f: Callable[..., dict[str, Any]],
 ) -> dict[str, Any]:
     """It checks if a specific value has been already generated related to an ObservableObject relying on
     the list of its values. This is meant to avoid duplication in the JSON/CASE file generated by the
@@ -19,6 +20,8 @@ def check_value(
     Finally the new ObservableObject is added to the list_objects (any kind of ObservableObject maintains a different list).
     If the value is already in the list_values, the ObservableObject list_objects[index] is returned.
 
+    Each call scans list_values, so parsers handling many distinct values should use a DedupRegistry instead.
+
     :param value: the value to be checked within the list_values
     :param list_values: the current list of values
     :param list_objects: the current list of a specific kind of ObservableObject
@@ -26,12 +29,127 @@ def check_value(
     :param *args: the actual parameter of the observable_generating_f function
     :return: an Observableobject of a specific kind depending by the actual parameters
     """
-    if value in list_values:
+    try:
         idx = list_values.index(value)
-        observable_app = list_objects[idx]
-    else:
+    except ValueError:
         observable_app = observable_generating_f(*args)
         list_values.append(value)
         list_objects.append(observable_app)
+    else:
+        observable_app = list_objects[idx]
 
     return observable_app
+
+
+class DedupRegistry:
+    """
+    A hash-indexed alternative to check_value, keeping the generated ObservableObjects of each kind in a dictionary keyed by value, so a lookup costs the same regardless of how many values have been seen.
+
+    Each kind of ObservableObject (e.g. "application", "url", "coordinates") has its own namespace.  If maxsize is given, each namespace keeps at most that many entries, evicting the least recently used one; an evicted value will generate a new ObservableObject if it is seen again.
+
+    >>> registry = DedupRegistry()
+    >>> def generate_app(app_name):
+    ...     return {"@type": "uco-observable:ApplicationFacet", "uco-core:name": app_name}
+    >>> app_1 = registry.check_value("Safari", value="Safari", kind="application", observable_generating_f=generate_app)
+    >>> app_2 = registry.check_value("Safari", value="Safari", kind="application", observable_generating_f=generate_app)
+    >>> app_1 is app_2
+    True
+    >>> registry.hits, registry.misses
+    (1, 1)
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        """
+        :param maxsize: the maximum number of values remembered per kind, or None for no bound
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive integer or None.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._namespaces: dict[str, dict[Hashable, Any]] = dict()
+        self._kind_hits: dict[str, int] = dict()
+        self._kind_misses: dict[str, int] = dict()
+
+    def check_value(
+        self,
+        *args: Any,
+        value: Hashable,
+        observable_generating_f: Callable[..., Any],
+        kind: str = "default",
+    ) -> Any:
+        """
+        The same contract as check_value, with the list_values and list_objects arguments replaced by the kind namespace.
+
+        :param value: the value to be checked within the kind namespace
+        :param observable_generating_f: the function that will generate the corresponding kind of ObservableObject
+        :param kind: the namespace of the kind of ObservableObject
+        :param *args: the actual parameter of the observable_generating_f function
+        :return: an Observableobject of a specific kind depending by the actual parameters
+        """
+        namespace = self._namespaces.get(kind)
+        if namespace is None:
+            namespace = self._namespaces[kind] = (
+                dict() if self.maxsize is None else OrderedDict()
+            )
+        observable = namespace.get(value, _MISSING)
+        if observable is not _MISSING:
+            self.hits += 1
+            self._kind_hits[kind] = self._kind_hits.get(kind, 0) + 1
+            if self.maxsize is not None:
+                namespace.move_to_end(value)  # type: ignore
+            return observable
+
+        self.misses += 1
+        self._kind_misses[kind] = self._kind_misses.get(kind, 0) + 1
+        observable = observable_generating_f(*args)
+        namespace[value] = observable
+        if self.maxsize is not None and len(namespace) > self.maxsize:
+            namespace.popitem(last=False)  # type: ignore
+        return observable
+
+    def get(self, value: Hashable, kind: str = "default", default: Any = None) -> Any:
+        """
+        Return the ObservableObject generated for value, without generating one or counting a hit or miss.
+        """
+        return self._namespaces.get(kind, {}).get(value, default)
+
+    def contains(self, value: Hashable, kind: str = "default") -> bool:
+        return value in self._namespaces.get(kind, {})
+
+    def kinds(self) -> list[str]:
+        return list(self._namespaces)
+
+    def values(self, kind: str = "default") -> list[Hashable]:
+        """
+        The equivalent of check_value's list_values: the values remembered for kind, oldest (or least recently used) first.
+        """
+        return list(self._namespaces.get(kind, {}))
+
+    def objects(self, kind: str = "default") -> list[Any]:
+        """
+        The equivalent of check_value's list_objects: the ObservableObjects remembered for kind, in the order of values().
+        """
+        return list(self._namespaces.get(kind, {}).values())
+
+    def stats(self, kind: Optional[str] = None) -> dict[str, int]:
+        """
+        :return: hit, miss and size counters, for a single kind or, if kind is None, for all kinds together
+        """
+        if kind is None:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": sum(len(namespace) for namespace in self._namespaces.values()),
+            }
+        return {
+            "hits": self._kind_hits.get(kind, 0),
+            "misses": self._kind_misses.get(kind, 0),
+            "size": len(self._namespaces.get(kind, {})),
+        }
+
+    def __len__(self) -> int:
+        return self.stats()["size"]
+
+
+_MISSING = object()
@@ -0,0 +1,252 @@
+import re
+from typing import Any, Dict, Iterator, List, Mapping, Optional, TextIO
+from urllib.parse import urljoin
+
+from . import diagnostics
+from .base import UcoThing, unpack_args_array
+from .compact import CompactThing
+from .uco.core import MEMBER_KEYS, Bundle
+
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+_literal_escapes = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+# Characters not allowed in an N-Triples IRI reference, which are percent-encoded.
+_iri_invalid = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+_iri_scheme = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+
+
+class NTriplesEmitter:
+    def __init__(self, context: Mapping[str, Any]) -> None:
+        """
+        Converts JSON-LD nodes, as built by this package, to N-Triples or N-Quads statements, without an intermediate RDF graph.
+
+        Compact IRIs are expanded with the prefixes of the given ``@context``, e.g. a Bundle's.  Relative IRIs, such as an ``@id`` without a prefix, are resolved against the context's ``@base``, and raise a ValueError if it has none.  Characters not allowed in N-Triples IRIs, such as spaces and ``>``, are percent-encoded.  Only the JSON-LD features this package generates are supported: prefixed names, ``@vocab``, ``@type``, ``@id`` references, typed literals, nested nodes and arrays.  Nested nodes without an ``@id`` become blank nodes.
+
+        :param context: A JSON-LD context mapping prefixes to IRIs, e.g. ``bundle["@context"]``.
+        """
+        self.context = context
+        self.vocab = context.get("@vocab", "")
+        self._term_cache: Dict[str, str] = dict()
+        self._blank_node_count = 0
+
+    def statements(
+        self, node: Mapping[str, Any], graph: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield one N-Triples line (or N-Quads line, if a graph IRI is given) per statement about node and the nodes nested in it.
+        """
+        yield from self._node_statements(node, self._graph_label(graph))
+
+    def reference(self, node: Mapping[str, Any]) -> str:
+        """
+        :return: The N-Triples term of a node's ``@id``.
+        """
+        return self._iri(node["@id"])
+
+    def _node_statements(
+        self, node: Mapping[str, Any], graph_label: str, subject: Optional[str] = None
+    ) -> Iterator[str]:
+        if isinstance(node, CompactThing):
+            node = node.expand()
+        if subject is None:
+            subject = self._subject(node)
+        for key, value in node.items():
+            if key == "@type":
+                types = value if isinstance(value, list) else [value]
+                for type_ in types:
+                    yield f"{subject} <{RDF_TYPE}> {self.term(type_)}{graph_label} .\n"
+                continue
+            if key.startswith("@") or value is None:
+                continue
+            predicate = self.term(key)
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                nested: List[Mapping[str, Any]] = list()
+                obj = self._object(item, nested)
+                if obj is None:
+                    continue
+                yield f"{subject} {predicate} {obj}{graph_label} .\n"
+                for nested_node in nested:
+                    yield from self._node_statements(nested_node, graph_label, obj)
+
+    def _subject(self, node: Mapping[str, Any]) -> str:
+        if "@id" in node:
+            return self._iri(node["@id"])
+        self._blank_node_count += 1
+        return f"_:b{self._blank_node_count}"
+
+    def _object(self, value: Any, nested: List[Mapping[str, Any]]) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, (Mapping, CompactThing)):
+            if isinstance(value, CompactThing):
+                value = value.expand()
+            if "@value" in value:
+                return self._literal(value["@value"], value.get("@type"))
+            if len(value) == 1 and "@id" in value:
+                return self._iri(value["@id"])
+            subject = self._subject(value)
+            nested.append(value)
+            return subject
+        return self._literal(value, None)
+
+    def _literal(self, value: Any, datatype: Optional[str]) -> str:
+        if isinstance(value, bool):
+            lexical = "true" if value else "false"
+            datatype = datatype or "xsd:boolean"
+        elif isinstance(value, int):
+            lexical = str(value)
+            datatype = datatype or "xsd:integer"
+        elif isinstance(value, float):
+            lexical = ("%1.15E" % value).replace("+", "")
+            datatype = datatype or "xsd:double"
+        else:
+            lexical = str(value)
+        escaped = lexical.translate(_literal_escapes)
+        datatype_term = None if datatype is None else self.term(datatype)
+        if datatype_term is None or datatype_term == f"<{XSD}string>":
+            return f'"{escaped}"'
+        return f'"{escaped}"^^{datatype_term}'
+
+    def term(self, term: str) -> str:
+        """
+        :return: The N-Triples term of a property, class or datatype name, which is expanded against ``@vocab`` if it has no prefix.
+        """
+        cached = self._term_cache.get(term)
+        if cached is None:
+            if ":" in term:
+                cached = self._iri(term)
+            else:
+                cached = f"<{self.vocab}{term}>"
+            self._term_cache[term] = cached
+        return cached
+
+    def _iri(self, iri: str) -> str:
+        """
+        The N-Triples term of a node identifier, which is expanded if it is a compact IRI using a prefix of the context, or resolved against the context's ``@base`` if it is relative.
+        """
+        if iri.startswith("_:"):
+            return iri
+        prefix, colon, suffix = iri.partition(":")
+        namespace = None
+        if colon and not suffix.startswith("//"):
+            namespace = self.context.get(prefix)
+        if isinstance(namespace, str):
+            iri = namespace + suffix
+        elif not _iri_scheme.match(iri):
+            base = self.context.get("@base")
+            if not isinstance(base, str):
+                raise ValueError(
+                    "'%s' is neither an absolute nor a compact IRI, and the context has no @base to resolve it against."
+                    % iri
+                )
+            iri = urljoin(base, iri)
+        return "<" + _iri_invalid.sub(_percent_encode, iri) + ">"
+
+    def _graph_label(self, graph: Optional[str]) -> str:
+        return "" if graph is None else " " + self._iri(graph)
+
+
+def _percent_encode(match: "re.Match[str]") -> str:
+    return "%%%02X" % ord(match.group())
+
+
+class NTriplesWriter:
+    def __init__(self, fp: TextIO, bundle: Bundle, *, quads: bool = False) -> None:
+        """
+        Writes a Bundle as N-Triples, or as N-Quads, one statement per line, as members are appended, in the manner of ``case_mapping.writer.BundleWriter``.
+
+        Statements about members of the Bundle's ``@graph`` are placed in the default graph for N-Triples, and in the graph named by the Bundle's ``@id`` for N-Quads, as a JSON-LD processor would.
+
+        :param fp: A text file handle to write to.
+        :param bundle: The Bundle supplying the ``@context`` and Bundle-level statements.
+        :param quads: Write N-Quads rather than N-Triples.
+
+        Examples
+        ========
+
+        >>> import io
+        >>> from case_mapping import uco
+        >>> bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+        >>> fp = io.StringIO()
+        >>> with NTriplesWriter(fp, bundle) as writer:
+        ...     writer.append_to_uco_object(uco.observable.ObservableObject())
+        >>> print(fp.getvalue().count("<https://ontology.unifiedcyberontology.org/uco/core/object>"))
+        2
+        """
+        self.fp = fp
+        self.bundle = bundle
+        self.quads = quads
+        self.emitter = NTriplesEmitter(bundle["@context"])
+        self._subject = self.emitter.reference(bundle)
+        self._object_predicate = self.emitter.term("uco-core:object")
+        self._opened = False
+
+    def __enter__(self) -> "NTriplesWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        pass
+
+    def open(self) -> None:
+        """
+        Write the statements about the Bundle itself and the members it already holds, including those it spilled to a ``case_mapping.spill.SpillStore``.
+        """
+        if self._opened:
+            raise ValueError("NTriplesWriter has already been opened.")
+        self._opened = True
+        self.fp.writelines(
+            self.emitter.statements(
+                {
+                    key: value
+                    for key, value in self.bundle.items()
+                    if key not in MEMBER_KEYS
+                }
+            )
+        )
+        for item in self.bundle.iter_members("uco-core:object"):
+            self._write_object(item)
+        graph = self.bundle.get_id() if self.quads else None
+        for item in self.bundle.iter_members("@graph"):
+            self.fp.writelines(self.emitter.statements(item, graph))
+
+    @unpack_args_array
+    def append_to_uco_object(self, *args) -> None:
+        """
+        Write the statements about a single/tuple of object(s), linked to the Bundle with ``uco-core:object``.
+        """
+        for item in self._members("uco-core:object", *args):
+            self._write_object(item)
+
+    def _write_object(self, item: Any) -> None:
+        self.fp.write(
+            f"{self._subject} {self._object_predicate} {self.emitter.reference(item)} .\n"
+        )
+        self.fp.writelines(self.emitter.statements(item))
+
+    @unpack_args_array
+    def append_to_case_graph(self, *args) -> None:
+        """
+        Write the statements about a single/tuple of object(s) in the Bundle's ``@graph``.
+        """
+        graph = self.bundle.get_id() if self.quads else None
+        for item in self._members("@graph", *args):
+            self.fp.writelines(self.emitter.statements(item, graph))
+
+    def _members(self, key: str, *args: Any) -> Iterator[Any]:
+        if not self._opened:
+            raise ValueError("NTriplesWriter is not open.")
+        if len(args) == 1 and not args[0]:  # True if no objects to append provided
+            return
+        for item in args:
+            if isinstance(item, (UcoThing, CompactThing)):
+                yield item
+            else:
+                diagnostics.report(
+                    diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                )
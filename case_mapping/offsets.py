@@ -0,0 +1,153 @@
+import json
+import mmap
+import os
+from typing import Any, Iterator, Mapping, Optional, Union
+
+from .compression import is_compressed
+from .loader import MEMBER_KEYS, Rehydrator, _Scanner
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+Path = Union[str, "os.PathLike[str]"]
+
+INDEX_SUFFIX = ".offsets.json"
+
+
+def default_index_path(path: Path) -> str:
+    return os.fspath(path) + INDEX_SUFFIX
+
+
+def write_offset_index(
+    path: Path, index_path: Optional[Path] = None, *, chunk_size: int = 1 << 16
+) -> str:
+    """
+    Record the byte offsets of the start and end of every member of a Bundle file's ``uco-core:object`` and ``@graph`` arrays, by ``@id``, in a sidecar index file.  The Bundle file is read incrementally, as by ``case_mapping.loader.iter_bundle_objects()``.
+
+    Compressed Bundle files cannot be indexed.  The index also records the Bundle's ``@context``, and the size and modification time of the Bundle file, so an index left stale by rewriting the Bundle file is detected.  Of members sharing an ``@id``, the first is indexed.
+
+    :param path: The Bundle file.
+    :param index_path: The index file to write.  Defaults to the Bundle file's path, suffixed with ``.offsets.json``.
+    :return: The path of the index file.
+    """
+    if is_compressed(path):
+        raise ValueError(
+            "The Bundle file '%s' is compressed, and has no byte offsets to index.  Decompress it first."
+            % os.fspath(path)
+        )
+    index_path = default_index_path(path) if index_path is None else index_path
+    offsets: dict[str, tuple[int, int]] = dict()
+    context = None
+    with open(path, encoding="utf-8", newline="") as fp:
+        scanner = _Scanner(fp, chunk_size, track_bytes=True)
+        for key, value in scanner.properties():
+            if key in MEMBER_KEYS:
+                if isinstance(value, dict) and isinstance(value.get("@id"), str):
+                    offsets.setdefault(value["@id"], scanner.span)
+            elif key == "@context":
+                context = value
+        status = os.fstat(fp.fileno())
+    index = {
+        "size": status.st_size,
+        "mtime_ns": status.st_mtime_ns,
+        "@context": context,
+        "offsets": offsets,
+    }
+    with open(index_path, "w", encoding="utf-8") as fp:
+        json.dump(index, fp)
+    return os.fspath(index_path)
+
+
+class IndexedBundleReader(Mapping[str, Any]):
+    def __init__(
+        self,
+        path: Path,
+        index_path: Optional[Path] = None,
+        *,
+        rehydrate: bool = False,
+        directory: Optional[Mapping[str, type]] = None,
+    ) -> None:
+        """
+        A read-only mapping of the ``@id`` of each member of a Bundle file to the member, which is decoded from a memory map of the file on each lookup, at the byte offsets recorded by write_offset_index().
+
+        The index is written first if it does not exist, or if the Bundle file has changed since it was written.
+
+        :param path: The Bundle file.
+        :param index_path: As for write_offset_index().
+        :param rehydrate: Return members rehydrated into instances of their classes, as ``case_mapping.loader.load()`` does, rather than dictionaries.
+        :param directory: As for ``case_mapping.loader.Rehydrator``.
+
+        >>> import os, tempfile
+        >>> from case_mapping import uco
+        >>> identity = uco.identity.Identity()
+        >>> bundle = uco.core.Bundle(core_objects=[identity])
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = os.path.join(tmpdir, "case.jsonld")
+        ...     with open(path, "w") as fp:
+        ...         bundle.dump(fp)
+        ...     with IndexedBundleReader(path, rehydrate=True) as reader:
+        ...         found = reader[identity.get_id()]
+        >>> found == identity, type(found).__name__
+        (True, 'Identity')
+        """
+        self.path = os.fspath(path)
+        self.index_path = (
+            default_index_path(path) if index_path is None else os.fspath(index_path)
+        )
+        self._fp = open(self.path, "rb")
+        try:
+            index = self._read_index()
+            self._mmap = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._fp.close()
+            raise
+        self._offsets: dict[str, list[int]] = index["offsets"]
+        self._rehydrator = (
+            Rehydrator(index["@context"], directory) if rehydrate else None
+        )
+
+    def _read_index(self) -> dict[str, Any]:
+        status = os.fstat(self._fp.fileno())
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as fp:
+                index = _loads(fp.read())
+            if (index["size"], index["mtime_ns"]) == (
+                status.st_size,
+                status.st_mtime_ns,
+            ):
+                return index
+        write_offset_index(self.path, self.index_path)
+        with open(self.index_path, "rb") as fp:
+            return _loads(fp.read())
+
+    def __enter__(self) -> "IndexedBundleReader":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._fp.close()
+
+    def __getitem__(self, key: str) -> Any:
+        start, end = self._offsets[key]
+        member = _loads(self._mmap[start:end])
+        if self._rehydrator is not None:
+            member = self._rehydrator.rehydrate(member)
+        return member
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
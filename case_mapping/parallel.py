@@ -0,0 +1,53 @@
+from .loader import Rehydrator
+from .uco.core import Bundle, _member_id
+
+
+def merge_bundles(bundle: Bundle, *shards: Bundle) -> Bundle:
+    """
+    Merge the members of partial Bundles, including those spilled to a SpillStore, into a Bundle, in order, skipping any object whose ``@id`` is already in the Bundle.
+
+    The ``@context`` of each shard is merged into the Bundle's, so shards built with their own ``prefix_label`` and ``prefix_iri`` keep resolving.  A prefix mapped to two different IRIs raises a ValueError, as the compact IRIs using it would become ambiguous; the prefixes of all the shards are checked before the Bundle is changed.  Properties of the shards other than their ``@context`` and members, such as their own ``@id`` and name, are not merged.
+
+    Shards built by different processes mint random UUIDs, so their objects do not collide, unless identifiers are assigned with ``UcoThing.assign_content_id()``, in which case equal objects collapse to one.  Non-random UUIDs (``cdo_local_uuid.configure()``) repeat across processes, and should not be used for shards.
+
+    :param bundle: The Bundle to merge into.
+    :param shards: Partial Bundles, e.g. built by different processes.
+    :return: bundle
+
+    >>> from case_mapping import uco
+    >>> identity = uco.identity.Identity()
+    >>> shard_1 = uco.core.Bundle(core_objects=[identity])
+    >>> shard_2 = uco.core.Bundle(core_objects=[identity, uco.observable.ObservableObject(prefix_label="ex")], prefix_label="ex", prefix_iri="http://example.org/ex/")
+    >>> merged = merge_bundles(shard_1, shard_2)
+    >>> len(merged["uco-core:object"])
+    2
+    >>> merged["@context"]["ex"]
+    'http://example.org/ex/'
+    """
+    context = bundle["@context"]
+    prefixes: dict[str, str] = dict()
+    for shard in shards:
+        for prefix, iri in shard["@context"].items():
+            bound = context.get(prefix, prefixes.get(prefix))
+            if bound is None:
+                prefixes[prefix] = iri
+            elif bound != iri:
+                raise ValueError(
+                    "Prefix '%s' is mapped to both '%s' and '%s'.  Please revise the shards to use distinct prefix labels."
+                    % (prefix, bound, iri)
+                )
+    context.update(prefixes)
+    for shard in shards:
+        rehydrator = Rehydrator(shard["@context"])
+        # Including the members the shard spilled to a SpillStore, which are read back as dictionaries.
+        bundle.extend_uco_objects(
+            rehydrator.rehydrate(member) if type(member) is dict else member
+            for member in shard.iter_members("uco-core:object")
+            if _member_id(member) not in bundle
+        )
+        bundle.extend_case_graph(
+            rehydrator.rehydrate(member) if type(member) is dict else member
+            for member in shard.iter_members("@graph")
+            if _member_id(member) not in bundle
+        )
+    return bundle
@@ -0,0 +1,207 @@
+import argparse
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .base import Serializer, get_serializer
+from .compact import CompactThing
+from .integrity import MEMBER_KEYS, Reference, _identify, _scan
+from .uco.core import Bundle
+
+# Nodes kept, with everything they reference, by default.
+DEFAULT_ROOT_TYPES = (
+    "case-investigation:Investigation",
+    "case-investigation:InvestigativeAction",
+    "case-investigation:ProvenanceRecord",
+    "uco-action:Action",
+    "uco-core:Relationship",
+    "uco-observable:ObservableRelationship",
+)
+
+
+class PruneReport:
+    def __init__(self, pruned: list[str], nodes: int, size: int) -> None:
+        """
+        The result of prune().
+
+        :param pruned: The ``@id`` of the objects removed from the Bundle, in the order they were in.
+        :param nodes: The number of nodes removed, counting the nodes nested in the objects, such as Facets.
+        :param size: The number of bytes the objects took in the serialized Bundle, indented as members of the Bundle.
+        """
+        self.pruned = pruned
+        self.nodes = nodes
+        self.size = size
+
+    def summary(self) -> str:
+        return "%d objects, %d nodes, %d bytes pruned" % (
+            len(self.pruned),
+            self.nodes,
+            self.size,
+        )
+
+
+def prune(
+    bundle: Bundle,
+    root_types: Iterable[str] = DEFAULT_ROOT_TYPES,
+    root_ids: Iterable[str] = (),
+    *,
+    dry_run: bool = False,
+    indent: Optional[int] = 4,
+    serializer: Optional[str] = None,
+) -> PruneReport:
+    """
+    Remove the objects of a Bundle that cannot be reached from a set of root objects by following ``{"@id": ...}`` references, such as observables generated in advance, e.g. with ``case_mapping.mix_utils.check_value``, but never linked to by an action or a relationship.
+
+    The roots are the objects of the given types and ``@id`` values, and the objects the Bundle's own properties reference.  The Bundle is walked once to index the references held by each object, including those held by its nested nodes, such as Facets; a reference to a nested node reaches the object holding it.  An object holding a kept object in its ``uco-core:object``, such as an Investigation or a ProvenanceRecord, is kept too.
+
+    >>> from case_mapping import uco
+    >>> device = uco.observable.ObservableObject()
+    >>> action = uco.action.Action(objects=[device])
+    >>> bundle = uco.core.Bundle(core_objects=[action, device, uco.observable.ObservableObject()])
+    >>> report = prune(bundle)
+    >>> len(report.pruned), bundle["uco-core:object"] == [action, device]
+    (1, True)
+
+    :param bundle: The Bundle to prune.  A Bundle that has spilled objects to a SpillStore cannot be pruned.
+    :param root_types: The ``@type`` values of the roots.
+    :param root_ids: The ``@id`` values of further roots.
+    :param dry_run: Report what would be removed, without removing it.
+    :param indent: As for ``UcoThing.dumps()``, to measure the size of the removed objects.
+    :param serializer: As for ``UcoThing.dumps()``.
+    """
+    if bundle._spill_store is not None:
+        raise ValueError(
+            "A Bundle that has spilled objects to a SpillStore cannot be pruned."
+        )
+    root_types = frozenset(root_types)
+    roots = set(root_ids)
+    # The references held by each object, the object holding each nested node, and the objects holding each node with uco-core:object.
+    references: dict[str, list[Reference]] = dict()
+    owners: dict[str, str] = dict()
+    compilations: dict[str, list[str]] = dict()
+    nested_counts: dict[str, int] = dict()
+    member_ids: dict[str, list[Optional[str]]] = dict()
+    for key in MEMBER_KEYS:
+        member_ids[key] = ids = list()
+        for member in dict.get(bundle, key) or []:
+            member_id, member_type = _identify(member)
+            ids.append(member_id)
+            if member_id is None:
+                continue
+            if _has_type(member_type, root_types):
+                roots.add(member_id)
+            defined: set[str] = set()
+            references[member_id] = list()
+            _scan(member, defined, references[member_id])
+            # A member of the Bundle may also be nested in another, e.g. in an Investigation's uco-core:object.
+            owners[member_id] = member_id
+            for node_id in defined:
+                owners.setdefault(node_id, member_id)
+            nested_counts[member_id] = len(defined)
+            for node_id in _ids(member.get("uco-core:object")):
+                compilations.setdefault(node_id, []).append(member_id)
+    # The compilations holding each member, or a node nested in it.
+    containers: dict[str, list[str]] = dict()
+    for node_id, holders in compilations.items():
+        if node_id in owners:
+            containers.setdefault(owners[node_id], []).extend(holders)
+    for key, value in bundle.items():
+        if key not in MEMBER_KEYS and key != "@context":
+            properties: list[Reference] = list()
+            _scan({key: value}, set(), properties)
+            roots.update(target for _, _, _, target in properties)
+
+    reached = {owners[root] for root in roots if root in owners}
+    frontier = list(reached)
+    while frontier:
+        next_frontier = list()
+        for member_id in frontier:
+            for _, _, _, target in references[member_id]:
+                owner = owners.get(target)
+                if owner is not None and owner not in reached:
+                    reached.add(owner)
+                    next_frontier.append(owner)
+            for compilation in containers.get(member_id, ()):
+                if compilation not in reached:
+                    reached.add(compilation)
+                    next_frontier.append(compilation)
+        frontier = next_frontier
+
+    measure = _measure(get_serializer(serializer), indent)
+    pruned: list[str] = list()
+    nodes = 0
+    size = 0
+    for key in MEMBER_KEYS:
+        members = dict.get(bundle, key)
+        if not members:
+            continue
+        kept = list()
+        for member, member_id in zip(members, member_ids[key]):
+            if member_id is None or member_id in reached:
+                kept.append(member)
+                continue
+            pruned.append(member_id)
+            nodes += nested_counts[member_id]
+            size += measure(member)
+            if not dry_run:
+                bundle._objects_by_id.pop(member_id, None)
+                if bundle._relationship_index is not None:
+                    bundle._relationship_index.remove(member)
+        if not dry_run:
+            bundle[key] = kept
+    return PruneReport(pruned, nodes, size)
+
+
+def _measure(encode: Serializer, indent: Optional[int]) -> Callable[[Any], int]:
+    """
+    :return: A function giving the number of bytes a member takes in a Bundle serialized with encode, indented as a member is, and with the separator from the next member.
+    """
+    base = len(encode({"k": [0]}, indent)) - 1
+    separator = len(encode({"k": [0, 0]}, indent)) - base - 2
+    return lambda member: (
+        len(encode({"k": [member]}, indent).encode("utf-8")) - base + separator
+    )
+
+
+def _ids(value: Any) -> Iterator[str]:
+    """
+    Yield the @id of the nodes, or references, in a property value.
+    """
+    if isinstance(value, list):
+        for item in value:
+            yield from _ids(item)
+    elif isinstance(value, CompactThing):
+        yield value.get_id()
+    elif isinstance(value, dict) and isinstance(value.get("@id"), str):
+        yield value["@id"]
+
+
+def _has_type(node_type: Any, types: frozenset[str]) -> bool:
+    if isinstance(node_type, list):
+        return any(item in types for item in node_type)
+    return node_type in types
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m case_mapping.prune",
+        description="Remove the objects of a Bundle file that no action or relationship reaches, and write the result.",
+    )
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument(
+        "--root-type",
+        action="append",
+        dest="root_types",
+        help="The @type of the roots, instead of the default ones.  May be repeated.",
+    )
+    parser.add_argument("--root-id", action="append", dest="root_ids", default=[])
+    args = parser.parse_args()
+    from .loader import load
+
+    bundle = load(args.source)
+    report = prune(bundle, args.root_types or DEFAULT_ROOT_TYPES, args.root_ids)
+    bundle.write(args.destination)
+    print("%s: %s" % (args.source, report.summary()))
+
+
+if __name__ == "__main__":
+    main()
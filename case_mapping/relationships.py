@@ -0,0 +1,152 @@
+from collections.abc import Iterable
+from typing import Any, Iterator, Optional
+
+from .compact import CompactThing
+
+RELATIONSHIP_TYPES = frozenset(
+    ("uco-core:Relationship", "uco-observable:ObservableRelationship")
+)
+
+# (@id of the source, kindOfRelationship, @id of the target, @id of the relationship)
+Edge = tuple[str, Optional[str], str, str]
+
+# Edges by node @id, then by kindOfRelationship.
+_Adjacency = dict[str, dict[Optional[str], list[Edge]]]
+
+
+class RelationshipIndex:
+    def __init__(
+        self,
+        relationships: Iterable[Any] = (),
+        types: Iterable[str] = RELATIONSHIP_TYPES,
+    ) -> None:
+        """
+        Forward and reverse adjacency lists of the relationships of a Bundle, keyed by the ``@id`` of their source and target and by their ``uco-core:kindOfRelationship``, so the neighbours of an object are found in time proportional to their number, rather than by scanning every relationship.
+
+        ``Bundle.relationship_index()`` returns the index of a Bundle, which is kept up to date as objects are appended to it.  Relationships are indexed as they are added: changes made to a relationship afterwards are not seen.  ``uco-core:isDirectional`` is not interpreted: an edge always goes from the source to the target.
+
+        >>> from case_mapping import uco
+        >>> device = uco.observable.ObservableObject()
+        >>> image = uco.observable.ObservableObject()
+        >>> contained = uco.observable.ObservableRelationship(source=image, target=device, kind_of_relationship="Contained_Within")
+        >>> index = RelationshipIndex([device, image, contained])
+        >>> index.sources(device.get_id(), "Contained_Within") == [image.get_id()]
+        True
+        >>> index.targets(image.get_id()) == [device.get_id()]
+        True
+
+        :param relationships: Objects to index, of which those of one of the types are indexed.
+        :param types: The ``@type`` values of relationships.
+        """
+        self.types = frozenset(types)
+        self.forward: _Adjacency = dict()
+        self.reverse: _Adjacency = dict()
+        self._count = 0
+        self.extend(relationships)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of edges.
+        """
+        return self._count
+
+    def add(self, relationship: Any) -> None:
+        """
+        Index a relationship, as a UcoObject, a CompactThing or a dictionary.  Other objects are ignored.  A relationship with several sources or targets gives an edge for each pair.
+        """
+        if isinstance(relationship, CompactThing):
+            relationship_type: Any = relationship.schema.type
+        elif isinstance(relationship, dict):
+            relationship_type = relationship.get("@type")
+        else:
+            return
+        if not self._is_relationship(relationship_type):
+            return
+        relationship_id = relationship.get("@id")
+        kind = relationship.get("uco-core:kindOfRelationship")
+        targets = list(_ids(relationship.get("uco-core:target")))
+        for source in _ids(relationship.get("uco-core:source")):
+            for target in targets:
+                edge = (source, kind, target, relationship_id)
+                self.forward.setdefault(source, {}).setdefault(kind, []).append(edge)
+                self.reverse.setdefault(target, {}).setdefault(kind, []).append(edge)
+                self._count += 1
+
+    def extend(self, relationships: Iterable[Any]) -> None:
+        for relationship in relationships:
+            self.add(relationship)
+
+    def remove(self, relationship: Any) -> None:
+        """
+        Remove the edges of a relationship, e.g. one pruned from the Bundle, in time proportional to the degree of its sources and targets.  The relationship must not have been changed since it was added.
+        """
+        if not isinstance(relationship, (dict, CompactThing)):
+            return
+        relationship_id = relationship.get("@id")
+        kind = relationship.get("uco-core:kindOfRelationship")
+        for adjacency, key in (
+            (self.forward, "uco-core:source"),
+            (self.reverse, "uco-core:target"),
+        ):
+            for node_id in set(_ids(relationship.get(key))):
+                by_kind = adjacency.get(node_id)
+                if by_kind is None or kind not in by_kind:
+                    continue
+                edges = by_kind[kind]
+                kept = [edge for edge in edges if edge[3] != relationship_id]
+                if adjacency is self.forward:
+                    self._count -= len(edges) - len(kept)
+                if kept:
+                    by_kind[kind] = kept
+                else:
+                    del by_kind[kind]
+                    if not by_kind:
+                        del adjacency[node_id]
+
+    def outgoing(self, node_id: str, kind: Optional[str] = None) -> list[Edge]:
+        """
+        :return: The edges from node_id, of the given kindOfRelationship, or of any kind if kind is None.
+        """
+        return _edges(self.forward, node_id, kind)
+
+    def incoming(self, node_id: str, kind: Optional[str] = None) -> list[Edge]:
+        """
+        :return: The edges to node_id, of the given kindOfRelationship, or of any kind if kind is None.
+        """
+        return _edges(self.reverse, node_id, kind)
+
+    def targets(self, node_id: str, kind: Optional[str] = None) -> list[str]:
+        """
+        :return: The @id of the targets of the relationships from node_id, e.g. the device an image is "Contained_Within".
+        """
+        return [edge[2] for edge in _edges(self.forward, node_id, kind)]
+
+    def sources(self, node_id: str, kind: Optional[str] = None) -> list[str]:
+        """
+        :return: The @id of the sources of the relationships to node_id, e.g. the images "Contained_Within" a device.
+        """
+        return [edge[0] for edge in _edges(self.reverse, node_id, kind)]
+
+    def _is_relationship(self, relationship_type: Any) -> bool:
+        if isinstance(relationship_type, list):
+            return any(item in self.types for item in relationship_type)
+        return relationship_type in self.types
+
+
+def _edges(adjacency: _Adjacency, node_id: str, kind: Optional[str]) -> list[Edge]:
+    by_kind = adjacency.get(node_id)
+    if not by_kind:
+        return []
+    if kind is not None:
+        return list(by_kind.get(kind, ()))
+    return [edge for edges in by_kind.values() for edge in edges]
+
+
+def _ids(value: Any) -> Iterator[str]:
+    if isinstance(value, list):
+        for item in value:
+            yield from _ids(item)
+    elif isinstance(value, CompactThing):
+        yield value.get_id()
+    elif isinstance(value, dict) and "@id" in value:
+        yield value["@id"]
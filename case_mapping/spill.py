@@ -0,0 +1,148 @@
+import json
+import os
+import sqlite3
+import tempfile
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from .compact import expand
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+
+class SpillStore:
+    def __init__(
+        self,
+        path: Union[None, str, "os.PathLike[str]"] = None,
+        *,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        A disk-backed store of a Bundle's members, in a local SQLite database, which a Bundle spills its members into with ``Bundle.spill_to()`` so they need not be held in memory.
+
+        Members are stored as compact JSON, in insertion order, and are inserted in batches, in write-ahead-logging mode.  They are read back as dictionaries.
+
+        :param path: The database file.  If None, a temporary file is used, and deleted on close().
+        :param batch_size: The number of members buffered before they are inserted.
+
+        >>> store = SpillStore()
+        >>> store.append("uco-core:object", [{"@id": "kb:a"}, {"@id": "kb:b"}])
+        >>> [member["@id"] for member in store.members("uco-core:object")]
+        ['kb:a', 'kb:b']
+        >>> "kb:b" in store, store.count("@graph")
+        (True, 0)
+        >>> store.close()
+        """
+        self._temporary = path is None
+        if path is None:
+            descriptor, path = tempfile.mkstemp(
+                suffix=".sqlite", prefix="case_mapping-"
+            )
+            os.close(descriptor)
+        self.path = os.fspath(path)
+        self.batch_size = batch_size
+        self._pending: list[tuple[str, Optional[str], str]] = list()
+        self._pending_data: dict[str, str] = dict()
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS member (key TEXT NOT NULL, id TEXT, data TEXT NOT NULL)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS member_key ON member (key)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS member_id ON member (id)"
+            )
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+        if self._temporary:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(self.path + suffix):
+                    os.remove(self.path + suffix)
+
+    def append(self, key: str, items: Iterable[Any]) -> None:
+        """
+        Store members of the Bundle's key array, e.g. ``uco-core:object``, after those already stored.
+        """
+        for item in items:
+            item_id = item.get("@id")
+            data = _dumps(item)
+            self._pending.append((key, item_id, data))
+            if item_id is not None:
+                self._pending_data[item_id] = data
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Insert the buffered members.
+        """
+        if not self._pending:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO member (key, id, data) VALUES (?, ?, ?)", self._pending
+            )
+        self._pending.clear()
+        self._pending_data.clear()
+
+    def members(self, key: str) -> Iterator[dict[str, Any]]:
+        """
+        Yield the stored members of a key array, in the order they were appended.
+        """
+        self.flush()
+        cursor = self.connection.execute(
+            "SELECT data FROM member WHERE key = ? ORDER BY rowid", (key,)
+        )
+        for (data,) in cursor:
+            yield _loads(data)
+
+    def count(self, key: str) -> int:
+        self.flush()
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM member WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    def get(self, item_id: str) -> Optional[dict[str, Any]]:
+        """
+        :return: The first stored member with an ``@id``, or None.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM member WHERE id = ? ORDER BY rowid LIMIT 1", (item_id,)
+        ).fetchone()
+        if row is not None:
+            return _loads(row[0])
+        if item_id in self._pending_data:
+            return _loads(self._pending_data[item_id])
+        return None
+
+    def __contains__(self, item_id: object) -> bool:
+        return (
+            item_id in self._pending_data
+            or self.connection.execute(
+                "SELECT 1 FROM member WHERE id = ? LIMIT 1", (item_id,)
+            ).fetchone()
+            is not None
+        )
+
+
+def _dumps(item: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(item, default=expand).decode("utf-8")
+    return json.dumps(item, separators=(",", ":"), default=expand)
+
+
+def _loads(data: str) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
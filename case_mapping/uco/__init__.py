@@ -1 +1,22 @@
-from . import action, core, identity, location, observable, role, tool, types
+from typing import Any, List
+
+from .. import _import_submodule
+
+__all__ = [
+    "action",
+    "core",
+    "identity",
+    "location",
+    "observable",
+    "role",
+    "tool",
+    "types",
+]
+
+
+def __getattr__(name: str) -> Any:
+    return _import_submodule(__name__, __all__, name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Iterable, List, Optional, Sequence, Union
 
 from pytz import timezone
 
@@ -74,6 +74,12 @@ class Action(UcoObject):
         """
         self._append_refs("uco-action:result", *args)
 
+    def extend_results(self, results: Iterable[Any]) -> None:
+        """
+        As append_results(), for any iterable of CASE objects, e.g. a generator, which is consumed once.  References to the objects are added to the list of results at once.
+        """
+        self._extend_stuff("uco-action:result", results, refs=True)
+
     @unpack_args_array
     def append_objects(self, *args):
         """
@@ -1,9 +1,20 @@
+import io
+import os
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from typing import Any, Optional, Sequence, Union
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
 
 from pytz import timezone
 
-from ..base import UcoObject, unpack_args_array
+from .. import diagnostics
+from ..base import UcoObject, UcoThing, unpack_args_array
+from ..compact import CompactThing
+
+if TYPE_CHECKING:
+    from ..relationships import RelationshipIndex
+    from ..spill import SpillStore
+
+MEMBER_KEYS = ("uco-core:object", "@graph")
 
 
 class Compilation(UcoObject):
@@ -26,6 +37,12 @@ class Compilation(UcoObject):
         """
         self._append_observable_objects("uco-core:object", *args)
 
+    def extend_uco_objects(self, objects: Iterable[Any]) -> None:
+        """
+        As append_to_uco_object(), for any iterable of objects, e.g. a generator, which is consumed once.  The objects are checked in one pass and added to the list at once.
+        """
+        self._extend_observable_objects("uco-core:object", objects)
+
 
 class ContextualCompilation(Compilation):
     def __init__(
@@ -63,6 +80,10 @@ class EnclosingCompilation(Compilation):
 
 
 class Bundle(EnclosingCompilation):
+    _spill_store: Optional["SpillStore"] = None
+    _spill_threshold = 0
+    _relationship_index: Optional["RelationshipIndex"] = None
+
     def __init__(
         self,
         *args: Any,
@@ -72,7 +93,18 @@ class Bundle(EnclosingCompilation):
         The main CASE Object for representing a case and its activities and objects.
 
         Instantiating this class requires a starter sequence (set, list, or tuple) to be passed using the core_objects parameter.  (See EnclosingCompilation.)  To confirm conformant CASE will be generated, at least one UcoObject must be passed in this list.  However, this does not initially need to be the complete sequence of objects that will be in this Bundle.  Other UcoObjects can be added after initialization with bundle.append_to_uco_object.
+
+        The Bundle indexes the objects appended to it by ``@id``.  Nodes loaded as dictionaries, e.g. by ``case_mapping.loader`` for types without a class, can be appended too.  ``bundle.get(object_id)`` returns the object, ``object_id in bundle`` tests whether it has been added, and an object whose ``@id`` is already in the Bundle is not appended a second time.  Properties of the Bundle itself can still be read with ``bundle.get(key)`` and tested with ``key in bundle``.
+
+        >>> from case_mapping import uco
+        >>> identity = uco.identity.Identity()
+        >>> bundle = Bundle(core_objects=[identity])
+        >>> bundle.get(identity.get_id()) is identity
+        True
+        >>> identity.get_id() in bundle
+        True
         """
+        self._objects_by_id: Dict[str, Any] = dict()
         super().__init__(*args, **kwargs)
         self.build = []  # type: ignore
         self["@context"] = {
@@ -106,10 +138,283 @@ class Bundle(EnclosingCompilation):
         self["@context"][self.prefix_label] = self.prefix_iri
         self["@type"] = "uco-core:Bundle"
 
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or (
+            isinstance(key, str) and self._has_object(key)
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        :param key: A property of the Bundle, or the ``@id`` of an object appended to it.  Objects spilled to a SpillStore are read back from it, rehydrated as ``case_mapping.loader`` does.
+        """
+        if super().__contains__(key):
+            return super().get(key)
+        if key in self._objects_by_id:
+            return self._objects_by_id[key]
+        if self._spill_store is not None:
+            spilled = self._spill_store.get(key)
+            if spilled is not None:
+                from ..loader import Rehydrator
+
+                return Rehydrator(self.get("@context")).rehydrate(spilled)
+        return default
+
+    def _has_object(self, item_id: str) -> bool:
+        return item_id in self._objects_by_id or (
+            self._spill_store is not None and item_id in self._spill_store
+        )
+
+    def _append_observable_objects(self, key, *args):
+        if len(args) == 1 and not args[0]:  # True if no objects to append provided
+            return
+        new_objects = list()
+        for item in args:
+            item_id = _member_id(item)
+            if item_id is None:
+                diagnostics.report(
+                    diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                )
+                continue
+            if self._has_object(item_id):
+                diagnostics.report(
+                    diagnostics.ALREADY_IN_BUNDLE, type(self).__name__, key, item_id
+                )
+                continue
+            self._objects_by_id[item_id] = item
+            new_objects.append(item)
+        if new_objects:
+            if self._relationship_index is not None:
+                self._relationship_index.extend(new_objects)
+            self._extend_list(key, new_objects)
+        if (
+            self._spill_store is not None
+            and len(self._objects_by_id) > self._spill_threshold
+        ):
+            self._spill()
+
+    def _extend_observable_objects(self, key, items):
+        objects_by_id = self._objects_by_id
+        store = self._spill_store
+        index = self._relationship_index
+        new_objects = list()
+        for item in items:
+            item_id = _member_id(item)
+            if item_id is None:
+                diagnostics.report(
+                    diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                )
+                continue
+            if item_id in objects_by_id or (store is not None and item_id in store):
+                diagnostics.report(
+                    diagnostics.ALREADY_IN_BUNDLE, type(self).__name__, key, item_id
+                )
+                continue
+            objects_by_id[item_id] = item
+            if index is not None:
+                index.add(item)
+            new_objects.append(item)
+            if store is not None and len(objects_by_id) > self._spill_threshold:
+                self._extend_list(key, new_objects)
+                new_objects = list()
+                self._spill()
+        self._extend_list(key, new_objects)
+
+    def relationship_index(self) -> "RelationshipIndex":
+        """
+        The index of the Bundle's relationships by source and target, built from its members, including those spilled to a SpillStore, the first time it is asked for, and then kept up to date as objects are appended to the Bundle.
+
+        >>> from case_mapping import uco
+        >>> device = uco.observable.ObservableObject()
+        >>> bundle = Bundle(core_objects=[device])
+        >>> index = bundle.relationship_index()
+        >>> image = uco.observable.ObservableObject()
+        >>> bundle.append_to_uco_object(image, uco.observable.ObservableRelationship(source=image, target=device, kind_of_relationship="Contained_Within"))
+        >>> index.sources(device.get_id(), "Contained_Within") == [image.get_id()]
+        True
+        """
+        if self._relationship_index is None:
+            from ..relationships import RelationshipIndex
+
+            index = RelationshipIndex()
+            for key in MEMBER_KEYS:
+                index.extend(self.iter_members(key))
+            self._relationship_index = index
+        return self._relationship_index
+
+    def spill_to(self, store: "SpillStore", max_objects: int = 100_000) -> None:
+        """
+        Move the objects appended to the Bundle into a disk-backed SpillStore whenever more than max_objects are held in memory, so Bundles larger than memory can be built.
+
+        Spilled objects are still found by ``bundle.get(object_id)`` and ``object_id in bundle``, and are written, before the objects still held in memory and in the order they were appended, by dump(), dumps() and ``case_mapping.writer.BundleWriter``.  They are no longer in the Bundle's ``uco-core:object`` and ``@graph`` lists, and changes made to them after spilling are not saved.
+
+        >>> from case_mapping import uco
+        >>> from case_mapping.spill import SpillStore
+        >>> objects = [uco.identity.Identity() for _ in range(5)]
+        >>> bundle = uco.core.Bundle(core_objects=objects[:1])
+        >>> store = SpillStore()
+        >>> bundle.spill_to(store, max_objects=2)
+        >>> bundle.append_to_uco_object(objects[1:])
+        >>> len(bundle["uco-core:object"]), store.count("uco-core:object")
+        (0, 5)
+        >>> import json
+        >>> [member["@id"] for member in json.loads(bundle.dumps())["uco-core:object"]] == [identity.get_id() for identity in objects]
+        True
+        >>> store.close()
+
+        :param store: The store to spill into.
+        :param max_objects: The number of objects held in memory at which to spill.
+        """
+        self._spill_store = store
+        self._spill_threshold = max_objects
+        if len(self._objects_by_id) > max_objects:
+            self._spill()
+
+    def _spill(self) -> None:
+        assert self._spill_store is not None
+        for key in MEMBER_KEYS:
+            members = super().get(key)
+            if members:
+                self._spill_store.append(key, members)
+                self[key] = []
+        self._spill_store.flush()
+        self._objects_by_id.clear()
+
+    def subgraph(
+        self, root_ids: Iterable[str], depth: Optional[int] = None
+    ) -> "Bundle":
+        """
+        A new Bundle holding the objects with the given ``@id`` values, and the objects of this Bundle they reference, directly or indirectly, through ``{"@id": ...}`` references held by them or by their nested nodes, such as Facets.
+
+        Objects are looked up by ``@id`` as they are reached, so the time taken is proportional to the size of the subgraph, not of this Bundle.  Only references from an object are followed, not references to it.  The new Bundle has the same ``@context`` and prefix, and shares the objects, which are in the order they were reached, rather than copies of them.
+
+        >>> from case_mapping import uco
+        >>> performer = uco.identity.Identity()
+        >>> device = uco.observable.ObservableObject()
+        >>> action = uco.action.Action(performer=performer, objects=[device])
+        >>> bundle = Bundle(core_objects=[action, performer, device, uco.identity.Identity()])
+        >>> [member["@type"] for member in bundle.subgraph([action.get_id()])["uco-core:object"]]
+        ['uco-action:Action', 'uco-identity:Identity', 'uco-observable:ObservableObject']
+
+        :param root_ids: The ``@id`` of objects of this Bundle to start from.  A KeyError is raised for an ``@id`` not in the Bundle.
+        :param depth: The number of references to follow away from the roots, or None to follow them all.  The Bundle returned is only self-contained if depth is None, as the objects at the given depth may reference objects that are left out.
+        """
+        from ..integrity import iter_references
+
+        reached: Dict[str, Any] = dict()
+        for root_id in root_ids:
+            root = self._object(root_id)
+            if root is None:
+                raise KeyError(root_id)
+            reached[root_id] = root
+        if not reached:
+            raise ValueError("A subgraph needs at least one root object.")
+        frontier = list(reached.values())
+        level = 0
+        while frontier and (depth is None or level < depth):
+            next_frontier = list()
+            for item in frontier:
+                for _, _, _, target in iter_references(item):
+                    if target not in reached:
+                        referenced = self._object(target)
+                        if referenced is not None:
+                            reached[target] = referenced
+                            next_frontier.append(referenced)
+            frontier = next_frontier
+            level += 1
+        subgraph = Bundle(
+            core_objects=list(reached.values()),
+            prefix_label=self.prefix_label,
+            prefix_iri=self.prefix_iri,
+        )
+        subgraph["@context"] = dict(self["@context"])
+        return subgraph
+
+    def _object(self, item_id: str) -> Any:
+        """
+        :return: The object appended to the Bundle with an ``@id``, including one spilled to a SpillStore, or None.
+        """
+        if item_id in self._objects_by_id:
+            return self._objects_by_id[item_id]
+        if self._spill_store is None or super().__contains__(item_id):
+            return None
+        return self.get(item_id)
+
+    def iter_members(self, key: str) -> Iterator[Any]:
+        """
+        Iterate over the members of the Bundle's key array, e.g. ``uco-core:object``, including those spilled to a SpillStore, which come first.
+        """
+        if self._spill_store is not None:
+            yield from self._spill_store.members(key)
+        yield from super().get(key) or []
+
+    def has_members(self, key: str) -> bool:
+        if super().get(key):
+            return True
+        return self._spill_store is not None and self._spill_store.count(key) > 0
+
+    def dumps(self, indent: Optional[int] = 4, serializer: Optional[str] = None) -> str:
+        if self._spill_store is None:
+            return super().dumps(indent=indent, serializer=serializer)
+        fp = io.StringIO()
+        self.dump(fp, indent=indent, serializer=serializer)
+        return fp.getvalue()[:-1]
+
+    def dump(
+        self, fp: IO[str], indent: Optional[int] = 4, serializer: Optional[str] = None
+    ) -> None:
+        """
+        As UcoThing.dump(), streaming objects spilled to a SpillStore out of it.
+        """
+        if self._spill_store is None:
+            return super().dump(fp, indent=indent, serializer=serializer)
+        from ..writer import BundleWriter
+
+        BundleWriter(fp, self, indent=indent, serializer=serializer).close()
+
+    def write(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        compression: Optional[str] = "infer",
+        level: Optional[int] = None,
+        indent: Optional[int] = 4,
+        serializer: Optional[str] = None,
+    ) -> None:
+        """
+        Write the Bundle to a file, compressed as it is serialized, one member at a time, by ``case_mapping.writer.BundleWriter``.  The Bundle's ``@context`` is written first.
+
+        >>> import os, tempfile
+        >>> from case_mapping import uco
+        >>> from case_mapping.loader import load
+        >>> bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = os.path.join(tmpdir, "case.jsonld.xz")
+        ...     bundle.write(path)
+        ...     load(path) == bundle
+        True
+
+        :param path: The file to write.
+        :param compression: As for ``case_mapping.compression.open_bundle()``, by default inferred from the file name suffix, e.g. ``.gz``, ``.xz`` or ``.zst``.
+        :param level: The compression level, or None for the codec's default.
+        :param indent: As for dumps().
+        :param serializer: As for dumps().
+        """
+        from ..compression import open_bundle
+        from ..writer import BundleWriter
+
+        with open_bundle(path, "w", compression=compression, level=level) as fp:
+            BundleWriter(fp, self, indent=indent, serializer=serializer).close()
+
     @unpack_args_array
     def append_to_case_graph(self, *args):
         self._append_observable_objects("@graph", *args)
 
+    def extend_case_graph(self, objects: Iterable[Any]) -> None:
+        """
+        As append_to_case_graph(), for any iterable of objects, e.g. a generator, which is consumed once.
+        """
+        self._extend_observable_objects("@graph", objects)
+
     @unpack_args_array
     def append_to_rdfs_comments(self, *args):
         self._append_strings("rdfs:comment", *args)
@@ -119,6 +424,19 @@ class Bundle(EnclosingCompilation):
         self._append_strings("uco-core:description", *args)
 
 
+def _member_id(item: Any) -> Optional[str]:
+    """
+    :return: The @id of an object that can be a member of a Bundle, i.e. a UcoThing, a CompactThing, or a node loaded as a dictionary, or None.
+    """
+    if isinstance(item, CompactThing):
+        return item.get_id()
+    if isinstance(item, dict):
+        item_id = dict.get(item, "@id")
+        if isinstance(item_id, str):
+            return item_id
+    return None
+
+
 class Relationship(UcoObject):
     def __init__(
         self,
@@ -749,6 +749,17 @@ class RasterPictureFacet(Facet):
 
 
 class CallFacet(Facet):
+    _columns = {
+        "call_type": ("uco-observable:callType", "str"),
+        "start_time": ("uco-observable:startTime", "datetime"),
+        "end_time": ("uco-observable:endTime", "datetime"),
+        "call_duration": ("uco-observable:duration", "int"),
+        "application": ("uco-observable:application", "node_reference"),
+        "call_from": ("uco-observable:from", "node_reference"),
+        "call_to": ("uco-observable:to", "node_reference"),
+        "call_participant": ("uco-observable:participant", "node_reference"),
+    }
+
     def __init__(
         self,
         application=None,
@@ -759,6 +770,7 @@ class CallFacet(Facet):
         call_participant: Union[None, ObservableObject, List[ObservableObject]] = None,
         call_from: Union[None, ObservableObject] = None,
         call_to: Union[None, ObservableObject, List[ObservableObject]] = None,
+        **kwargs: Any,
     ):
         """
         This CASEObject represents a call facet, a grouping of characteristics unique to a
@@ -774,7 +786,7 @@ class CallFacet(Facet):
         :param allocation_status: The allocation status of the record of the call i.e intact for records that are
         present on the device
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self["@type"] = "uco-observable:CallFacet"
         self._str_vars(
             **{
@@ -1112,6 +1124,23 @@ class File(ObservableObject):
 
 
 class FileFacet(Facet):
+    _columns = {
+        "file_name": ("uco-observable:fileName", "str"),
+        "file_path": ("uco-observable:filePath", "str"),
+        "file_extension": ("uco-observable:extension", "str"),
+        "file_allocation_status": ("uco-observable:allocationStatus", "str"),
+        "file_mime_type": ("uco-observable:mimeType", "str"),
+        "file_accessed_time": ("uco-observable:accessedTime", "datetime"),
+        "file_created_time": ("uco-observable:observableCreatedTime", "datetime"),
+        "file_modified_time": ("uco-observable:modifiedTime", "datetime"),
+        "file_metadata_changed_time": (
+            "uco-observable:metadataChangeTime",
+            "datetime",
+        ),
+        "file_size_bytes": ("uco-observable:sizeInBytes", "int"),
+        "file_is_directory": ("uco-observable:isDirectory", "bool"),
+    }
+
     def __init__(
         self,
         file_accessed_time=None,
@@ -1125,6 +1154,7 @@ class FileFacet(Facet):
         file_created_time: Optional[datetime] = None,
         file_size_bytes: Union[int, None] = None,
         file_mime_type: Optional[str] = None,
+        **kwargs: Any,
     ):
         """
         The basic properties associated with the storage of a file on a file system.
@@ -1140,7 +1170,7 @@ class FileFacet(Facet):
         :param file_metadata_changed_time: The last change to metadata of a file but not necessarily the file contents
         :param file_mime_type: A generic (string) tag/label of e file, or example 'text/html' or 'audio/mp3.
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self["@type"] = "uco-observable:FileFacet"
         self._str_vars(
             **{
@@ -1584,6 +1614,17 @@ class WirelessNetworkConnectionFacet(Facet):
 
 
 class SMSMessageFacet(Facet):
+    _columns = {
+        "message_text": ("uco-observable:messageText", "str"),
+        "message_type": ("uco-observable:messageType", "str"),
+        "message_id": ("uco-observable:messageID", "str"),
+        "session_id": ("uco-observable:sessionID", "str"),
+        "sent_time": ("uco-observable:sentTime", "datetime"),
+        "msg_from": ("uco-observable:from", "node_reference"),
+        "msg_to": ("uco-observable:to", "node_reference"),
+        "application": ("uco-observable:application", "node_reference"),
+    }
+
     def __init__(
         self,
         msg_to=None,
@@ -1594,6 +1635,7 @@ class SMSMessageFacet(Facet):
         message_type=None,
         message_id=None,
         session_id=None,
+        **kwargs: Any,
     ):
         """
         Characteristics of an electronic message.
@@ -1606,7 +1648,7 @@ class SMSMessageFacet(Facet):
         :param message_id: A unique identifier for the message.
         :param session_id: The priority of the email.
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self["@type"] = "uco-observable:SMSMessageFacet"
         self._str_vars(
             **{
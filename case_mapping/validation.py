@@ -0,0 +1,268 @@
+import argparse
+import os
+import re
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from .compact import CompactThing
+from .diagnostics import Diagnostics
+from .integrity import MEMBER_KEYS, _bundle_items, _type_name
+
+# Kinds of problems found.
+MISSING_TYPE = "MISSING TYPE"  # A node has no @type.
+WRONG_DATATYPE = "WRONG DATATYPE"  # A typed literal's @value does not match its @type, or the literal is malformed.
+NOT_A_REFERENCE = "NOT A REFERENCE"  # An object property holds something other than a node or {"@id": ...}.
+DETACHED_FACET = "DETACHED FACET"  # A Facet is not under a uco-core:hasFacet.
+
+# Properties whose values are nodes, or references to nodes, as set by the classes of this package.
+OBJECT_PROPERTIES = frozenset(
+    (
+        "drafting:authors",
+        "drafting:containsValues",
+        "drafting:documents",
+        "drafting:inputs",
+        "drafting:machineLearningJob",
+        "olo:item",
+        "uco-action:environment",
+        "uco-action:error",
+        "uco-action:instrument",
+        "uco-action:location",
+        "uco-action:object",
+        "uco-action:participant",
+        "uco-action:performer",
+        "uco-action:result",
+        "uco-action:subaction",
+        "uco-core:createdBy",
+        "uco-core:hasFacet",
+        "uco-core:object",
+        "uco-core:objectMarking",
+        "uco-core:source",
+        "uco-core:target",
+        "uco-observable:account",
+        "uco-observable:accountIssuer",
+        "uco-observable:application",
+        "uco-observable:attendant",
+        "uco-observable:bcc",
+        "uco-observable:browserInformation",
+        "uco-observable:camera",
+        "uco-observable:carrier",
+        "uco-observable:cc",
+        "uco-observable:cookieDomain",
+        "uco-observable:cyberAction",
+        "uco-observable:emailAddress",
+        "uco-observable:environmentVariables",
+        "uco-observable:eventRecordDevice",
+        "uco-observable:from",
+        "uco-observable:inReplyTo",
+        "uco-observable:installedVersionHistory",
+        "uco-observable:location",
+        "uco-observable:manufacturer",
+        "uco-observable:operatingSystem",
+        "uco-observable:owner",
+        "uco-observable:participant",
+        "uco-observable:partition",
+        "uco-observable:referrerUrl",
+        "uco-observable:sender",
+        "uco-observable:to",
+        "uco-observable:url",
+        "uco-observable:urlTargeted",
+        "uco-observable:xOriginatingIP",
+        "uco-tool:creator",
+    )
+)
+
+_INTEGER = re.compile(r"[+-]?[0-9]+\Z")
+_NON_NEGATIVE_INTEGER = re.compile(r"\+?[0-9]+\Z")
+_DECIMAL = re.compile(r"[+-]?([0-9]+(\.[0-9]*)?|\.[0-9]+)\Z")
+_DOUBLE = re.compile(
+    r"([+-]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([Ee][+-]?[0-9]+)?|[+-]?INF|NaN)\Z"
+)
+_HEX_BINARY = re.compile(r"([0-9A-Fa-f]{2})*\Z")
+# The lexical space of xsd:dateTime, in which fractions of a second may have any number of digits, and the time zone is optional.
+_DATETIME = re.compile(
+    r"-?([1-9][0-9]{3,}|0[0-9]{3})-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[01])"
+    r"T(([01][0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9](\.[0-9]+)?|24:00:00(\.0+)?)"
+    r"(Z|[+-]((0[0-9]|1[0-3]):[0-5][0-9]|14:00))?\Z"
+)
+
+
+def _matches(pattern: "re.Pattern[str]") -> Any:
+    return lambda value: pattern.match(value) is not None
+
+
+# Checks of the lexical forms of the datatypes this package writes, by datatype.  Other datatypes only need a string.
+_LEXICAL_CHECKS = {
+    "xsd:integer": _matches(_INTEGER),
+    "xsd:nonNegativeInteger": _matches(_NON_NEGATIVE_INTEGER),
+    "xsd:decimal": _matches(_DECIMAL),
+    "xsd:double": _matches(_DOUBLE),
+    "xsd:hexBinary": _matches(_HEX_BINARY),
+    "xsd:dateTime": _matches(_DATETIME),
+}
+
+_LITERAL_KEYS = frozenset(("@type", "@value", "@language"))
+
+
+class _Validator:
+    def __init__(
+        self, diagnostics: Diagnostics, object_properties: Iterable[str]
+    ) -> None:
+        self.diagnostics = diagnostics
+        self.object_properties = frozenset(object_properties)
+        self._facet_types: dict[Any, bool] = dict()
+        # Facets that are members of the Bundle, and the @ids referenced with uco-core:hasFacet.
+        self.member_facets: list[tuple[Optional[str], str]] = list()
+        self.facet_references: set[str] = set()
+
+    def node(self, node: Mapping[str, Any], key: Optional[str]) -> None:
+        node_type = node.get("@type")
+        owner = _type_name(node_type)
+        if node_type is None:
+            self.diagnostics.report(MISSING_TYPE, owner, key or "", node.get("@id"))
+        elif self.is_facet(node_type) and key != "uco-core:hasFacet":
+            if key in MEMBER_KEYS:
+                self.member_facets.append((node.get("@id"), owner))
+            else:
+                self.diagnostics.report(
+                    DETACHED_FACET, owner, key or "", node.get("@id")
+                )
+        for property_key, value in node.items():
+            if not property_key.startswith("@") or property_key == "@graph":
+                self.value(value, owner, property_key)
+
+    def value(self, value: Any, owner: str, key: str) -> None:
+        if isinstance(value, list):
+            for item in value:
+                self.value(item, owner, key)
+        elif isinstance(value, dict):
+            if "@value" in value:
+                self.literal(value, owner, key)
+                if key in self.object_properties:
+                    self.diagnostics.report(NOT_A_REFERENCE, owner, key, value)
+            elif "@id" in value and len(value) == 1:
+                if key == "uco-core:hasFacet":
+                    self.facet_references.add(value["@id"])
+            elif "@id" in value or "@type" in value or key in self.object_properties:
+                # A node, possibly without an @id, i.e. a blank node.
+                self.node(value, key)
+        elif isinstance(value, CompactThing):
+            self.node(value.expand(), key)
+        elif key in self.object_properties:
+            self.diagnostics.report(NOT_A_REFERENCE, owner, key, value)
+
+    def literal(self, literal: Mapping[str, Any], owner: str, key: str) -> None:
+        datatype = literal.get("@type")
+        value = literal["@value"]
+        if not literal.keys() <= _LITERAL_KEYS:
+            valid = False
+        elif datatype is None:
+            valid = isinstance(value, str)
+        elif datatype == "xsd:boolean":
+            valid = isinstance(value, bool) or value in ("true", "false", "1", "0")
+        elif not isinstance(datatype, str):
+            valid = False
+        elif isinstance(value, str):
+            check = _LEXICAL_CHECKS.get(datatype)
+            valid = check is None or check(value)
+        else:
+            # JSON numbers are accepted for the numeric datatypes.
+            valid = (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and datatype
+                in (
+                    "xsd:integer",
+                    "xsd:nonNegativeInteger",
+                    "xsd:decimal",
+                    "xsd:double",
+                )
+                and (datatype != "xsd:nonNegativeInteger" or value >= 0)
+            )
+        if not valid:
+            self.diagnostics.report(WRONG_DATATYPE, owner, key, literal)
+
+    def is_facet(self, node_type: Any) -> bool:
+        try:
+            return self._facet_types[node_type]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable, e.g. a list of types.
+            return any(self.is_facet(item) for item in node_type)
+        is_facet = isinstance(node_type, str) and node_type.endswith("Facet")
+        self._facet_types[node_type] = is_facet
+        return is_facet
+
+    def finish(self) -> None:
+        for facet_id, owner in self.member_facets:
+            if facet_id not in self.facet_references:
+                self.diagnostics.report(
+                    DETACHED_FACET, owner, "uco-core:object", facet_id
+                )
+
+
+def validate(
+    source: Union[Mapping[str, Any], str, "os.PathLike[str]"],
+    *,
+    object_properties: Iterable[str] = OBJECT_PROPERTIES,
+    max_samples: int = 5,
+) -> Diagnostics:
+    """
+    Check a Bundle, in one pass over its dictionaries, for the structural problems most often found by SHACL validation, e.g. by ``case_validate``:
+
+    * nodes without an ``@type`` (MISSING_TYPE);
+    * typed literals whose ``@value`` is not of their ``@type``, e.g. ``{"@type": "xsd:integer", "@value": "12.5"}``, or that are malformed (WRONG_DATATYPE);
+    * object properties, such as ``uco-action:performer``, holding values other than nodes and ``{"@id": ...}`` references (NOT_A_REFERENCE);
+    * Facets not attached to an object with ``uco-core:hasFacet`` (DETACHED_FACET).
+
+    A Bundle passing these checks may still fail full validation, which checks much more, such as the classes of referenced nodes and dangling references (for which, see ``case_mapping.integrity``).
+
+    :param source: A Bundle, or the path of a Bundle file, read one member at a time.
+    :param object_properties: The properties whose values must be nodes or references.
+    :param max_samples: The number of offending values kept per kind of problem, @type and property.
+    :return: The problems found, counted by kind, @type and property.
+
+    >>> from case_mapping import uco
+    >>> observable = uco.observable.ObservableObject()
+    >>> observable["uco-core:hasFacet"] = [{"@type": "uco-observable:FileFacet", "uco-observable:sizeInBytes": {"@type": "xsd:integer", "@value": "1 KiB"}}]
+    >>> print(validate(uco.core.Bundle(core_objects=[observable])).summary())
+    1 WRONG DATATYPE uco-observable:FileFacet uco-observable:sizeInBytes: {'@type': 'xsd:integer', '@value': '1 KiB'}
+    """
+    validator = _Validator(Diagnostics(max_samples=max_samples), object_properties)
+    bundle: dict[str, Any] = dict()
+    for key, value in _bundle_items(source):
+        if key in MEMBER_KEYS:
+            if isinstance(value, dict):
+                validator.node(value, key)
+            elif isinstance(value, CompactThing):
+                validator.node(value.expand(), key)
+            else:
+                validator.diagnostics.report(NOT_A_REFERENCE, "", key, value)
+        else:
+            bundle[key] = value
+    validator.node(bundle, None)
+    validator.finish()
+    return validator.diagnostics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m case_mapping.validation",
+        description="Check Bundle files for common structural problems, before a full SHACL validation.",
+    )
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args()
+    failed = False
+    for path in args.paths:
+        diagnostics = validate(path)
+        if diagnostics.total():
+            print(
+                "%s: %d problems\n%s"
+                % (path, diagnostics.total(), diagnostics.summary())
+            )
+            failed = True
+        else:
+            print("%s: no problems found" % path)
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import json
+from typing import IO, Any, Dict, List, Optional
+
+from . import diagnostics
+from .base import UcoThing, get_serializer, unpack_args_array
+from .compact import CompactThing
+from .uco.core import Bundle
+
+MEMBER_KEYS = ("uco-core:object", "@graph")
+
+
+class BundleWriter:
+    def __init__(
+        self,
+        fp: IO[str],
+        bundle: Bundle,
+        *,
+        indent: Optional[int] = 4,
+        serializer: Optional[str] = None,
+    ) -> None:
+        """
+        Writes a Bundle to a file handle incrementally, so objects do not need to be held in memory until the whole case is printed.
+
+        On opening, the Bundle's ``@context`` and its other properties are written, followed by any members the Bundle already holds, including those it spilled to a ``case_mapping.spill.SpillStore``.  Objects appended to the writer afterwards are serialized and written immediately, and are not retained by the writer or added to the Bundle.  Members of ``uco-core:object`` and ``@graph`` are written as two consecutive arrays; once appending to one array has begun, the other array can no longer be appended to if it was already written.
+
+        If the ``with`` block is left because of an exception, the closing brackets are not written, so an interrupted run cannot be mistaken for a complete Bundle.
+
+        :param fp: A text file handle to write to.
+        :param bundle: The Bundle supplying the ``@context`` and Bundle-level properties.
+        :param indent: The indentation level, as for ``json.dumps``.  ``None`` writes compact output.
+        :param serializer: The name of a serializer registered in ``case_mapping.base``, or None for the one selected with ``set_serializer()``.
+
+        Examples
+        ========
+
+        >>> import io
+        >>> from case_mapping import uco
+        >>> identity = uco.identity.Identity()
+        >>> bundle = uco.core.Bundle(core_objects=[identity])
+        >>> fp = io.StringIO()
+        >>> with BundleWriter(fp, bundle) as writer:
+        ...     writer.append_to_uco_object(uco.observable.ObservableObject())
+        >>> written = json.loads(fp.getvalue())
+        >>> len(written["uco-core:object"])
+        2
+        >>> list(written)[0]
+        '@context'
+        """
+        self.fp = fp
+        self.bundle = bundle
+        self.indent = indent
+        self.serializer = get_serializer(serializer)
+        self._item_separator = "," if indent is not None else ", "
+        self._opened = False
+        self._closed = False
+        self._property_count = 0
+        self._current_key: Optional[str] = None
+        self._current_count = 0
+        self._written_keys: List[str] = list()
+
+    def __enter__(self) -> "BundleWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.close()
+
+    def open(self) -> None:
+        """
+        Write the opening of the Bundle, its ``@context`` and its other non-member properties.
+        """
+        if self._opened:
+            raise ValueError("BundleWriter has already been opened.")
+        self._opened = True
+        self.fp.write("{")
+        header: Dict[str, Any] = dict()
+        if "@context" in self.bundle:
+            header["@context"] = self.bundle["@context"]
+        for key, value in self.bundle.items():
+            if key not in MEMBER_KEYS and key != "@context":
+                header[key] = value
+        for key, value in header.items():
+            self._write_property(key, value)
+
+    def close(self) -> None:
+        """
+        Write any remaining members the Bundle already holds, and close the JSON object.
+        """
+        if self._closed:
+            return
+        if not self._opened:
+            self.open()
+        for key in MEMBER_KEYS:
+            if key not in self._written_keys and self.bundle.has_members(key):
+                self._start_member_array(key)
+        self._end_member_array()
+        self.fp.write(self._newline(0) + "}\n")
+        self._closed = True
+
+    @unpack_args_array
+    def append_to_uco_object(self, *args) -> None:
+        """
+        Write a single/tuple of object(s) into the Bundle's ``uco-core:object`` array.
+        """
+        self._write_members("uco-core:object", *args)
+
+    @unpack_args_array
+    def append_to_case_graph(self, *args) -> None:
+        """
+        Write a single/tuple of object(s) into the Bundle's ``@graph`` array.
+        """
+        self._write_members("@graph", *args)
+
+    def _write_members(self, key: str, *args: Any) -> None:
+        if not self._opened or self._closed:
+            raise ValueError("BundleWriter is not open.")
+        if len(args) == 1 and not args[0]:  # True if no objects to append provided
+            return
+        if self._current_key != key:
+            if key in self._written_keys:
+                raise ValueError(
+                    "The Bundle's '%s' array has already been written and closed." % key
+                )
+            self._start_member_array(key)
+        for item in args:
+            if isinstance(item, (UcoThing, CompactThing)):
+                self._write_member(item)
+            else:
+                diagnostics.report(
+                    diagnostics.NOT_A_CASE_OBJECT, type(self).__name__, key, item
+                )
+
+    def _start_member_array(self, key: str) -> None:
+        self._end_member_array()
+        self._write_key(key)
+        self.fp.write("[")
+        self._current_key = key
+        self._current_count = 0
+        self._written_keys.append(key)
+        for item in self.bundle.iter_members(key):
+            self._write_member(item)
+
+    def _end_member_array(self) -> None:
+        if self._current_key is None:
+            return
+        self.fp.write(self._newline(1) + "]" if self._current_count else "]")
+        self._current_key = None
+
+    def _write_member(self, item: Any) -> None:
+        separator = self._item_separator if self._current_count else ""
+        self.fp.write(separator + self._newline(2) + self._encode(item, 2))
+        self._current_count += 1
+
+    def _write_property(self, key: str, value: Any) -> None:
+        self._write_key(key)
+        self.fp.write(self._encode(value, 1))
+
+    def _write_key(self, key: str) -> None:
+        separator = self._item_separator if self._property_count else ""
+        self.fp.write(separator + self._newline(1) + json.dumps(key) + ": ")
+        self._property_count += 1
+
+    def _newline(self, level: int) -> str:
+        if self.indent is None:
+            return ""
+        return "\n" + " " * (self.indent * level)
+
+    def _encode(self, value: Any, level: int) -> str:
+        encoded = self.serializer(value, self.indent)
+        if self.indent is None:
+            return encoded
+        # JSON strings cannot hold raw newlines, so every newline is a line break to re-indent.
+        return encoded.replace("\n", self._newline(level))
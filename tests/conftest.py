@@ -0,0 +1,28 @@
+import contextlib
+import io
+import pathlib
+import runpy
+from typing import Any, Iterator
+
+import cdo_local_uuid
+import pytest
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+@pytest.fixture
+def example_bundle(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    """
+    Rebuild the Bundle of example.py with the same non-random UUIDs the Makefile uses to generate case.jsonld.
+    """
+    monkeypatch.setenv("CDO_DEMO_NONRANDOM_UUID_BASE", str(top_srcdir))
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+    monkeypatch.chdir(top_srcdir)
+    monkeypatch.setattr("sys.argv", ["example.py"])
+    monkeypatch.setattr(cdo_local_uuid, "DEMO_UUID_COUNTER", 0)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            example_globals = runpy.run_path("example.py")
+        yield example_globals["bundle"]
+    finally:
+        cdo_local_uuid.DEMO_UUID_BASE = None
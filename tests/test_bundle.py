@@ -0,0 +1,182 @@
+import pytest
+
+from case_mapping import diagnostics, integrity, parallel, uco
+from case_mapping.spill import SpillStore
+
+
+def test_object_index() -> None:
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    observable = uco.observable.ObservableObject()
+    graph_observable = uco.observable.ObservableObject()
+    bundle.append_to_uco_object(observable)
+    bundle.append_to_case_graph(graph_observable)
+
+    for thing in (identity, observable, graph_observable):
+        assert thing.get_id() in bundle
+        assert bundle.get(thing.get_id()) is thing
+    assert "kb:missing" not in bundle
+    assert bundle.get("kb:missing") is None
+
+    # Properties of the Bundle itself are unaffected.
+    assert "@context" in bundle
+    assert bundle.get("@type") == "uco-core:Bundle"
+    assert bundle.get("rdfs:comment") is None
+
+
+def test_duplicate_append() -> None:
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    observable = uco.observable.ObservableObject()
+    bundle.append_to_uco_object(observable, identity)
+    bundle.append_to_uco_object(observable)
+    bundle.append_to_case_graph(observable)
+    assert bundle["uco-core:object"] == [identity, observable]
+    assert "@graph" not in bundle
+
+
+def test_extend_uco_objects() -> None:
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    observables = [uco.observable.ObservableObject() for _ in range(3)]
+    with diagnostics.collecting() as collected:
+        bundle.extend_uco_objects(
+            item
+            for item in [observables[0], identity, "not an object", *observables[1:]]
+        )
+    assert bundle["uco-core:object"] == [identity, *observables]
+    assert bundle.get(observables[2].get_id()) is observables[2]
+    assert collected.total(diagnostics.ALREADY_IN_BUNDLE) == 1
+    assert collected.total(diagnostics.NOT_A_CASE_OBJECT) == 1
+
+
+def test_extend_uco_objects_spills() -> None:
+    identities = [uco.identity.Identity() for _ in range(10)]
+    bundle = uco.core.Bundle(core_objects=identities[:1])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=3)
+        bundle.extend_uco_objects(iter(identities[1:]))
+        assert len(bundle["uco-core:object"]) <= 3
+        assert [member["@id"] for member in bundle.iter_members("uco-core:object")] == [
+            identity.get_id() for identity in identities
+        ]
+
+
+def test_extend_facets_and_results() -> None:
+    observable = uco.observable.ObservableObject()
+    facets = [uco.observable.FileFacet(file_name=name) for name in ("a", "b")]
+    observable.append_facets(facets[0])
+    observable.extend_facets(iter(facets[1:]))
+    assert observable["uco-core:hasFacet"] == facets
+
+    action = uco.action.Action()
+    action.extend_results(observable for _ in range(2))
+    action.extend_results([])
+    assert action["uco-action:result"] == [{"@id": observable.get_id()}] * 2
+
+
+def test_subgraph() -> None:
+    performer = uco.identity.Identity()
+    tool = uco.tool.Tool()
+    device = uco.observable.ObservableObject()
+    extracted = uco.observable.ObservableObject()
+    relationship = uco.core.Relationship(
+        source=extracted,
+        target=device,
+        kind_of_relationship="Contained_Within",
+        directional=True,
+    )
+    action = uco.action.Action(
+        performer=performer, instrument=tool, objects=[device], results=[extracted]
+    )
+    unrelated = uco.action.Action(performer=performer)
+    bundle = uco.core.Bundle(
+        core_objects=[performer, tool, device, extracted, relationship, action]
+    )
+    bundle.append_to_case_graph(unrelated)
+
+    subgraph = bundle.subgraph([action.get_id()])
+    assert subgraph["uco-core:object"] == [action, performer, tool, extracted, device]
+    assert subgraph["@context"] == bundle["@context"]
+    assert subgraph.get_id() != bundle.get_id()
+    assert integrity.check_references(subgraph).ok
+
+    assert bundle.subgraph([action.get_id()], depth=0)["uco-core:object"] == [action]
+    assert bundle.subgraph([relationship.get_id(), unrelated.get_id()], depth=1)[
+        "uco-core:object"
+    ] == [relationship, unrelated, extracted, device, performer]
+
+    with pytest.raises(KeyError):
+        bundle.subgraph(["kb:missing"])
+
+
+def test_subgraph_of_spilled_bundle() -> None:
+    identity = uco.identity.Identity()
+    actions = [uco.action.Action(performer=identity) for _ in range(5)]
+    bundle = uco.core.Bundle(core_objects=[identity])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=2)
+        bundle.extend_uco_objects(actions)
+        subgraph = bundle.subgraph([actions[-1].get_id()])
+    assert [member.get_id() for member in subgraph["uco-core:object"]] == [
+        actions[-1].get_id(),
+        identity.get_id(),
+    ]
+    assert subgraph["uco-core:object"][1] == identity
+
+
+def test_subgraph_of_members_without_a_class() -> None:
+    """
+    Members whose type is not in the directory, such as uco-observable:File, are read back from a SpillStore as dictionaries, and kept in the subgraph.
+    """
+    extracted = uco.observable.File()
+    action = uco.action.Action(objects=[extracted])
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=1)
+        bundle.extend_uco_objects([action, extracted, uco.identity.Identity()])
+        with diagnostics.collecting() as collected:
+            subgraph = bundle.subgraph([action.get_id()])
+    assert collected.total() == 0
+    assert [member["@type"] for member in subgraph["uco-core:object"]] == [
+        "uco-action:Action",
+        "uco-observable:File",
+    ]
+    assert type(subgraph["uco-core:object"][1]) is dict
+    assert extracted.get_id() in subgraph
+    assert integrity.check_references(subgraph).ok
+
+
+def test_merge_context_conflict() -> None:
+    shard_1 = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    shard_2 = uco.core.Bundle(
+        core_objects=[uco.identity.Identity()], prefix_iri="http://example.org/other/"
+    )
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    context = dict(bundle["@context"])
+    with pytest.raises(ValueError):
+        parallel.merge_bundles(bundle, shard_1, shard_2)
+    # The conflict is found before the Bundle is changed.
+    assert bundle["@context"] == context
+    assert bundle["uco-core:object"] == [identity]
+
+
+def test_merge_spilled_shard() -> None:
+    identities = [uco.identity.Identity() for _ in range(5)]
+    bundle = uco.core.Bundle(core_objects=identities[:1])
+    shard = uco.core.Bundle(core_objects=identities[:1])
+    with SpillStore() as store:
+        shard.spill_to(store, max_objects=2)
+        shard.extend_uco_objects(identities[1:])
+        shard.append_to_case_graph(uco.observable.ObservableObject())
+        with diagnostics.collecting() as collected:
+            parallel.merge_bundles(bundle, shard)
+    assert collected.total() == 0
+    assert [member.get_id() for member in bundle["uco-core:object"]] == [
+        identity.get_id() for identity in identities
+    ]
+    assert all(
+        type(member) is uco.identity.Identity for member in bundle["uco-core:object"]
+    )
+    assert len(bundle["@graph"]) == 1
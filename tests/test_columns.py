@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+from case_mapping import uco
+
+
+def _without_id(thing: dict) -> dict:
+    return {key: value for key, value in thing.items() if key != "@id"}
+
+
+def test_file_facet_columns() -> None:
+    modified_time = datetime(2023, 1, 1, 1, 1, 1, tzinfo=timezone.utc)
+    columns: dict[str, Any] = {
+        "file_name": ["IMG_0123.jpg", "notes.txt", None],
+        "file_path": ["/sdcard/IMG_0123.jpg", "/sdcard/notes.txt", "/sdcard"],
+        "file_modified_time": [modified_time, None, datetime(2023, 1, 2)],
+        "file_size_bytes": [35002, 12, None],
+        "file_is_directory": [False, False, True],
+        "file_allocation_status": "intact",
+    }
+    facets = uco.observable.FileFacet.from_columns(**columns)
+    assert len(facets) == 3
+    assert len({facet.get_id() for facet in facets}) == 3
+    for index, facet in enumerate(facets):
+        expected = uco.observable.FileFacet(
+            **{
+                name: column[index] if isinstance(column, list) else column
+                for name, column in columns.items()
+            }
+        )
+        assert isinstance(facet, uco.observable.FileFacet)
+        assert list(_without_id(facet).items()) == list(_without_id(expected).items())
+
+
+def test_call_facet_columns() -> None:
+    phone_1 = uco.observable.ObservableObject()
+    phone_2 = uco.observable.ObservableObject()
+    facets = uco.observable.CallFacet.from_columns(
+        call_from=[phone_1, phone_2],
+        call_to=[[phone_2], [phone_1]],
+        call_duration=[60, 5],
+    )
+    assert facets[0]["uco-observable:from"] == {"@id": phone_1.get_id()}
+    assert facets[1]["uco-observable:to"] == [{"@id": phone_1.get_id()}]
+
+
+def test_column_errors() -> None:
+    with pytest.raises(TypeError):
+        uco.observable.FileFacet.from_columns(file_size_bytes=[1, "2"])
+    with pytest.raises(TypeError):
+        uco.observable.SMSMessageFacet.from_columns(msg_to=[["not a UcoThing"]])
+    with pytest.raises(TypeError):
+        uco.observable.FileFacet.from_columns(size_bytes=[1])
+    with pytest.raises(ValueError):
+        uco.observable.FileFacet.from_columns(file_name=["a"], file_path=["b", "c"])
+
+
+def test_prefix_columns() -> None:
+    facets = uco.observable.FileFacet.from_columns(
+        file_name=["a.jpg", "b.jpg"],
+        prefix_iri="http://example.org/ex/",
+        prefix_label="ex",
+    )
+    expected = uco.observable.FileFacet(
+        file_name="a.jpg", prefix_iri="http://example.org/ex/", prefix_label="ex"
+    )
+    assert facets[0].get_id().startswith("ex:")
+    assert facets[0].prefix_iri == expected.prefix_iri
+    assert _without_id(facets[0]) == _without_id(expected)
+
+
+def test_constructor_per_row() -> None:
+    """
+    Classes without declared columns are built by their constructor.
+    """
+    facets = uco.observable.UrlFacet.from_columns(
+        url_address=["https://example.org", None], prefix_label="ex"
+    )
+    assert [type(facet) for facet in facets] == [uco.observable.UrlFacet] * 2
+    assert facets[0]["uco-observable:fullValue"] == "https://example.org"
+    assert "uco-observable:fullValue" not in facets[1]
+    assert facets[1].get_id().startswith("ex:")
+
+
+def test_numpy_columns() -> None:
+    numpy = pytest.importorskip("numpy")
+    facets = uco.observable.FileFacet.from_columns(
+        file_name=numpy.array(["a.jpg", "b.jpg"]),
+        file_size_bytes=numpy.array([1, 2]),
+    )
+    assert facets[1]["uco-observable:fileName"] == "b.jpg"
+    assert facets[1]["uco-observable:sizeInBytes"]["@value"] == "2"
@@ -0,0 +1,29 @@
+import json
+import pathlib
+
+from case_mapping import uco
+from case_mapping.compact import CompactThing, compact
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_example_bundle_compacted(example_bundle: uco.core.Bundle) -> None:
+    """
+    Replacing every member of the example Bundle with its compact record does not change the printed Bundle.
+    """
+    members = example_bundle["uco-core:object"]
+    example_bundle["uco-core:object"] = [compact(member) for member in members]
+    assert all(
+        isinstance(member, CompactThing) for member in example_bundle["uco-core:object"]
+    )
+    with (top_srcdir / "case.jsonld").open() as expected_fh:
+        assert str(example_bundle) + "\n" == expected_fh.read()
+
+
+def test_append_compact_thing() -> None:
+    observable = compact(uco.observable.ObservableObject())
+    action = uco.action.Action()
+    action.append_results(observable)
+    assert action["uco-action:result"] == [{"@id": observable.get_id()}]
+    bundle = uco.core.Bundle(core_objects=[observable])
+    assert json.loads(str(bundle))["uco-core:object"] == [observable.expand()]
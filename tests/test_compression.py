@@ -0,0 +1,81 @@
+import gzip
+import io
+import json
+import pathlib
+
+import pytest
+
+from case_mapping import compression, loader, uco
+from case_mapping.offsets import IndexedBundleReader, write_offset_index
+from case_mapping.writer import BundleWriter
+
+zstd_available = compression.zstd is not None or compression.zstandard is not None
+
+
+@pytest.fixture
+def bundle() -> uco.core.Bundle:
+    return uco.core.Bundle(
+        core_objects=[uco.identity.Identity(), uco.observable.ObservableObject()]
+    )
+
+
+@pytest.mark.parametrize(
+    "suffix, magic",
+    [
+        (".gz", b"\x1f\x8b"),
+        (".xz", b"\xfd7zXZ\x00"),
+        pytest.param(
+            ".zst",
+            b"\x28\xb5\x2f\xfd",
+            marks=pytest.mark.skipif(not zstd_available, reason="zstd unavailable"),
+        ),
+    ],
+)
+def test_write_and_read(
+    tmp_path: pathlib.Path, bundle: uco.core.Bundle, suffix: str, magic: bytes
+) -> None:
+    path = tmp_path / ("case.jsonld" + suffix)
+    bundle.write(path)
+    assert path.read_bytes().startswith(magic)
+
+    with compression.open_bundle(path) as fp:
+        assert json.load(fp) == json.loads(str(bundle))
+    assert loader.load(path) == bundle
+    with path.open("rb") as fp:
+        assert loader.load(fp) == bundle
+    assert [member["@id"] for member in loader.iter_bundle_objects(path)] == [
+        member.get_id() for member in bundle["uco-core:object"]
+    ]
+
+
+def test_explicit_compression(tmp_path: pathlib.Path, bundle: uco.core.Bundle) -> None:
+    path = tmp_path / "case.jsonld"
+    bundle.write(path, compression="gzip", level=1)
+    assert gzip.decompress(path.read_bytes()).decode("utf-8") == _written(bundle)
+    assert loader.load(path) == bundle
+
+    bundle.write(path, compression=None)
+    assert path.read_text() == _written(bundle)
+
+    with pytest.raises(ValueError, match="Unknown compression"):
+        bundle.write(path, compression="bz2")
+
+
+def test_offsets_reject_compressed_files(
+    tmp_path: pathlib.Path, bundle: uco.core.Bundle
+) -> None:
+    path = tmp_path / "case.jsonld.gz"
+    bundle.write(path)
+    with pytest.raises(ValueError, match="compressed"):
+        write_offset_index(path)
+    with pytest.raises(ValueError, match="compressed"):
+        IndexedBundleReader(path)
+
+
+def _written(bundle: uco.core.Bundle) -> str:
+    """
+    The uncompressed text Bundle.write() writes, with the @context first.
+    """
+    fp = io.StringIO()
+    BundleWriter(fp, bundle).close()
+    return fp.getvalue()
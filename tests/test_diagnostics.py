@@ -0,0 +1,61 @@
+import pytest
+
+from case_mapping import diagnostics, uco
+
+
+def test_quiet_by_default(capsys: pytest.CaptureFixture[str]) -> None:
+    counted = diagnostics.get_diagnostics().total(diagnostics.NOT_A_CASE_OBJECT)
+    action = uco.action.Action()
+    action.append_results("bad")
+    assert capsys.readouterr() == ("", "")
+    assert (
+        diagnostics.get_diagnostics().total(diagnostics.NOT_A_CASE_OBJECT)
+        == counted + 1
+    )
+
+
+def test_echo(capsys: pytest.CaptureFixture[str]) -> None:
+    previous = diagnostics.get_diagnostics()
+    diagnostics.set_diagnostics(diagnostics.Diagnostics(echo=True))
+    try:
+        action = uco.action.Action()
+        action.append_results("bad")
+        bundle = uco.core.Bundle(core_objects=[action])
+        bundle.append_to_uco_object(action)
+    finally:
+        diagnostics.set_diagnostics(previous)
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "bad: NOT A CASE OBJECT\n%s: ALREADY IN BUNDLE\n" % (
+        action.get_id()
+    )
+
+
+def test_collecting(capsys: pytest.CaptureFixture[str]) -> None:
+    identity = uco.identity.Identity()
+    with diagnostics.collecting(max_samples=2) as collected:
+        bundle = uco.core.Bundle(core_objects=[identity])
+        bundle.append_to_uco_object(identity)
+        for index in range(5):
+            bundle.append_to_rdfs_comments(index)
+            with pytest.raises(TypeError):
+                uco.observable.FileFacet(file_size_bytes=str(index))
+        with pytest.raises(TypeError):
+            uco.observable.ObservableObject(tag=["a", 1])
+    assert capsys.readouterr() == ("", "")
+    assert diagnostics.get_diagnostics() is not collected
+
+    assert collected.counts == {
+        (diagnostics.ALREADY_IN_BUNDLE, "Bundle", "uco-core:object"): 1,
+        (diagnostics.NOT_A_STRING, "Bundle", "rdfs:comment"): 5,
+        (diagnostics.WRONG_TYPE, "FileFacet", "uco-observable:sizeInBytes"): 5,
+        (diagnostics.WRONG_TYPE, "ObservableObject", "uco-core:tag"): 1,
+    }
+    assert collected.samples[
+        (diagnostics.WRONG_TYPE, "FileFacet", "uco-observable:sizeInBytes")
+    ] == ["0", "1"]
+    assert collected.total(diagnostics.WRONG_TYPE) == 6
+    assert collected.total() == 12
+    assert collected.summary().splitlines()[0] == (
+        "5 NOT A STRING Bundle rdfs:comment: 0, 1"
+    )
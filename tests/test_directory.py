@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+from case_mapping import base
+from case_mapping.directory import directory
+
+
+def test_import_is_lazy() -> None:
+    """
+    Importing the package, or looking up one type in the directory, does not import the other ontology modules.
+    """
+    script = """
+import sys
+import case_mapping
+assert "case_mapping.uco" not in sys.modules, "uco imported"
+from case_mapping.directory import directory
+assert directory["uco-core:Bundle"].__name__ == "Bundle"
+assert "case_mapping.uco.observable" not in sys.modules, "observable imported"
+assert "case_mapping.case.investigation" not in sys.modules, "investigation imported"
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_directory() -> None:
+    from case_mapping import case, uco
+
+    expected: dict[str, type[base.Facet]] = dict()
+    for module in (
+        case.investigation,
+        uco.action,
+        uco.core,
+        uco.identity,
+        uco.location,
+        uco.observable,
+        uco.role,
+        uco.tool,
+        uco.types,
+    ):
+        expected |= module.directory
+    assert dict(directory) == expected
+    assert len(directory) == len(expected)
+    assert directory.get("uco-observable:FileFacet") is uco.observable.FileFacet
+    assert directory.get("drafting:SocialMediaActivityFacet") is None
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any, Union
 
-from case_mapping import mix_utils
+from case_mapping import base, mix_utils, uco
 
 
 def check_app_name(
@@ -143,3 +143,93 @@ def test_geo_coordinates() -> None:
             "uco-location:longitude": {"@type": "xsd:decimal", "@value": str(long_2)},
         },
     ]
+
+
+def test_dedup_registry_app_name() -> None:
+    registry = mix_utils.DedupRegistry()
+    uuid_1 = "kb:" + str(uuid.uuid4())
+    uuid_2 = "kb:" + str(uuid.uuid4())
+    object_1 = registry.check_value(
+        "Safari",
+        uuid_1,
+        value="Safari",
+        kind="application",
+        observable_generating_f=generateTraceAppName,
+    )
+    object_2 = registry.check_value(
+        "Safari",
+        uuid_2,
+        value="Safari",
+        kind="application",
+        observable_generating_f=generateTraceAppName,
+    )
+    assert object_1 is object_2
+    assert object_1["@id"] == uuid_1
+    assert registry.values("application") == ["Safari"]
+    assert registry.objects("application") == [object_1]
+    assert registry.values("coordinates") == []
+    assert registry.stats("application") == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_dedup_registry_lru() -> None:
+    registry = mix_utils.DedupRegistry(maxsize=2)
+    for latitude in (1.0, 2.0, 1.0, 3.0):
+        registry.check_value(
+            latitude,
+            0.0,
+            "kb:" + str(uuid.uuid4()),
+            value=(latitude, 0.0),
+            kind="coordinates",
+            observable_generating_f=generateTraceLocationCoordinate,
+        )
+    # (2.0, 0.0) was the least recently used value when (3.0, 0.0) arrived.
+    assert registry.values("coordinates") == [(1.0, 0.0), (3.0, 0.0)]
+    assert not registry.contains((2.0, 0.0), kind="coordinates")
+    assert registry.stats() == {"hits": 1, "misses": 3, "size": 2}
+
+
+def _application_object(
+    application_identifier: str, version: str
+) -> uco.observable.ObservableObject:
+    application_object = uco.observable.ObservableObject()
+    application_object.append_facets(
+        uco.observable.ApplicationFacet(
+            application_identifier=application_identifier, version=version
+        )
+    )
+    return application_object
+
+
+def test_content_id() -> None:
+    """
+    Objects built separately from the same data, e.g. by two workers, get the same content identifier.
+    """
+    object_1 = _application_object("Safari", "17.1")
+    object_2 = _application_object("Safari", "17.1")
+    object_3 = _application_object("Chrome", "17.1")
+    assert object_1.get_id() != object_2.get_id()
+    assert object_1.assign_content_id() == object_2.assign_content_id()
+    assert object_1.get_id() == object_2.get_id()
+    assert object_1.get_id().startswith("kb:")
+    assert object_1.content_id() != object_3.content_id()
+
+
+def test_identifying_properties() -> None:
+    facet_1 = uco.observable.ApplicationFacet(
+        application_identifier="Safari", version="17.1"
+    )
+    facet_2 = uco.observable.ApplicationFacet(
+        application_identifier="Safari", version="17.2"
+    )
+    assert facet_1.content_id() != facet_2.content_id()
+    assert facet_1.content_id(
+        "uco-observable:applicationIdentifier"
+    ) == facet_2.content_id("uco-observable:applicationIdentifier")
+    base.set_identifying_properties(
+        uco.observable.ApplicationFacet, "uco-observable:applicationIdentifier"
+    )
+    try:
+        assert facet_1.content_id() == facet_2.content_id()
+    finally:
+        base.set_identifying_properties(uco.observable.ApplicationFacet)
+    assert facet_1.content_id() != facet_2.content_id()
@@ -0,0 +1,112 @@
+import pathlib
+
+import pytest
+
+from case_mapping import integrity, uco
+from case_mapping.compact import compact
+from case_mapping.spill import SpillStore
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_example_bundle(example_bundle: uco.core.Bundle) -> None:
+    report = integrity.check_references(example_bundle)
+    assert report.ok
+    assert report.node_count > len(example_bundle["uco-core:object"])
+    # case.jsonld holds the same graph.
+    from_file = integrity.check_references(top_srcdir / "case.jsonld")
+    assert from_file.dangling == report.dangling
+    assert from_file.orphans == report.orphans
+
+
+def test_dangling_references() -> None:
+    device = uco.observable.ObservableObject()
+    tool = uco.tool.Tool()
+    action = uco.action.Action(objects=[device], instrument=tool)
+    action.append_results(uco.observable.ObservableObject())
+    bundle = uco.core.Bundle(core_objects=[action, device])
+
+    report = integrity.check_references(bundle)
+    assert not report.ok
+    assert sorted((key, target) for _, _, key, target in report.dangling) == sorted(
+        [
+            ("uco-action:instrument", tool.get_id()),
+            ("uco-action:result", action["uco-action:result"][0]["@id"]),
+        ]
+    )
+    assert {(source, source_type) for source, source_type, _, _ in report.dangling} == {
+        (action.get_id(), "uco-action:Action")
+    }
+    assert report.orphans == []
+    assert "DANGLING uco-action:Action" in report.summary()
+
+
+def test_nested_and_compact_nodes() -> None:
+    facet = uco.observable.FileFacet(file_name="a")
+    observable = uco.observable.ObservableObject(facets=[facet])
+    relationship = uco.core.Relationship(
+        source=observable,
+        target=uco.observable.ObservableObject(),
+        kind_of_relationship="Contained_Within",
+        directional=True,
+    )
+    marked = uco.observable.ObservableObject()
+    marked["uco-core:objectMarking"] = {"@id": facet.get_id()}
+    bundle = uco.core.Bundle(
+        core_objects=[compact(observable), compact(relationship), marked]
+    )
+    report = integrity.check_references(bundle)
+    # The reference to the Facet nested in the compacted observable resolves.
+    assert [target for _, _, _, target in report.dangling] == [
+        relationship["uco-core:target"]["@id"]
+    ]
+    assert report.dangling[0][:3] == (
+        relationship.get_id(),
+        "uco-core:Relationship",
+        "uco-core:target",
+    )
+    assert report.orphans == []
+
+
+def test_slot_references() -> None:
+    facet = uco.observable.FileFacet(file_name="a")
+    observable = uco.observable.ObservableObject()
+    observable.append_indexed_items(facet)
+    for member in (observable, compact(observable)):
+        report = integrity.check_references(uco.core.Bundle(core_objects=[member]))
+        assert report.dangling == [
+            (
+                observable.get_id(),
+                "uco-observable:ObservableObject",
+                "olo:item",
+                facet.get_id(),
+            )
+        ]
+
+
+def test_spilled_bundle() -> None:
+    identities = [uco.identity.Identity() for _ in range(5)]
+    action = uco.action.Action(performer=identities[0])
+    bundle = uco.core.Bundle(core_objects=[action])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=2)
+        bundle.append_to_uco_object(identities)
+        report = integrity.check_references(bundle)
+    assert report.ok
+    assert [node_id for node_id, _ in report.orphans] == [
+        identity.get_id() for identity in identities[1:]
+    ]
+
+
+def test_main(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "case.jsonld"
+    bundle = uco.core.Bundle(
+        core_objects=[uco.action.Action(performer=uco.identity.Identity())]
+    )
+    bundle.write(path)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("sys.argv", ["integrity", str(path)])
+        with pytest.raises(SystemExit) as exit_info:
+            integrity.main()
+    assert exit_info.value.code == 1
+    assert "1 dangling" in capsys.readouterr().out
@@ -0,0 +1,67 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from case_mapping import base, uco
+
+
+def test_repeated_values_share_literals() -> None:
+    time = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    first = uco.observable.FileFacet(
+        file_size_bytes=512, file_is_directory=False, file_created_time=time
+    )
+    second = uco.observable.FileFacet(
+        file_size_bytes=512,
+        file_is_directory=False,
+        file_created_time=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    )
+    for key in (
+        "uco-observable:sizeInBytes",
+        "uco-observable:isDirectory",
+        "uco-observable:observableCreatedTime",
+    ):
+        assert first[key] is second[key]
+    assert first["uco-observable:isDirectory"] == {
+        "@type": "xsd:boolean",
+        "@value": False,
+    }
+
+
+def test_shared_literals_are_read_only() -> None:
+    facet = uco.observable.FileFacet(file_size_bytes=512)
+    literal = facet["uco-observable:sizeInBytes"]
+    with pytest.raises(TypeError):
+        literal["@value"] = "0"
+    with pytest.raises(TypeError):
+        literal.update({"@value": "0"})
+    assert literal == {"@type": "xsd:integer", "@value": "512"}
+    # Replacing the literal is still possible.
+    facet["uco-observable:sizeInBytes"] = {"@type": "xsd:integer", "@value": "0"}
+    assert pickle.loads(pickle.dumps(literal)) == literal
+
+
+def test_equal_instants_keep_their_offsets() -> None:
+    utc = datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)
+    paris = utc.astimezone(timezone(timedelta(hours=1)))
+    assert utc == paris
+    assert base._datetime_literal(utc)["@value"] == "2024-01-02T12:00:00+00:00"
+    assert base._datetime_literal(paris)["@value"] == "2024-01-02T13:00:00+01:00"
+    naive = datetime(2024, 1, 2, 12, 0)
+    assert base._datetime_literal(naive)["@value"] == "2024-01-02T12:00:00+00:00"
+
+
+def test_integer_literals_are_not_confused_with_booleans() -> None:
+    assert base._int_literal("xsd:integer", 1)["@value"] == "1"
+    assert base._int_literal("xsd:integer", True)["@value"] == "True"
+    assert base._int_literal("xsd:integer", 1)["@value"] == "1"
+
+
+def test_large_integers_are_not_interned() -> None:
+    first = base._int_literal("xsd:integer", 10**6)
+    assert first == {"@type": "xsd:integer", "@value": "1000000"}
+    assert first is not base._int_literal("xsd:integer", 10**6)
+    assert base._int_literal("xsd:nonNegativeInteger", 7) == {
+        "@type": "xsd:nonNegativeInteger",
+        "@value": "7",
+    }
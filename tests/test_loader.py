@@ -0,0 +1,132 @@
+import json
+import pathlib
+import tracemalloc
+
+import pytest
+
+from case_mapping import case, drafting, uco
+from case_mapping.diagnostics import ALREADY_IN_BUNDLE, collecting
+from case_mapping.directory import directory
+from case_mapping.loader import iter_bundle_objects, load, loads
+from case_mapping.writer import BundleWriter
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_load_example() -> None:
+    """
+    case.jsonld loads back into instances of the classes example.py used, which serialize to the same document.
+    """
+    with (top_srcdir / "case.jsonld").open() as fp:
+        bundle = load(fp)
+    with (top_srcdir / "case.jsonld").open() as fp:
+        expected = json.load(fp)
+    assert isinstance(bundle, uco.core.Bundle)
+    assert json.loads(bundle.dumps()) == expected
+    assert bundle.prefix_label == "kb"
+    assert bundle.prefix_iri == expected["@context"]["kb"]
+
+    types = {type(item) for item in bundle["uco-core:object"]}
+    assert uco.observable.ObservableObject in types
+    assert case.investigation.InvestigativeAction in types
+    file_object = next(
+        item
+        for item in bundle["uco-core:object"]
+        if isinstance(item, uco.observable.ObservableObject)
+        and any(
+            isinstance(facet, uco.observable.FileFacet)
+            for facet in item.get("uco-core:hasFacet", [])
+        )
+    )
+    assert bundle.get(file_object.get_id()) is file_object
+
+
+def test_amend_loaded_bundle() -> None:
+    identity = uco.identity.Identity()
+    bundle = loads(uco.core.Bundle(core_objects=[identity]).dumps())
+    observable = uco.observable.ObservableObject()
+    bundle.append_to_uco_object(observable)
+    bundle.append_to_uco_object(loads(identity.dumps()))  # Already in the Bundle.
+    assert [item.get_id() for item in bundle["uco-core:object"]] == [
+        identity.get_id(),
+        observable.get_id(),
+    ]
+
+
+def test_loaded_bundle_indexes_every_member() -> None:
+    bundle = load(top_srcdir / "case.jsonld")
+    members = bundle["uco-core:object"]
+    # Such as the uco-observable:File objects, whose class is not in the directory.
+    unknown = [member for member in members if type(member) is dict]
+    assert unknown
+    for member in members:
+        assert member["@id"] in bundle
+        assert bundle.get(member["@id"]) is member
+    count = len(members)
+    duplicate = uco.observable.ObservableObject()
+    duplicate["@id"] = unknown[0]["@id"]
+    with collecting() as diagnostics:
+        bundle.append_to_uco_object(duplicate)
+    assert diagnostics.total(ALREADY_IN_BUNDLE) == 1
+    assert len(bundle["uco-core:object"]) == count
+
+
+def test_unknown_types_stay_dictionaries() -> None:
+    facet = drafting.entities.SocialMediaActivityFacet(body="Hello")
+    assert type(loads(facet.dumps())) is dict
+    drafting_directory = dict(directory) | drafting.entities.directory
+    assert type(loads(facet.dumps(), directory=drafting_directory)) is type(facet)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_bundle_objects(chunk_size: int) -> None:
+    with (top_srcdir / "case.jsonld").open() as fp:
+        expected = json.load(fp)["uco-core:object"]
+    members = list(
+        iter_bundle_objects(top_srcdir / "case.jsonld", chunk_size=chunk_size)
+    )
+    assert members == expected
+
+
+def test_iter_bundle_objects_types() -> None:
+    path = top_srcdir / "case.jsonld"
+    investigative_actions = list(
+        iter_bundle_objects(path, types=["case-investigation:InvestigativeAction"])
+    )
+    assert investigative_actions
+    assert all(
+        member["@type"] == "case-investigation:InvestigativeAction"
+        for member in investigative_actions
+    )
+    identities = list(
+        iter_bundle_objects(
+            path, types=[uco.identity.IdentityAbstraction], rehydrate=True
+        )
+    )
+    assert {type(member) for member in identities} == {
+        uco.identity.Identity,
+        uco.identity.Organization,
+    }
+
+
+def test_iter_bundle_objects_memory(tmp_path: pathlib.Path) -> None:
+    """
+    Iterating over a Bundle holds far less than the file in memory.
+    """
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    path = tmp_path / "bundle.jsonld"
+    with path.open("w") as fp, BundleWriter(fp, bundle) as writer:
+        for index in range(5000):
+            writer.append_to_uco_object(
+                uco.observable.File(
+                    facets=[uco.observable.FileFacet(file_name="%d.txt" % index)]
+                )
+            )
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_bundle_objects(path, chunk_size=1 << 12))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 5001
+    assert peak < path.stat().st_size / 20
@@ -0,0 +1,86 @@
+import io
+import pathlib
+
+import pytest
+import rdflib
+from rdflib.compare import isomorphic
+
+from case_mapping import uco
+from case_mapping.ntriples import NTriplesWriter
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize("quads", [False, True])
+def test_example_bundle(example_bundle: uco.core.Bundle, quads: bool) -> None:
+    """
+    The statements written for the example Bundle are the graph rdflib reads from case.jsonld.
+    """
+    members = example_bundle.pop("uco-core:object")
+    fp = io.StringIO()
+    with NTriplesWriter(fp, example_bundle, quads=quads) as writer:
+        for member in members:
+            writer.append_to_uco_object(member)
+
+    dataset = rdflib.Dataset()
+    dataset.parse(data=fp.getvalue(), format="nquads" if quads else "nt")
+    written = rdflib.Graph()
+    for subject, predicate, obj, _ in dataset.quads():
+        written.add((subject, predicate, obj))
+    expected = rdflib.Graph()
+    expected.parse(top_srcdir / "case.jsonld", format="json-ld")
+    assert isomorphic(written, expected)
+
+
+def test_case_graph_quads() -> None:
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    observable = uco.observable.ObservableObject()
+    fp = io.StringIO()
+    with NTriplesWriter(fp, bundle, quads=True) as writer:
+        writer.append_to_case_graph(observable)
+    graph_statements = [
+        line for line in fp.getvalue().splitlines() if "uco/observable/" in line
+    ]
+    assert graph_statements == [
+        "<http://example.org/kb/%s> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <https://ontology.unifiedcyberontology.org/uco/observable/ObservableObject> <http://example.org/kb/%s> ."
+        % (observable.get_id()[3:], bundle.get_id()[3:])
+    ]
+
+
+def test_literals() -> None:
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    facet = uco.observable.FileFacet(
+        file_name='quote " and\nnewline', file_size_bytes=1, file_is_directory=True
+    )
+    fp = io.StringIO()
+    with NTriplesWriter(fp, bundle) as writer:
+        writer.append_to_uco_object(facet)
+    written = fp.getvalue()
+    assert '"quote \\" and\\nnewline" .' in written
+    assert '"1"^^<http://www.w3.org/2001/XMLSchema#integer>' in written
+    assert '"true"^^<http://www.w3.org/2001/XMLSchema#boolean>' in written
+
+
+def test_iris() -> None:
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    observable = uco.observable.ObservableObject()
+    observable["@id"] = "kb:a file>name"
+    relative = uco.observable.ObservableObject()
+    relative["@id"] = "relative"
+    fp = io.StringIO()
+    with NTriplesWriter(fp, bundle) as writer:
+        writer.append_to_uco_object(observable)
+        with pytest.raises(ValueError):
+            writer.append_to_uco_object(relative)
+    assert "<http://example.org/kb/a%20file%3Ename>" in fp.getvalue()
+
+    bundle["@context"]["@base"] = "http://example.org/base/"
+    fp = io.StringIO()
+    with NTriplesWriter(fp, bundle) as writer:
+        writer.append_to_uco_object(observable, relative)
+    assert "<http://example.org/base/relative>" in fp.getvalue()
+    graph = rdflib.Graph()
+    graph.parse(data=fp.getvalue(), format="nt")
+    assert rdflib.URIRef("http://example.org/kb/a%20file%3Ename") in set(
+        graph.subjects()
+    )
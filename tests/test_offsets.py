@@ -0,0 +1,49 @@
+import json
+import os
+import pathlib
+import shutil
+
+from case_mapping import uco
+from case_mapping.offsets import IndexedBundleReader, write_offset_index
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_example_offsets(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "case.jsonld"
+    shutil.copy(top_srcdir / "case.jsonld", path)
+    with path.open() as fp:
+        members = json.load(fp)["uco-core:object"]
+    with IndexedBundleReader(path) as reader:
+        assert len(reader) == len(members)
+        for member in members:
+            assert reader[member["@id"]] == member
+        assert "kb:no-such-object" not in reader
+    assert os.path.exists(str(path) + ".offsets.json")
+
+
+def test_non_ascii_and_stale_index(tmp_path: pathlib.Path) -> None:
+    """
+    Offsets are byte offsets, so they hold for members after non-ASCII text, and an index is rebuilt once the Bundle file changes.
+    """
+    facet = uco.observable.FileFacet(file_name="café ☃.txt")
+    file_1 = uco.observable.File(facets=[facet])
+    file_2 = uco.observable.File()
+    bundle = uco.core.Bundle(core_objects=[file_1, file_2])
+    path = tmp_path / "bundle.jsonld"
+    path.write_text(bundle.dumps(serializer="json"), encoding="utf-8")
+    index_path = tmp_path / "bundle.index"
+    write_offset_index(path, index_path)
+    with IndexedBundleReader(path, index_path) as reader:
+        assert reader[file_2.get_id()] == file_2
+
+    file_3 = uco.observable.File()
+    bundle.append_to_uco_object(file_3)
+    path.write_text(json.dumps(bundle, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    with IndexedBundleReader(path, index_path, rehydrate=True) as reader:
+        assert reader[file_3.get_id()] == file_3
+        assert isinstance(
+            reader[file_1.get_id()]["uco-core:hasFacet"][0], uco.observable.FileFacet
+        )
+        assert reader[file_1.get_id()] == file_1
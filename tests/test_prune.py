@@ -0,0 +1,120 @@
+import pytest
+
+from case_mapping import integrity, uco
+from case_mapping.compact import compact
+from case_mapping.prune import prune
+from case_mapping.spill import SpillStore
+
+
+def test_example_bundle(example_bundle: uco.core.Bundle) -> None:
+    members = list(example_bundle["uco-core:object"])
+    report = prune(example_bundle, dry_run=True)
+    assert example_bundle["uco-core:object"] == members
+    assert prune(example_bundle).pruned == report.pruned
+    assert example_bundle["uco-core:object"] == [
+        member for member in members if member.get_id() not in report.pruned
+    ]
+    # Pruning leaves no reference dangling, nor removes the case's compilations.
+    assert integrity.check_references(example_bundle).ok
+    kept_types = {member["@type"] for member in example_bundle["uco-core:object"]}
+    assert "case-investigation:Investigation" in kept_types
+    assert "case-investigation:ProvenanceRecord" in kept_types
+
+
+def test_prune_from_roots() -> None:
+    performer = uco.identity.Identity()
+    facet = uco.observable.FileFacet(file_name="a")
+    device = uco.observable.ObservableObject(facets=[facet])
+    action = uco.action.Action(performer=performer, objects=[device])
+    contained = uco.observable.ObservableObject()
+    relationship = uco.core.Relationship(
+        source=contained,
+        target=uco.observable.ObservableObject(),
+        kind_of_relationship="Contained_Within",
+        directional=True,
+    )
+    unused = uco.observable.ObservableObject()
+    unused_tool = uco.tool.Tool()
+    bundle = uco.core.Bundle(
+        core_objects=[
+            unused,
+            compact(action),
+            performer,
+            device,
+            relationship,
+            contained,
+            unused_tool,
+        ]
+    )
+
+    size = len(bundle.dumps().encode())
+    report = prune(bundle)
+    assert report.pruned == [unused.get_id(), unused_tool.get_id()]
+    assert report.nodes == 2
+    assert report.size == size - len(bundle.dumps().encode())
+    assert [member.get_id() for member in bundle["uco-core:object"]] == [
+        action.get_id(),
+        performer.get_id(),
+        device.get_id(),
+        relationship.get_id(),
+        contained.get_id(),
+    ]
+    assert unused.get_id() not in bundle
+    assert performer.get_id() in bundle
+    assert "2 objects, 2 nodes" in report.summary()
+
+
+def test_references_to_nested_nodes_reach_their_object() -> None:
+    facet = uco.observable.FileFacet(file_name="a")
+    observable = uco.observable.ObservableObject(facets=[facet])
+    action = uco.action.Action()
+    action["uco-action:object"] = [{"@id": facet.get_id()}]
+    bundle = uco.core.Bundle(core_objects=[action, observable])
+    report = prune(bundle)
+    assert report.pruned == []
+    assert bundle["uco-core:object"] == [action, observable]
+
+    bundle = uco.core.Bundle(core_objects=[uco.action.Action(), observable])
+    report = prune(bundle)
+    # The observable and its Facet.
+    assert report.pruned == [observable.get_id()]
+    assert report.nodes == 2
+
+
+def test_compilations_of_kept_objects_are_kept() -> None:
+    device = uco.observable.ObservableObject()
+    action = uco.action.Action(objects=[device])
+    unused = uco.observable.ObservableObject()
+    # Compilations holding objects themselves, as Investigations do, or references to them.
+    kept = uco.core.Compilation()
+    kept.append_to_uco_object(device)
+    nested = uco.core.Compilation()
+    nested["uco-core:object"] = [{"@id": kept.get_id()}]
+    pruned = uco.core.Compilation()
+    pruned.append_to_uco_object(unused)
+    bundle = uco.core.Bundle(
+        core_objects=[nested, kept, pruned, action, device, unused]
+    )
+    report = prune(bundle)
+    assert report.pruned == [pruned.get_id(), unused.get_id()]
+
+
+def test_root_types_and_ids() -> None:
+    identity = uco.identity.Identity()
+    tool = uco.tool.Tool()
+    bundle = uco.core.Bundle(core_objects=[identity, tool])
+    report = prune(bundle, root_types=["uco-tool:Tool"], dry_run=True)
+    assert report.pruned == [identity.get_id()]
+    assert bundle["uco-core:object"] == [identity, tool]
+
+    report = prune(bundle, root_types=(), root_ids=[identity.get_id()])
+    assert report.pruned == [tool.get_id()]
+    assert bundle["uco-core:object"] == [identity]
+
+
+def test_spilled_bundle() -> None:
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=0)
+        with pytest.raises(ValueError):
+            prune(bundle)
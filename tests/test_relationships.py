@@ -0,0 +1,112 @@
+from case_mapping import uco
+from case_mapping.compact import compact
+from case_mapping.prune import prune
+from case_mapping.relationships import RelationshipIndex
+from case_mapping.spill import SpillStore
+
+
+def _contained_within(
+    source: uco.observable.ObservableObject, target: uco.observable.ObservableObject
+) -> uco.observable.ObservableRelationship:
+    return uco.observable.ObservableRelationship(
+        source=source,
+        target=target,
+        kind_of_relationship="Contained_Within",
+        directional=True,
+    )
+
+
+def test_example_bundle(example_bundle: uco.core.Bundle) -> None:
+    index = example_bundle.relationship_index()
+    relationships = [
+        member
+        for member in example_bundle["uco-core:object"]
+        if member["@type"] == "uco-observable:ObservableRelationship"
+    ]
+    assert relationships
+    assert len(index) == len(relationships)
+    for relationship in relationships:
+        source = relationship["uco-core:source"]["@id"]
+        target = relationship["uco-core:target"]["@id"]
+        kind = relationship["uco-core:kindOfRelationship"]
+        assert target in index.targets(source, kind)
+        assert source in index.sources(target)
+        assert (source, kind, target, relationship.get_id()) in index.outgoing(source)
+
+
+def test_index_follows_appends() -> None:
+    archive = uco.observable.ObservableObject()
+    files = [uco.observable.ObservableObject() for _ in range(3)]
+    bundle = uco.core.Bundle(
+        core_objects=[archive, files[0], _contained_within(files[0], archive)]
+    )
+    index = bundle.relationship_index()
+    assert bundle.relationship_index() is index
+    assert index.sources(archive.get_id()) == [files[0].get_id()]
+
+    bundle.append_to_uco_object(files[1], compact(_contained_within(files[1], archive)))
+    bundle.extend_uco_objects([files[2], _contained_within(files[2], archive)])
+    located = uco.core.Relationship(
+        source=archive,
+        target=uco.location.Location(),
+        kind_of_relationship="Located_At",
+    )
+    bundle.append_to_uco_object(located)
+
+    assert index.sources(archive.get_id(), "Contained_Within") == [
+        file.get_id() for file in files
+    ]
+    assert index.targets(archive.get_id()) == [located["uco-core:target"]["@id"]]
+    assert index.targets(archive.get_id(), "Contained_Within") == []
+    assert index.incoming(files[0].get_id()) == []
+    assert index.sources("kb:missing") == []
+    assert len(index) == 4
+
+
+def test_several_sources_and_remove() -> None:
+    target = uco.observable.ObservableObject()
+    sources = [uco.observable.ObservableObject() for _ in range(2)]
+    relationship = _contained_within(sources[0], target)
+    relationship["uco-core:source"] = [{"@id": source.get_id()} for source in sources]
+    other = _contained_within(sources[0], target)
+    index = RelationshipIndex([relationship, other, target])
+    assert len(index) == 3
+    assert index.sources(target.get_id()) == [
+        sources[0].get_id(),
+        sources[1].get_id(),
+        sources[0].get_id(),
+    ]
+
+    index.remove(relationship)
+    assert len(index) == 1
+    assert index.outgoing(sources[0].get_id()) == [
+        (sources[0].get_id(), "Contained_Within", target.get_id(), other.get_id())
+    ]
+    assert index.targets(sources[1].get_id()) == []
+    assert sources[1].get_id() not in index.forward
+
+
+def test_spilled_and_pruned_bundles() -> None:
+    device = uco.observable.ObservableObject()
+    images = [uco.observable.ObservableObject() for _ in range(4)]
+    bundle = uco.core.Bundle(core_objects=[device])
+    with SpillStore() as store:
+        bundle.spill_to(store, max_objects=2)
+        bundle.extend_uco_objects(images)
+        bundle.extend_uco_objects(
+            _contained_within(image, device) for image in images[:2]
+        )
+        index = bundle.relationship_index()
+        assert index.sources(device.get_id()) == [
+            image.get_id() for image in images[:2]
+        ]
+
+    bundle = uco.core.Bundle(core_objects=[device, *images])
+    relationship = uco.core.Relationship(
+        source=images[0], target=device, kind_of_relationship="Contained_Within"
+    )
+    bundle.append_to_uco_object(relationship)
+    index = bundle.relationship_index()
+    prune(bundle, root_types=(), root_ids=[device.get_id()])
+    assert len(index) == 0
+    assert index.forward == {} and index.reverse == {}
@@ -0,0 +1,48 @@
+import io
+import json
+import pathlib
+
+import pytest
+
+from case_mapping import base, uco
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+@pytest.mark.parametrize("serializer", list(base.serializers))
+@pytest.mark.parametrize("indent", [4, None])
+def test_example_bundle(
+    example_bundle: uco.core.Bundle, serializer: str, indent: int
+) -> None:
+    """
+    Every registered serializer produces the same graph as case.jsonld, indented or not.
+    """
+    serialized = example_bundle.dumps(indent=indent, serializer=serializer)
+    if indent is None:
+        assert "\n" not in serialized
+    with (top_srcdir / "case.jsonld").open() as expected_fh:
+        assert json.loads(serialized) == json.load(expected_fh)
+
+
+def test_default_serializer(example_bundle: uco.core.Bundle) -> None:
+    fp = io.StringIO()
+    example_bundle.dump(fp)
+    with (top_srcdir / "case.jsonld").open() as expected_fh:
+        assert fp.getvalue() == expected_fh.read()
+
+
+def test_set_serializer() -> None:
+    thing = uco.observable.ObservableObject()
+    try:
+        base.register_serializer(
+            "sorted", lambda value, indent: json.dumps(value, sort_keys=True)
+        )
+        base.set_serializer("sorted")
+        assert str(thing) == json.dumps(thing, sort_keys=True)
+        base.set_serializer("fastest")
+        assert json.loads(str(thing)) == thing
+        with pytest.raises(ValueError):
+            base.set_serializer("missing")
+    finally:
+        base.set_serializer("json")
+        del base.serializers["sorted"]
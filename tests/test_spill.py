@@ -0,0 +1,67 @@
+import io
+import json
+import pathlib
+
+from case_mapping import uco
+from case_mapping.ntriples import NTriplesWriter
+from case_mapping.spill import SpillStore
+from case_mapping.writer import BundleWriter
+
+
+def _objects() -> list[uco.observable.ObservableObject]:
+    objects = list()
+    for index in range(10):
+        observable = uco.observable.ObservableObject()
+        observable.append_facets(
+            uco.observable.FileFacet(file_name="%d.txt" % index, file_size_bytes=index)
+        )
+        objects.append(observable)
+    return objects
+
+
+def test_spilled_bundle(tmp_path: pathlib.Path) -> None:
+    objects = _objects()
+    identity = uco.identity.Identity()
+    expected = uco.core.Bundle(core_objects=[identity])
+    expected.append_to_uco_object(objects)
+    graph_objects = _objects()[:6]
+    expected.append_to_case_graph(graph_objects)
+
+    with SpillStore(tmp_path / "spill.sqlite", batch_size=3) as store:
+        bundle = uco.core.Bundle(core_objects=[identity])
+        bundle["@id"] = expected["@id"]
+        bundle.spill_to(store, max_objects=4)
+        for observable in objects:
+            bundle.append_to_uco_object(observable)
+        bundle.append_to_uco_object(objects[2])  # Spilled, so not appended again.
+        for observable in graph_objects:
+            bundle.append_to_case_graph(observable)
+        assert len(bundle["uco-core:object"]) < len(objects)
+        assert len(bundle["@graph"]) < len(graph_objects)
+        assert store.count("@graph") > 0
+        assert [member["@id"] for member in json.loads(bundle.dumps())["@graph"]] == [
+            observable.get_id() for observable in graph_objects
+        ]
+
+        assert json.loads(bundle.dumps()) == json.loads(expected.dumps())
+        fp = io.StringIO()
+        bundle.dump(fp, indent=None)
+        assert json.loads(fp.getvalue()) == json.loads(expected.dumps())
+
+        spilled = bundle.get(objects[1].get_id())
+        assert isinstance(spilled, uco.observable.ObservableObject)
+        assert spilled == objects[1]
+        assert objects[1].get_id() in bundle
+
+        fp = io.StringIO()
+        with BundleWriter(fp, bundle) as writer:
+            writer.append_to_uco_object(uco.observable.ObservableObject())
+        assert len(json.loads(fp.getvalue())["uco-core:object"]) == 12
+
+        fp = io.StringIO()
+        NTriplesWriter(fp, bundle).open()
+        expected_fp = io.StringIO()
+        NTriplesWriter(expected_fp, expected).open()
+        assert sorted(fp.getvalue().splitlines()) == sorted(
+            expected_fp.getvalue().splitlines()
+        )
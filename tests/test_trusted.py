@@ -0,0 +1,65 @@
+import pathlib
+from typing import Iterator
+
+import pytest
+
+from case_mapping import base, case, uco
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+@pytest.fixture
+def trusted() -> Iterator[None]:
+    with base.trusted_mode():
+        yield
+
+
+def test_trusted_example_bundle(trusted: None, example_bundle: uco.core.Bundle) -> None:
+    """
+    example.py builds the same Bundle in trusted mode.
+    """
+    assert base._trusted
+    with (top_srcdir / "case.jsonld").open() as expected_fh:
+        assert str(example_bundle) + "\n" == expected_fh.read()
+
+
+def test_trusted_mode_skips_checks() -> None:
+    with pytest.raises(TypeError):
+        uco.observable.FileFacet(file_size_bytes="35002")
+    with base.trusted_mode():
+        facet = uco.observable.FileFacet(file_size_bytes="35002")
+        with base.trusted_mode(False):
+            with pytest.raises(TypeError):
+                uco.observable.FileFacet(file_size_bytes="35002")
+        assert base._trusted
+    assert not base._trusted
+    assert facet["uco-observable:sizeInBytes"]["@value"] == "35002"
+
+
+def test_trusted_columns(trusted: None) -> None:
+    phone = uco.observable.ObservableObject()
+    facets = uco.observable.CallFacet.from_columns(
+        call_type=["incoming", None], call_duration=[12, None], call_to=[[phone], None]
+    )
+    assert facets[0]["uco-observable:duration"]["@value"] == "12"
+    assert facets[0]["uco-observable:to"] == [{"@id": phone.get_id()}]
+    assert "uco-observable:to" not in facets[1]
+
+
+def test_trusted_none_items(trusted: None) -> None:
+    """
+    None items of lists are skipped, and a list of only None leaves the property unset, as when checked.
+    """
+    tool = uco.tool.Tool()
+    action = case.investigation.InvestigativeAction(objects=[None])
+    assert "uco-action:object" not in action
+    action = case.investigation.InvestigativeAction(objects=[None, tool])
+    assert action["uco-action:object"] == [{"@id": tool.get_id()}]
+    observable = uco.observable.ObservableObject()
+    observable._str_list_vars(**{"uco-core:tag": [None]})
+    assert "uco-core:tag" not in observable
+    observable._str_list_vars(**{"uco-core:tag": ["a", None]})
+    assert observable["uco-core:tag"] == ["a"]
+    facets = uco.observable.CallFacet.from_columns(call_to=[[None], [None, tool]])
+    assert "uco-observable:to" not in facets[0]
+    assert facets[1]["uco-observable:to"] == [{"@id": tool.get_id()}]
@@ -0,0 +1,124 @@
+import pathlib
+from datetime import datetime, timezone
+
+import pytest
+
+from case_mapping import uco, validation
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_example_bundle(example_bundle: uco.core.Bundle) -> None:
+    assert validation.validate(example_bundle).total() == 0
+    assert validation.validate(top_srcdir / "case.jsonld").total() == 0
+
+
+def test_constructed_literals_are_valid() -> None:
+    facet = uco.observable.FileFacet(
+        file_name="IMG_0123.jpg",
+        file_size_bytes=35002,
+        file_is_directory=False,
+        file_created_time=datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+        file_modified_time=datetime(2024, 1, 2, 3, 4, 5),
+    )
+    coordinates = uco.location.LatLongCoordinatesFacet(
+        latitude=48.2, longitude=-2.1, altitude=0
+    )
+    observable = uco.observable.ObservableObject(facets=[facet])
+    location = uco.location.Location(facets=[coordinates])
+    bundle = uco.core.Bundle(core_objects=[observable, location])
+    assert validation.validate(bundle).total() == 0
+
+
+@pytest.mark.parametrize(
+    "value, valid",
+    [
+        ("2020-01-01T00:00:00.5Z", True),
+        ("2024-01-02T03:04:05.0006789+05:30", True),
+        ("2020-01-01T00:00:00", True),
+        ("2020-01-01T24:00:00Z", True),
+        ("2020-01-01", False),
+        ("2020-01-01 00:00:00Z", False),
+        ("2020-13-01T00:00:00Z", False),
+        ("2020-01-01T00:00:00+15:00", False),
+    ],
+)
+def test_datetime_lexical_space(value: str, valid: bool) -> None:
+    observable = uco.observable.ObservableObject()
+    observable["uco-core:modifiedTime"] = {"@type": "xsd:dateTime", "@value": value}
+    bundle = uco.core.Bundle(core_objects=[observable])
+    assert validation.validate(bundle).total(validation.WRONG_DATATYPE) == (
+        0 if valid else 1
+    )
+
+
+def test_problems() -> None:
+    identity = uco.identity.Identity()
+    action = uco.action.Action(performer=identity)
+    action["uco-action:object"] = "kb:not-a-reference"
+    action["uco-action:startTime"] = {"@type": "xsd:dateTime", "@value": "yesterday"}
+    untyped = uco.observable.ObservableObject()
+    del untyped["@type"]
+    untyped["uco-core:hasFacet"] = [
+        {
+            "@type": "uco-observable:FileFacet",
+            "uco-observable:sizeInBytes": {"@type": "xsd:integer", "@value": "1.5"},
+            "uco-observable:isDirectory": {"@type": "xsd:boolean", "@value": "no"},
+        }
+    ]
+    member_facet = uco.observable.FileFacet(file_name="a")
+    attached_facet = uco.observable.FileFacet(file_name="b")
+    owner = uco.observable.ObservableObject()
+    owner["uco-core:hasFacet"] = [{"@id": attached_facet.get_id()}]
+    nested_facet = uco.observable.FileFacet(file_name="c")
+    owner["uco-observable:url"] = nested_facet
+    bundle = uco.core.Bundle(
+        core_objects=[identity, action, untyped, member_facet, attached_facet, owner]
+    )
+
+    diagnostics = validation.validate(bundle)
+    assert diagnostics.counts == {
+        (
+            validation.NOT_A_REFERENCE,
+            "uco-action:Action",
+            "uco-action:object",
+        ): 1,
+        (validation.WRONG_DATATYPE, "uco-action:Action", "uco-action:startTime"): 1,
+        (validation.MISSING_TYPE, "", "uco-core:object"): 1,
+        (
+            validation.WRONG_DATATYPE,
+            "uco-observable:FileFacet",
+            "uco-observable:sizeInBytes",
+        ): 1,
+        (
+            validation.WRONG_DATATYPE,
+            "uco-observable:FileFacet",
+            "uco-observable:isDirectory",
+        ): 1,
+        (
+            validation.DETACHED_FACET,
+            "uco-observable:FileFacet",
+            "uco-core:object",
+        ): 1,
+        (
+            validation.DETACHED_FACET,
+            "uco-observable:FileFacet",
+            "uco-observable:url",
+        ): 1,
+    }
+    assert diagnostics.samples[
+        (validation.DETACHED_FACET, "uco-observable:FileFacet", "uco-core:object")
+    ] == [member_facet.get_id()]
+
+
+def test_main(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    observable = uco.observable.ObservableObject()
+    observable["uco-core:createdBy"] = "somebody"
+    path = tmp_path / "case.jsonld.gz"
+    uco.core.Bundle(core_objects=[observable]).write(path)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("sys.argv", ["validation", str(path)])
+        with pytest.raises(SystemExit) as exit_info:
+            validation.main()
+    assert exit_info.value.code == 1
+    assert "1 NOT A REFERENCE" in capsys.readouterr().out
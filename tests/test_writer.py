@@ -0,0 +1,62 @@
+import io
+import json
+import pathlib
+
+import pytest
+
+from case_mapping import uco
+from case_mapping.writer import BundleWriter
+
+top_srcdir = pathlib.Path(__file__).parent.parent
+
+
+def test_example_bundle_round_trip(example_bundle: uco.core.Bundle) -> None:
+    """
+    Streaming the example objects one at a time produces the same graph as case.jsonld.
+    """
+    members = example_bundle.pop("uco-core:object")
+    fp = io.StringIO()
+    with BundleWriter(fp, example_bundle) as writer:
+        for member in members:
+            writer.append_to_uco_object(member)
+    with (top_srcdir / "case.jsonld").open() as expected_fh:
+        assert json.loads(fp.getvalue()) == json.load(expected_fh)
+
+
+def test_matches_str_formatting() -> None:
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    fp = io.StringIO()
+    with BundleWriter(fp, bundle):
+        pass
+    reordered = {"@context": bundle["@context"]}
+    reordered.update((k, v) for k, v in bundle.items() if k != "@context")
+    assert fp.getvalue() == json.dumps(reordered, indent=4) + "\n"
+
+
+def test_sections() -> None:
+    identity = uco.identity.Identity()
+    bundle = uco.core.Bundle(core_objects=[identity])
+    object_1 = uco.observable.ObservableObject()
+    object_2 = uco.observable.ObservableObject()
+    fp = io.StringIO()
+    with BundleWriter(fp, bundle, indent=None) as writer:
+        writer.append_to_case_graph(object_1)
+        writer.append_to_uco_object(object_2)
+        with pytest.raises(ValueError):
+            writer.append_to_case_graph(object_1)
+    written = json.loads(fp.getvalue())
+    assert written["@graph"] == [object_1]
+    assert written["uco-core:object"] == [identity, object_2]
+    assert "\n" not in fp.getvalue().rstrip("\n")
+    assert bundle["uco-core:object"] == [identity]
+
+
+def test_interrupted_write_is_not_closed() -> None:
+    bundle = uco.core.Bundle(core_objects=[uco.identity.Identity()])
+    fp = io.StringIO()
+    with pytest.raises(RuntimeError):
+        with BundleWriter(fp, bundle):
+            raise RuntimeError()
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(fp.getvalue())